@@ -0,0 +1,46 @@
+"""Add emerging_skill_counts and emerging_skill_users tables
+
+Revision ID: a7d2e5c9f4b1
+Revises: f1c6d9a3e8b7
+Create Date: 2026-10-18 19:26:41.203857
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d2e5c9f4b1'
+down_revision: Union[str, None] = 'f1c6d9a3e8b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'emerging_skill_counts',
+        sa.Column('token_key', sa.String(length=100), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('token', sa.String(length=100), nullable=False),
+        sa.Column('mentions', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('token_key', 'day'),
+    )
+    op.create_index('idx_emerging_skill_counts_day', 'emerging_skill_counts', ['day'], unique=False)
+    op.create_table(
+        'emerging_skill_users',
+        sa.Column('token_key', sa.String(length=100), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('token_key', 'day', 'user_id'),
+    )
+    op.create_index('idx_emerging_skill_users_day', 'emerging_skill_users', ['day'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_emerging_skill_users_day', table_name='emerging_skill_users')
+    op.drop_table('emerging_skill_users')
+    op.drop_index('idx_emerging_skill_counts_day', table_name='emerging_skill_counts')
+    op.drop_table('emerging_skill_counts')
@@ -0,0 +1,39 @@
+"""Add parsed_resume_cache table
+
+Revision ID: b7d41c2e9a10
+Revises: 465a82af37c9
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41c2e9a10'
+down_revision: Union[str, None] = '465a82af37c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'parsed_resume_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('cache_key', sa.String(length=128), nullable=False),
+        sa.Column('analysis_json', sa.Text(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_hit_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_parsed_resume_cache_id'), 'parsed_resume_cache', ['id'], unique=False)
+    op.create_index(op.f('ix_parsed_resume_cache_cache_key'), 'parsed_resume_cache', ['cache_key'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_parsed_resume_cache_cache_key'), table_name='parsed_resume_cache')
+    op.drop_index(op.f('ix_parsed_resume_cache_id'), table_name='parsed_resume_cache')
+    op.drop_table('parsed_resume_cache')
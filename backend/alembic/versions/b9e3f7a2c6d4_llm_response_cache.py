@@ -0,0 +1,42 @@
+"""Add llm_response_cache table
+
+Revision ID: b9e3f7a2c6d4
+Revises: a7d2e5c9f4b1
+Create Date: 2026-10-18 23:04:17.552310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e3f7a2c6d4'
+down_revision: Union[str, None] = 'a7d2e5c9f4b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'llm_response_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('response_text', sa.Text(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_hit_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_llm_response_cache_id'), 'llm_response_cache', ['id'], unique=False)
+    op.create_index(op.f('ix_llm_response_cache_cache_key'), 'llm_response_cache', ['cache_key'], unique=True)
+    op.create_index(op.f('ix_llm_response_cache_expires_at'), 'llm_response_cache', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_llm_response_cache_expires_at'), table_name='llm_response_cache')
+    op.drop_index(op.f('ix_llm_response_cache_cache_key'), table_name='llm_response_cache')
+    op.drop_index(op.f('ix_llm_response_cache_id'), table_name='llm_response_cache')
+    op.drop_table('llm_response_cache')
@@ -0,0 +1,48 @@
+"""Add resume_jobs table
+
+Revision ID: c3f5a8e1d2b4
+Revises: b7d41c2e9a10
+Create Date: 2026-10-18 11:40:03.512877
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f5a8e1d2b4'
+down_revision: Union[str, None] = 'b7d41c2e9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'resume_jobs',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('stage', sa.String(length=40), nullable=True),
+        sa.Column('progress', sa.Integer(), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=True),
+        sa.Column('file_data', sa.LargeBinary(length=16 * 1024 * 1024), nullable=True),
+        sa.Column('result_json', sa.Text(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('locked_by', sa.String(length=100), nullable=True),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_resume_jobs_user_id'), 'resume_jobs', ['user_id'], unique=False)
+    op.create_index('idx_resume_jobs_status_created', 'resume_jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_resume_jobs_status_created', table_name='resume_jobs')
+    op.drop_index(op.f('ix_resume_jobs_user_id'), table_name='resume_jobs')
+    op.drop_table('resume_jobs')
@@ -0,0 +1,59 @@
+"""Add question_pools and question_pool_pairs tables
+
+Revision ID: c4a8d2f6b3e9
+Revises: b9e3f7a2c6d4
+Create Date: 2026-10-19 08:41:55.307126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8d2f6b3e9'
+down_revision: Union[str, None] = 'b9e3f7a2c6d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'question_pools',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('role', sa.String(length=60), nullable=False),
+        sa.Column('skill', sa.String(length=100), nullable=False),
+        sa.Column('skill_key', sa.String(length=100), nullable=False),
+        sa.Column('band', sa.String(length=10), nullable=False),
+        sa.Column('requests', sa.Integer(), nullable=False),
+        sa.Column('build_failures', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_requested_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_built_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('role', 'skill_key', 'band', name='uq_question_pools_key'),
+    )
+    op.create_index(op.f('ix_question_pools_id'), 'question_pools', ['id'], unique=False)
+    op.create_table(
+        'question_pool_pairs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('pool_id', sa.Integer(), nullable=False),
+        sa.Column('main', sa.Text(), nullable=False),
+        sa.Column('follow_up', sa.Text(), nullable=False),
+        sa.Column('served_count', sa.Integer(), nullable=False),
+        sa.Column('retired', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['pool_id'], ['question_pools.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_question_pool_pairs_id'), 'question_pool_pairs', ['id'], unique=False)
+    op.create_index('idx_question_pool_pairs_live', 'question_pool_pairs', ['pool_id', 'retired', 'served_count'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_question_pool_pairs_live', table_name='question_pool_pairs')
+    op.drop_index(op.f('ix_question_pool_pairs_id'), table_name='question_pool_pairs')
+    op.drop_table('question_pool_pairs')
+    op.drop_index(op.f('ix_question_pools_id'), table_name='question_pools')
+    op.drop_table('question_pools')
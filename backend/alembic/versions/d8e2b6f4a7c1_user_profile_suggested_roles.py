@@ -0,0 +1,26 @@
+"""Add user_profiles.suggested_roles_json
+
+Revision ID: d8e2b6f4a7c1
+Revises: c3f5a8e1d2b4
+Create Date: 2026-10-18 14:05:27.904113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e2b6f4a7c1'
+down_revision: Union[str, None] = 'c3f5a8e1d2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_profiles', sa.Column('suggested_roles_json', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('user_profiles', 'suggested_roles_json')
@@ -0,0 +1,45 @@
+"""Add question_bank table
+
+Revision ID: e4a9c7d3b5f2
+Revises: d8e2b6f4a7c1
+Create Date: 2026-10-18 15:22:48.330571
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9c7d3b5f2'
+down_revision: Union[str, None] = 'd8e2b6f4a7c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'question_bank',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('skill', sa.String(length=100), nullable=False),
+        sa.Column('skill_key', sa.String(length=100), nullable=False),
+        sa.Column('difficulty', sa.String(length=10), nullable=False),
+        sa.Column('type', sa.String(length=10), nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('parent_id', sa.Integer(), nullable=True),
+        sa.Column('active', sa.Boolean(), nullable=False),
+        sa.Column('source', sa.String(length=40), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['parent_id'], ['question_bank.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_question_bank_id'), 'question_bank', ['id'], unique=False)
+    op.create_index('idx_question_bank_lookup', 'question_bank', ['skill_key', 'difficulty', 'type'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_question_bank_lookup', table_name='question_bank')
+    op.drop_index(op.f('ix_question_bank_id'), table_name='question_bank')
+    op.drop_table('question_bank')
@@ -0,0 +1,49 @@
+"""Add parsed_resumes table
+
+Revision ID: f1c6d9a3e8b7
+Revises: e4a9c7d3b5f2
+Create Date: 2026-10-18 17:04:12.518904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6d9a3e8b7'
+down_revision: Union[str, None] = 'e4a9c7d3b5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'parsed_resumes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('pdf_sha256', sa.String(length=64), nullable=False),
+        sa.Column('text_z', sa.LargeBinary(length=16 * 1024 * 1024), nullable=False),
+        sa.Column('text_length', sa.Integer(), nullable=False),
+        sa.Column('analysis_version', sa.String(length=64), nullable=False),
+        sa.Column('analysis_json', sa.Text(), nullable=False),
+        sa.Column('is_current', sa.Boolean(), nullable=False),
+        sa.Column('uploaded_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('analysed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'pdf_sha256', name='uq_parsed_resumes_user_pdf'),
+    )
+    op.create_index(op.f('ix_parsed_resumes_id'), 'parsed_resumes', ['id'], unique=False)
+    op.create_index(op.f('ix_parsed_resumes_user_id'), 'parsed_resumes', ['user_id'], unique=False)
+    op.create_index(op.f('ix_parsed_resumes_pdf_sha256'), 'parsed_resumes', ['pdf_sha256'], unique=False)
+    op.create_index('idx_parsed_resumes_current_version', 'parsed_resumes', ['is_current', 'analysis_version'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_parsed_resumes_current_version', table_name='parsed_resumes')
+    op.drop_index(op.f('ix_parsed_resumes_pdf_sha256'), table_name='parsed_resumes')
+    op.drop_index(op.f('ix_parsed_resumes_user_id'), table_name='parsed_resumes')
+    op.drop_index(op.f('ix_parsed_resumes_id'), table_name='parsed_resumes')
+    op.drop_table('parsed_resumes')
@@ -18,6 +18,78 @@ class Settings:
         self.resend_api_key = os.getenv("RESEND_API_KEY", "")
         self.email_from = os.getenv("EMAIL_FROM", "onboarding@resend.dev")
 
+        # Largest request body accepted (MAX_CONTENT_LENGTH); upload endpoints
+        # set their own limits instead (see core/uploads.py)
+        self.max_request_bytes = int(os.getenv("MAX_REQUEST_BYTES", str(6 * 1024 * 1024)))
+        # Profile photos: phone-camera JPEGs are commonly 3-8 MB
+        self.profile_photo_max_bytes = int(os.getenv("PROFILE_PHOTO_MAX_BYTES", str(10 * 1024 * 1024)))
+
+        # Resume parsing
+        self.resume_cache_size = int(os.getenv("RESUME_CACHE_SIZE", "256"))
+
+        # Wall-clock budget per resume analysis; 0 disables (see services/parse_budget.py)
+        self.parse_budget_seconds = float(os.getenv("PARSE_BUDGET_SECONDS", "2.0"))
+
+        # Job-description skill vectors kept per worker (see services/job_match_service.py)
+        self.job_match_cache_size = int(os.getenv("JOB_MATCH_CACHE_SIZE", "1024"))
+
+        # PDF extraction engine + worker pool (see services/pdf_engines.py, pdf_extractor.py)
+        self.pdf_engine = os.getenv("PDF_ENGINE", "auto")
+        self.pdf_pool_size = int(os.getenv("PDF_POOL_SIZE", "2"))
+        self.pdf_job_timeout_seconds = float(os.getenv("PDF_JOB_TIMEOUT_SECONDS", "15"))
+        self.pdf_max_pages = int(os.getenv("PDF_MAX_PAGES", "30"))
+        self.pdf_max_chars = int(os.getenv("PDF_MAX_CHARS", "200000"))
+        self.pdf_pages_per_job = int(os.getenv("PDF_PAGES_PER_JOB", "4"))
+        self.pdf_worker_max_rss_mb = int(os.getenv("PDF_WORKER_MAX_RSS_MB", "512"))
+
+        # Async resume jobs (see services/resume_job_service.py, resume_worker.py)
+        self.resume_job_poll_seconds = float(os.getenv("RESUME_JOB_POLL_SECONDS", "1.0"))
+        self.resume_job_lease_seconds = int(os.getenv("RESUME_JOB_LEASE_SECONDS", "600"))
+        self.resume_job_max_attempts = int(os.getenv("RESUME_JOB_MAX_ATTEMPTS", "3"))
+
+        # Question bank index refresh (see services/question_bank_service.py)
+        self.question_bank_refresh_seconds = float(os.getenv("QUESTION_BANK_REFRESH_SECONDS", "60"))
+
+        # Emerging-skills index writes (see services/emerging_skills_service.py)
+        self.emerging_skills_batch_uploads = int(os.getenv("EMERGING_SKILLS_BATCH_UPLOADS", "25"))
+        self.emerging_skills_flush_seconds = float(os.getenv("EMERGING_SKILLS_FLUSH_SECONDS", "60"))
+
+        # Score a whole interview in one Gemini call instead of one call per answer
+        # (see services/llm_service.py evaluate_interview)
+        self.llm_batch_evaluation = os.getenv("LLM_BATCH_EVALUATION", "True").lower() == "true"
+
+        # Concurrent Gemini calls per worker, and one request's deadline for all of
+        # its calls (see services/llm_fanout.py)
+        self.llm_max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+        self.llm_request_deadline_seconds = float(os.getenv("LLM_REQUEST_DEADLINE_SECONDS", "20"))
+
+        # Gemini response cache; a TTL of 0 disables it (see services/llm_cache.py)
+        self.llm_cache_size = int(os.getenv("LLM_CACHE_SIZE", "512"))
+        self.llm_cache_ttl_seconds = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+        # Per-call Gemini timeout, and the circuit breaker that stops calling it
+        # after consecutive failures or slow calls (see services/circuit_breaker.py)
+        self.llm_call_timeout_seconds = float(os.getenv("LLM_CALL_TIMEOUT_SECONDS", "15"))
+        self.llm_slow_call_seconds = float(os.getenv("LLM_SLOW_CALL_SECONDS", "10"))
+        self.llm_breaker_failures = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+        self.llm_breaker_cooldown_seconds = float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30"))
+
+        # Pre-generated question pools; a depth of 0 disables them
+        # (see services/question_pool_service.py, question_pool_worker.py)
+        self.question_pool_depth = int(os.getenv("QUESTION_POOL_DEPTH", "6"))
+        self.question_pool_max_serves = int(os.getenv("QUESTION_POOL_MAX_SERVES", "5"))
+        self.question_pool_poll_seconds = float(os.getenv("QUESTION_POOL_POLL_SECONDS", "30"))
+
+        # Comma-separated emails allowed to use admin / authoring endpoints
+        self.admin_emails = os.getenv("ADMIN_EMAILS", "")
+
+        # Per-request stage timing: Server-Timing header + [Timing] log (see core/timing.py)
+        self.stage_timing = os.getenv("STAGE_TIMING", "True").lower() == "true"
+
+    @property
+    def admin_email_set(self) -> set[str]:
+        return {e.strip().lower() for e in self.admin_emails.split(",") if e.strip()}
+
     @property
     def origins_list(self) -> list[str]:
         return [o.strip() for o in self.allowed_origins.split(",") if o.strip()]
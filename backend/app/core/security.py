@@ -58,3 +58,10 @@ def get_current_user() -> User | None:
         abort(401, description="User no longer exists")
 
     return user
+
+def require_admin() -> User:
+    """Like get_current_user, but aborts with 403 unless the user is listed in ADMIN_EMAILS."""
+    user = get_current_user()
+    if user.email.lower() not in settings.admin_email_set:
+        abort(403, description="Admin access required")
+    return user
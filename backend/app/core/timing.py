@@ -0,0 +1,95 @@
+"""
+Per-request stage timing.
+
+Wrap a pipeline stage in ``with stage("extract"):`` and its wall time is
+recorded on the current request. After the request, the stages are returned
+in a ``Server-Timing`` header (visible in browser dev tools) and logged as a
+single ``[Timing]`` record whose ``stage_timings`` attribute carries the
+numbers as structured fields.
+
+With STAGE_TIMING=false, or outside a request (workers, scripts), ``stage``
+returns a shared no-op context manager, so instrumented code costs one
+function call per stage.
+"""
+import time
+
+from flask import g, has_request_context, request
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("_timings", "_name", "_start")
+
+    def __init__(self, timings: dict, name: str):
+        self._timings = timings
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        # Stages entered more than once per request accumulate.
+        self._timings[self._name] = self._timings.get(self._name, 0.0) + time.perf_counter() - self._start
+        return False
+
+
+def stage(name: str):
+    """Context manager timing *name* on the current request (no-op when disabled)."""
+    if not has_request_context():
+        return _NULL_STAGE
+    timings = g.get("stage_timings")
+    if timings is None:
+        return _NULL_STAGE
+    return _Stage(timings, name)
+
+
+def _server_timing(timings: dict, total: float) -> str:
+    parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings.items()]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def register_timing(app):
+    """Enables per-request stage timing on *app* unless STAGE_TIMING is off."""
+    if not settings.stage_timing:
+        return
+
+    @app.before_request
+    def _start_timing():
+        g.stage_timings = {}
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _emit_timing(response):
+        timings = g.pop("stage_timings", None)
+        if not timings:
+            return response
+        total = time.perf_counter() - g.pop("request_started")
+        response.headers["Server-Timing"] = _server_timing(timings, total)
+        fields = {name: round(seconds * 1000, 2) for name, seconds in timings.items()}
+        fields["total"] = round(total * 1000, 2)
+        logger.info(
+            f"[Timing] {request.method} {request.path} {response.status_code} "
+            + " ".join(f"{name}={ms}ms" for name, ms in fields.items()),
+            extra={"stage_timings": fields, "path": request.path, "status": response.status_code},
+        )
+        return response
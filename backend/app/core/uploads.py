@@ -0,0 +1,265 @@
+"""
+Streamed, size-capped file uploads.
+
+Werkzeug parses multipart bodies chunk by chunk into whatever stream the
+request hands it. UploadRequest hands it an UploadSpool, which
+
+* keeps the first SPOOL_MEMORY_BYTES in memory and rolls over to a named
+  temporary file after that,
+* checks the file's magic bytes as soon as the first chunk arrives (a
+  signature is a prefix, or a tuple of ``(offset, bytes)`` parts that must
+  all match — WebP is ``((0, b"RIFF"), (8, b"WEBP"))``), and
+* raises 413 the moment the file grows past the endpoint's limit, so the
+  rest of the body is never read.
+
+Limits come from the ``@upload_limits`` decorator on the view; endpoints
+without one keep Werkzeug's default stream. The same decorator lowers the
+request's MAX_CONTENT_LENGTH, so a body whose Content-Length is already too
+big is refused before anything is read.
+
+``mapped(file)`` gives parsers a read-only memory map of the spooled file
+instead of another in-memory copy. The map's ``path`` lets worker processes
+map the same file themselves.
+"""
+import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+from flask import Request, current_app
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge
+
+# Bytes kept in memory before an upload is moved to a temporary file.
+SPOOL_MEMORY_BYTES = 512 * 1024
+
+# Allowance for multipart boundaries and part headers on top of the file limit.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+# A magic-bytes signature: a prefix, or (offset, bytes) parts that must all match.
+Signature = Union[bytes, tuple[tuple[int, bytes], ...]]
+
+
+class UploadPolicy:
+    def __init__(self, max_bytes: int, magic: tuple[Signature, ...], too_large: str, wrong_type: str):
+        self.max_bytes = max_bytes
+        self.magic = tuple(((0, m),) if isinstance(m, bytes) else m for m in magic)
+        self.magic_length = max((o + len(part) for m in self.magic for o, part in m), default=0)
+        self.too_large = too_large
+        self.wrong_type = wrong_type
+
+    def matches(self, head: bytes) -> bool:
+        return any(all(head[o:o + len(part)] == part for o, part in m) for m in self.magic)
+
+
+def upload_limits(max_bytes: int, magic: tuple[Signature, ...] = (), too_large: str = "File is too large.",
+                  wrong_type: str = "Unsupported file type."):
+    """
+    Caps every file uploaded to the decorated view at *max_bytes* and, when
+    *magic* is given, requires it to match one of those signatures.
+    """
+    policy = UploadPolicy(max_bytes, magic, too_large, wrong_type)
+
+    def decorate(view):
+        view.upload_policy = policy
+        return view
+    return decorate
+
+
+class UploadSpool(io.RawIOBase):
+    """Write-once, then read, file object that enforces an UploadPolicy while being written."""
+
+    def __init__(self, policy: UploadPolicy):
+        super().__init__()
+        self._policy = policy
+        self._file = io.BytesIO()
+        self._head = b""
+        self.size = 0
+        self.path: Optional[str] = None
+
+    # -- writing (Werkzeug's multipart parser) --------------------------------
+
+    def _check_magic(self, chunk: bytes, final: bool = False) -> None:
+        longest = self._policy.magic_length
+        self._head += chunk[:longest - len(self._head)]
+        if len(self._head) < longest and not final:
+            return
+        if not self._policy.matches(self._head):
+            raise BadRequest(description=self._policy.wrong_type)
+        self._head = None
+
+    def write(self, chunk) -> int:
+        if self._head is not None and self._policy.magic:
+            self._check_magic(bytes(chunk[:self._policy.magic_length]))
+        self.size += len(chunk)
+        if self.size > self._policy.max_bytes:
+            raise RequestEntityTooLarge(description=self._policy.too_large)
+        if self.path is None and self.size > SPOOL_MEMORY_BYTES:
+            self.rollover()
+        return self._file.write(chunk)
+
+    def rollover(self) -> None:
+        """Moves the spooled bytes to a named temporary file (kept until close)."""
+        if self.path is not None:
+            return
+        fd, path = tempfile.mkstemp(prefix="upload-")
+        disk = os.fdopen(fd, "w+b")
+        disk.write(self._file.getbuffer())
+        disk.seek(self._file.tell())
+        self._file, self.path = disk, path
+
+    # -- reading ----------------------------------------------------------------
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self._head and self._policy.magic:
+            # The parser seeks back once the part is complete: a file shorter than the magic.
+            self._check_magic(b"", final=True)
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._file.read(size)
+
+    def readinto(self, buffer) -> int:
+        return self._file.readinto(buffer)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        return self._file.readline(size)
+
+    def fileno(self) -> int:
+        if self.path is None:
+            raise io.UnsupportedOperation("spooled in memory")
+        return self._file.fileno()
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        self._file.close()
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+class MappedFile(mmap.mmap):
+    """A read-only map of an uploaded file; ``path`` names the file it maps."""
+    path: Optional[str] = None
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Read-only file object over a buffer (such as a MappedFile), with its own
+    position, so several parsers can share one map. Closing it releases the
+    buffer.
+    """
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._view = memoryview(buffer)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = max(0, min(len(b), len(self._view) - self._pos))
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+@contextmanager
+def mapped(file: FileStorage) -> Iterator[MappedFile]:
+    """
+    Maps an uploaded file read-only for parsing. Spools still in memory are
+    moved to disk first; uploads that did not go through an UploadSpool are
+    copied to one.
+    """
+    spool = file.stream
+    if not isinstance(spool, UploadSpool):
+        spool = UploadSpool(UploadPolicy(float("inf"), (), "", ""))   # no limits: already read by Werkzeug
+        file.stream.seek(0)
+        for chunk in iter(lambda: file.stream.read(1024 * 1024), b""):
+            spool.write(chunk)
+    spool.rollover()
+    spool.flush()
+    if spool.size == 0:
+        raise BadRequest(description="The uploaded file is empty.")
+    view = MappedFile(spool.fileno(), 0, access=mmap.ACCESS_READ)
+    view.path = spool.path
+    try:
+        yield view
+    finally:
+        try:
+            view.close()
+        except BufferError:
+            # A parser still holds a pointer into the map; it is released with that object.
+            pass
+        if spool is not file.stream:
+            spool.close()
+
+
+class UploadRequest(Request):
+    """Flask request class that streams uploads into UploadSpools (see upload_limits)."""
+
+    def _upload_policy(self) -> Optional[UploadPolicy]:
+        view = current_app.view_functions.get(self.endpoint) if self.endpoint else None
+        return getattr(view, "upload_policy", None)
+
+    @property
+    def max_content_length(self) -> Optional[int]:
+        policy = self._upload_policy()
+        if policy is not None:
+            return policy.max_bytes + MULTIPART_OVERHEAD_BYTES
+        return super().max_content_length
+
+    def _load_form_data(self) -> None:
+        try:
+            super()._load_form_data()
+        except RequestEntityTooLarge as e:
+            policy = self._upload_policy()
+            if policy is None:
+                raise
+            # Werkzeug's own Content-Length check carries a generic message.
+            raise RequestEntityTooLarge(description=policy.too_large) from e
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        policy = self._upload_policy()
+        if policy is None:
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+        return UploadSpool(policy)
@@ -6,6 +6,8 @@ from flask_limiter.util import get_remote_address
 from app.core.config import get_settings
 from app.database import db
 from app.core.errors import register_error_handlers
+from app.core.timing import register_timing
+from app.core.uploads import UploadRequest
 
 # Import blueprints
 from app.routers.health import bp as health_bp
@@ -15,14 +17,21 @@ from app.routers.auth import bp as auth_bp
 from app.routers.analytics import bp as analytics_bp
 from app.routers.roles import bp as roles_bp
 from app.routers.user_profile import bp as profile_bp
+from app.routers.question_bank import bp as question_bank_bp
+from app.routers.emerging_skills import bp as emerging_skills_bp
+from app.routers.job_match import bp as job_match_bp
 
 settings = get_settings()
 
 def create_app():
     app = Flask(__name__)
-    
+
+    # Uploads stream into size-capped spools (see core/uploads.py)
+    app.request_class = UploadRequest
+
     # Configure app
     app.config['SECRET_KEY'] = settings.secret_key
+    app.config['MAX_CONTENT_LENGTH'] = settings.max_request_bytes
     app.config['SQLALCHEMY_DATABASE_URI'] = settings.database_url
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
@@ -41,6 +50,9 @@ def create_app():
     # Exception Handling - Catch all unexpected errors and HTTP errors to JSON format
     register_error_handlers(app)
 
+    # Per-stage timings → Server-Timing header + one [Timing] log record per request
+    register_timing(app)
+
     # Initialize extensions
     db.init_app(app)
 
@@ -56,6 +68,9 @@ def create_app():
     app.register_blueprint(analytics_bp, url_prefix="/analytics")
     app.register_blueprint(roles_bp, url_prefix="/roles")
     app.register_blueprint(profile_bp, url_prefix="/profile")
+    app.register_blueprint(question_bank_bp, url_prefix="/question-bank")
+    app.register_blueprint(emerging_skills_bp, url_prefix="/emerging-skills")
+    app.register_blueprint(job_match_bp, url_prefix="/job-match")
 
     # Serve uploaded profile photos statically
     import os
@@ -3,5 +3,13 @@
 
 from app.models.interview import Interview, QuestionAnswer, Skill  # noqa: F401
 from app.models.user import User  # noqa: F401
+from app.models.resume_cache import ParsedResumeCache  # noqa: F401
+from app.models.resume_job import ResumeJob  # noqa: F401
+from app.models.question_bank import QuestionBankEntry  # noqa: F401
+from app.models.parsed_resume import ParsedResume  # noqa: F401
+from app.models.emerging_skill import EmergingSkillCount, EmergingSkillUser  # noqa: F401
+from app.models.llm_cache import LlmResponseCache  # noqa: F401
+from app.models.question_pool import QuestionPool, QuestionPoolPair  # noqa: F401
 
-__all_models__ = [User, Interview, QuestionAnswer, Skill]
+__all_models__ = [User, Interview, QuestionAnswer, Skill, ParsedResumeCache, ResumeJob, QuestionBankEntry, ParsedResume,
+                  EmergingSkillCount, EmergingSkillUser, LlmResponseCache, QuestionPool, QuestionPoolPair]
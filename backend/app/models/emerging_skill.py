@@ -0,0 +1,41 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import db
+
+
+class EmergingSkillCount(db.Model):
+    """
+    Per-day frequency of one candidate skill that is missing from the
+    taxonomy (resume_service.detect_unknown_skills), maintained
+    incrementally by services/emerging_skills_service.py.
+    ``token_key`` is the normalised (lower-cased) token; ``token`` keeps the
+    latest spelling seen, for display. ``mentions`` counts uploads.
+    """
+    __tablename__ = "emerging_skill_counts"
+    __table_args__ = (
+        Index("idx_emerging_skill_counts_day", "day"),
+    )
+
+    token_key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    token: Mapped[str] = mapped_column(String(100), nullable=False)
+    mentions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class EmergingSkillUser(db.Model):
+    """
+    One row per (token, user, day) on which the user uploaded a resume
+    mentioning the token: distinct-user counts for any window are a
+    COUNT(DISTINCT user_id) over these rows.
+    """
+    __tablename__ = "emerging_skill_users"
+    __table_args__ = (
+        Index("idx_emerging_skill_users_day", "day"),
+    )
+
+    token_key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import db
+
+
+class LlmResponseCache(db.Model):
+    """
+    Persistent tier of the Gemini response cache (see services/llm_cache.py).
+    One row per sha256(prompt version, model, system instruction, prompt);
+    rows past expires_at are ignored and purged now and then.
+    """
+    __tablename__ = "llm_response_cache"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    cache_key: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
+    response_text: Mapped[str] = mapped_column(Text, nullable=False)
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True, nullable=False)
+    last_hit_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
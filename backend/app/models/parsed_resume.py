@@ -0,0 +1,45 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import db
+
+
+class ParsedResume(db.Model):
+    """
+    One uploaded resume per (user, PDF content hash), kept so analyses can be
+    redone without the PDF (see services/parsed_resume_service.py).
+    ``pdf_sha256`` is the hash of the uploaded file — a PDF or a DOCX — or
+    of the UTF-8 text sent to POST /resume/text.
+    ``text_z`` is the extracted text, zlib-compressed; ``analysis_json`` is
+    the _analyse_text result — including per-section line spans, text hashes
+    and hits — produced with ``analysis_version``. ``is_current`` marks the
+    user's latest upload, the one their profile was built from.
+    """
+    __tablename__ = "parsed_resumes"
+    __table_args__ = (
+        UniqueConstraint("user_id", "pdf_sha256", name="uq_parsed_resumes_user_pdf"),
+        Index("idx_parsed_resumes_current_version", "is_current", "analysis_version"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    pdf_sha256: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    text_z: Mapped[bytes] = mapped_column(LargeBinary(length=16 * 1024 * 1024), nullable=False)
+    text_length: Mapped[int] = mapped_column(Integer, nullable=False)
+    analysis_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    analysis_json: Mapped[str] = mapped_column(Text, nullable=False)
+    is_current: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    uploaded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    analysed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import db
+
+
+class QuestionBankEntry(db.Model):
+    """
+    One curated interview question (see services/question_bank_service.py).
+    A follow-up points at its main question through ``parent_id``; the
+    in-memory index is keyed by (skill_key, difficulty, type).
+    """
+    __tablename__ = "question_bank"
+    __table_args__ = (
+        Index("idx_question_bank_lookup", "skill_key", "difficulty", "type"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    skill: Mapped[str] = mapped_column(String(100), nullable=False)
+    skill_key: Mapped[str] = mapped_column(String(100), nullable=False)  # skill.lower()
+    difficulty: Mapped[str] = mapped_column(String(10), nullable=False, default="mid")  # junior | mid | senior
+    type: Mapped[str] = mapped_column(String(10), nullable=False, default="main")  # main | follow_up
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    parent_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("question_bank.id", ondelete="CASCADE"), nullable=True
+    )
+    active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    source: Mapped[str] = mapped_column(String(40), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import db
+
+
+class QuestionPool(db.Model):
+    """
+    One pre-generated question pool (see services/question_pool_service.py),
+    keyed by (role, skill_key, band). ``requests`` counts the live requests
+    that asked for it, so the builder fills the pools in demand first.
+    """
+    __tablename__ = "question_pools"
+    __table_args__ = (
+        UniqueConstraint("role", "skill_key", "band", name="uq_question_pools_key"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    role: Mapped[str] = mapped_column(String(60), nullable=False, default="")  # "" = no role given
+    skill: Mapped[str] = mapped_column(String(100), nullable=False)
+    skill_key: Mapped[str] = mapped_column(String(100), nullable=False)  # skill.lower()
+    band: Mapped[str] = mapped_column(String(10), nullable=False)  # junior | mid | senior
+    requests: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    build_failures: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    last_requested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_built_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class QuestionPoolPair(db.Model):
+    """
+    A generated main / follow-up question pair in a pool. Served least-used
+    first; retired once served QUESTION_POOL_MAX_SERVES times.
+    """
+    __tablename__ = "question_pool_pairs"
+    __table_args__ = (
+        Index("idx_question_pool_pairs_live", "pool_id", "retired", "served_count"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    pool_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("question_pools.id", ondelete="CASCADE"), nullable=False
+    )
+    main: Mapped[str] = mapped_column(Text, nullable=False)
+    follow_up: Mapped[str] = mapped_column(Text, nullable=False)
+    served_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    retired: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
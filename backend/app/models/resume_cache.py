@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import db
+
+
+class ParsedResumeCache(db.Model):
+    """
+    Persistent tier of the parsed-resume cache (see services/resume_cache.py).
+    One row per (PDF content hash, analysis version); the payload is the
+    user-independent part of process_resume, stored as JSON.
+    """
+    __tablename__ = "parsed_resume_cache"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    cache_key: Mapped[str] = mapped_column(String(128), unique=True, index=True, nullable=False)
+    analysis_json: Mapped[str] = mapped_column(Text, nullable=False)
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    last_hit_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
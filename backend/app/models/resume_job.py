@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Integer, LargeBinary, String, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import db
+
+
+class ResumeJob(db.Model):
+    """
+    Queued asynchronous resume analysis (see services/resume_job_service.py).
+    The uploaded PDF is kept in ``file_data`` until the job finishes, so
+    queued jobs survive restarts and can be picked up by any worker host.
+    """
+    __tablename__ = "resume_jobs"
+    __table_args__ = (
+        Index("idx_resume_jobs_status_created", "status", "created_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")  # queued | running | succeeded | failed
+    stage: Mapped[str] = mapped_column(String(40), nullable=True)
+    progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    filename: Mapped[str] = mapped_column(String(255), nullable=True)
+    file_data: Mapped[bytes] = mapped_column(LargeBinary(length=16 * 1024 * 1024), nullable=True)
+    result_json: Mapped[str] = mapped_column(Text, nullable=True)
+    error: Mapped[str] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    locked_by: Mapped[str] = mapped_column(String(100), nullable=True)
+    locked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
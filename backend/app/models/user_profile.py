@@ -23,6 +23,8 @@ class UserProfile(db.Model):
     skills_json: Mapped[str] = mapped_column(Text, nullable=True)
     previous_role: Mapped[str] = mapped_column(String(100), nullable=True)
     target_role: Mapped[str] = mapped_column(String(100), nullable=True)
+    # {"version": ROLE_SCORER.version, "roles": [...]} — see user_profile_service.suggest_roles
+    suggested_roles_json: Mapped[str] = mapped_column(Text, nullable=True)
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
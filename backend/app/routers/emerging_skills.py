@@ -0,0 +1,24 @@
+from flask import Blueprint, request, jsonify
+
+from app.services import emerging_skills_service, resume_service
+from app.core.security import require_admin
+
+bp = Blueprint('emerging_skills', __name__)
+
+
+@bp.route("", methods=["GET"])
+def top_emerging_skills():
+    """
+    Most frequent resume tokens missing from the skills taxonomy (admins only).
+    Query params: days (window ending today, 1-365, default 30),
+    limit (1-200, default 50), min_users (default 1).
+    """
+    require_admin()
+    days = min(max(request.args.get("days", 30, type=int), 1), 365)
+    limit = min(max(request.args.get("limit", 50, type=int), 1), 200)
+    min_users = max(request.args.get("min_users", 1, type=int), 1)
+
+    # Include this worker's unwritten uploads.
+    emerging_skills_service.flush()
+    results = emerging_skills_service.top(days=days, limit=limit, min_users=min_users, exclude=resume_service.KNOWN_SKILLS_LOWER)
+    return jsonify({"results": results, "count": len(results), "days": days})
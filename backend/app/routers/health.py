@@ -1,8 +1,12 @@
 from flask import Blueprint, jsonify
 from sqlalchemy import text
+from app.core.config import get_settings
+from app.core.security import require_admin
 from app.database import db
+from app.services import emerging_skills_service, job_match_service, llm_cache, llm_fanout, llm_service, parse_budget, pdf_extractor, question_bank_service, question_pool_service, resume_cache
 
 bp = Blueprint('health', __name__)
+settings = get_settings()
 
 @bp.route("/health", methods=["GET"])
 def health_check():
@@ -14,10 +18,26 @@ def ready_check():
     """Checks availability of dependencies like Database and LLM."""
     components = {
         "database": "unknown",
-        "llm_service": "ok" # LLM is local dummy function so it's nominally always assumed ok
+        "llm_service": "unknown",
     }
     overall_status = "ok"
 
+    # Gemini: reported from this worker's circuit breaker rather than probed, so
+    # /ready never waits on the API. While the breaker is open every LLM feature
+    # serves its fallback, so the instance is degraded but still ready (200).
+    breaker = llm_service.breaker.snapshot()
+    if not settings.gemini_api_key:
+        components["llm_service"] = "disabled: GEMINI_API_KEY not set"
+    elif breaker["state"] == "closed":
+        components["llm_service"] = "ok"
+    elif breaker["state"] == "half_open":
+        components["llm_service"] = "degraded: circuit half-open, probing Gemini"
+        overall_status = "degraded"
+    else:
+        components["llm_service"] = (f"degraded: circuit open after {breaker['consecutive_failures']} "
+                                     f"failed or slow calls, retrying in {breaker['retry_in_seconds']:g}s")
+        overall_status = "degraded"
+
     # Database connection check
     try:
         db.session.execute(text('SELECT 1'))
@@ -26,10 +46,28 @@ def ready_check():
         components["database"] = f"error: {str(e)}"
         overall_status = "error"
 
-    status_code = 200 if overall_status == "ok" else 503
+    status_code = 503 if overall_status == "error" else 200
 
     return jsonify({
         "status": overall_status,
-        "components": components
+        "components": components,
+        "llm_breaker": breaker,
     }), status_code
 
+
+@bp.route("/metrics", methods=["GET"])
+def metrics():
+    """Per-worker cache and pipeline counters, for capacity planning. Admins only."""
+    require_admin()
+    return jsonify({
+        "resume_cache": resume_cache.stats(),
+        "pdf_extractor": pdf_extractor.pool_stats(),
+        "parse_budget": parse_budget.stats(),
+        "question_bank": question_bank_service.stats(),
+        "question_pools": question_pool_service.stats(),
+        "emerging_skills": emerging_skills_service.stats(),
+        "job_match": job_match_service.stats(),
+        "llm": llm_service.stats(),
+        "llm_cache": llm_cache.stats(),
+        "llm_fanout": llm_fanout.stats(),
+    })
@@ -0,0 +1,50 @@
+from flask import Blueprint, request, jsonify
+from werkzeug.exceptions import NotFound
+
+from app.schemas.job_match import JobMatchRequestSchema, JobMatchResponseSchema
+from app.services import job_match_service
+from app.core.security import get_current_user
+from app.core.timing import stage
+
+bp = Blueprint('job_match', __name__)
+job_match_req_schema = JobMatchRequestSchema()
+job_match_res_schema = JobMatchResponseSchema()
+
+
+@bp.route("", methods=["POST"])
+def match_job_descriptions():
+    """
+    Scores the current user's skills against up to 50 pasted job descriptions.
+    Expected JSON: {
+        "descriptions": [{"id": "...", "title": "...", "text": "..."}, ...],
+        "source": "profile" | "resume"   (default "profile")
+    }
+    Returns every description's overlap, matched and missing skills, best match first.
+    """
+    json_data = request.get_json()
+    if not json_data:
+        return jsonify({"detail": "No input data provided"}), 400
+
+    errors = job_match_req_schema.validate(json_data)
+    if errors:
+        return jsonify(errors), 422
+
+    current_user = get_current_user()
+    req_data = job_match_req_schema.load(json_data)
+    skills = job_match_service.candidate_skills(current_user.id, req_data["source"])
+    if skills is None:
+        raise NotFound(description=f"No {req_data['source']} skills found; upload a resume first.")
+
+    descriptions = req_data["descriptions"]
+    with stage("job_match"):
+        results = job_match_service.score(skills, [d["text"] for d in descriptions])
+    for result in results:
+        described = descriptions[result["index"]]
+        result["id"] = described["id"]
+        result["title"] = described["title"]
+
+    return jsonify(job_match_res_schema.dump({
+        "source": req_data["source"],
+        "candidate_skills": skills,
+        "results": results,
+    }))
@@ -0,0 +1,30 @@
+from flask import Blueprint, request, jsonify
+from werkzeug.exceptions import BadRequest
+
+from app.services import question_bank_service
+from app.core.security import require_admin
+
+bp = Blueprint('question_bank', __name__)
+
+
+@bp.route("/search", methods=["GET"])
+def search_questions():
+    """
+    Full-text search over the question bank for authoring tools (admins only).
+    Query params: q (required), skill, difficulty, type, limit (1-100, default 20).
+    """
+    require_admin()
+    query = request.args.get("q", "").strip()
+    if not query:
+        raise BadRequest(description="Query parameter 'q' is required.")
+    limit = min(max(request.args.get("limit", 20, type=int), 1), 100)
+
+    index = question_bank_service.get_index()
+    results = index.search(
+        query,
+        skill=request.args.get("skill"),
+        difficulty=request.args.get("difficulty"),
+        type=request.args.get("type"),
+        limit=limit,
+    )
+    return jsonify({"results": results, "count": len(results), "source": index.source})
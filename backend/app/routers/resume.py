@@ -1,24 +1,48 @@
 from flask import Blueprint, request, jsonify
 
-from app.schemas.resume import ResumeAnalysisOutSchema, GenerateQuestionsRequestSchema, GenerateQuestionsResponseSchema
-from app.services import resume_service
+from flask import url_for
+from werkzeug.exceptions import BadRequest, NotFound
+
+from app.schemas.resume import ResumeAnalysisOutSchema, GenerateQuestionsRequestSchema, GenerateQuestionsResponseSchema, ResumeJobSchema
+from app.services import resume_service, resume_job_service
 from app.core.security import get_current_user
+from app.core.timing import stage
+from app.core.uploads import upload_limits
 
 bp = Blueprint('resume', __name__)
 resume_analysis_schema = ResumeAnalysisOutSchema()
 gen_questions_req_schema = GenerateQuestionsRequestSchema()
 gen_questions_res_schema = GenerateQuestionsResponseSchema()
+resume_job_schema = ResumeJobSchema()
+
+MAX_TEXT_BYTES = 1024 * 1024  # 1 MB
+
+
+def _wants_async() -> bool:
+    if request.args.get("async", "").lower() in ("1", "true", "yes"):
+        return True
+    return "respond-async" in request.headers.get("Prefer", "").lower()
 
 @bp.route("/upload", methods=["POST"])
+@upload_limits(
+    resume_service.MAX_FILE_SIZE_BYTES,
+    magic=(resume_service.PDF_MAGIC,),
+    too_large="File exceeds the 5 MB size limit.",
+    wrong_type="Only PDF files are accepted.",
+)
 def upload_resume():
     """
     Upload a PDF resume. The service will:
-    - Validate file type and size (max 5 MB)
+    - Validate file type and size (max 5 MB) while the upload streams in
     - Extract text with pdfplumber
     - Match skills against a categorised keyword database (regex, no AI)
     - Generate up to 10 interview questions from technical skills only
     
     Returns a structured ResumeAnalysisOut response.
+
+    With ``?async=true`` (or ``Prefer: respond-async``) the upload is only
+    validated and queued: the response is 202 with a job id, and the analysis
+    is fetched later from GET /resume/jobs/<job_id>.
     """
     if 'file' not in request.files:
         return jsonify({"detail": "No file part"}), 400
@@ -28,19 +52,91 @@ def upload_resume():
         return jsonify({"detail": "No selected file"}), 400
         
     current_user = get_current_user()
+
+    if _wants_async():
+        raw = resume_service.read_validated_upload(file)
+        job = resume_job_service.enqueue(current_user.id, file.filename, raw)
+        status_url = url_for("resume.get_resume_job", job_id=job.id)
+        return jsonify({"job_id": job.id, "status": job.status, "status_url": status_url}), 202, {"Location": status_url}
+
     result = resume_service.process_resume(file, current_user.id)
-    
-    # Save the extracted skills and roles to the user's profile
+    return _respond_with_analysis(current_user.id, result)
+
+@bp.route("/text", methods=["POST"])
+@upload_limits(MAX_TEXT_BYTES, too_large="Resume text exceeds the 1 MB size limit.")
+def analyse_resume_text():
+    """
+    Analyse a resume already extracted to text (on the device, or pasted by
+    a recruiter): JSON ``{"text": "..."}`` or a UTF-8 ``text/plain`` body.
+    No PDF is parsed; the analysis stages and the ResumeAnalysisOut response
+    are those of POST /resume/upload.
+    """
+    if request.is_json:
+        text = (request.get_json(silent=True) or {}).get("text")
+        if not isinstance(text, str):
+            raise BadRequest(description="Field 'text' is required.")
+    else:
+        try:
+            text = request.get_data().decode("utf-8")
+        except UnicodeDecodeError:
+            raise BadRequest(description="Resume text must be UTF-8.")
+
+    current_user = get_current_user()
+    result = resume_service.process_resume_text(text, current_user.id)
+    return _respond_with_analysis(current_user.id, result)
+
+@bp.route("/docx", methods=["POST"])
+@upload_limits(
+    resume_service.MAX_FILE_SIZE_BYTES,
+    magic=(resume_service.DOCX_MAGIC,),
+    too_large="File exceeds the 5 MB size limit.",
+    wrong_type="Only DOCX files are accepted.",
+)
+def upload_resume_docx():
+    """
+    Upload a Word (.docx) resume. Its text is read by streaming the
+    document XML — no layout engine — and analysed as POST /resume/upload
+    does, with the same ResumeAnalysisOut response.
+    """
+    if 'file' not in request.files:
+        return jsonify({"detail": "No file part"}), 400
+
+    file = request.files['file']
+    if file.filename == '':
+        return jsonify({"detail": "No selected file"}), 400
+
+    current_user = get_current_user()
+    result = resume_service.process_resume_docx(file, current_user.id)
+    return _respond_with_analysis(current_user.id, result)
+
+def _respond_with_analysis(user_id: int, result: dict):
+    # Save the extracted skills and roles to the user's profile — unless the
+    # parse budget cut the analysis short, in which case the previous profile
+    # is kept rather than overwritten with partial results.
     from app.services import user_profile_service
-    user_profile_service.update_user_profile(
-        user_id=current_user.id,
-        skills=result.get("technical_skills", {}),
-        previous_role=result.get("previous_role"),
-        target_role=result.get("inferred_target_role")
-    )
+    if not result.get("partial"):
+        with stage("profile_save"):
+            user_profile_service.update_user_profile(
+                user_id=user_id,
+                skills=result.get("technical_skills", {}),
+                previous_role=result.get("previous_role"),
+                target_role=result.get("inferred_target_role")
+            )
     
     return jsonify(resume_analysis_schema.dump(result))
 
+@bp.route("/jobs/<job_id>", methods=["GET"])
+def get_resume_job(job_id: str):
+    """
+    Poll an asynchronous resume upload. ``result`` is the ResumeAnalysisOut
+    payload once ``status`` is "succeeded"; ``error`` is set when it "failed".
+    """
+    current_user = get_current_user()
+    job = resume_job_service.get_job(job_id, current_user.id)
+    if job is None:
+        raise NotFound(description="Resume job not found.")
+    return jsonify(resume_job_schema.dump(job))
+
 @bp.route("/generate-questions", methods=["POST"])
 def generate_questions():
     """
@@ -60,12 +156,13 @@ def generate_questions():
     # Bucket the flat list of skills to save into the UserProfile as categorised data
     categorised_skills = resume_service.bucket_skills(req_data["skills"])
     from app.services import user_profile_service
-    user_profile_service.update_user_profile(
-        user_id=current_user.id,
-        skills=categorised_skills,
-        previous_role=None, # Keep previous role intact or let standard upload handle it
-        target_role=req_data.get("target_role")
-    )
+    with stage("profile_save"):
+        user_profile_service.update_user_profile(
+            user_id=current_user.id,
+            skills=categorised_skills,
+            previous_role=None, # Keep previous role intact or let standard upload handle it
+            target_role=req_data.get("target_role")
+        )
     
     questions = resume_service.generate_questions_from_preferences(
         skills=req_data["skills"],
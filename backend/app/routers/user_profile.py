@@ -1,11 +1,14 @@
 from flask import Blueprint, request, jsonify, abort, send_from_directory
 from app.schemas.user_profile import UserProfileSchema, UserProfileUpdateSchema
 from app.services import user_profile_service
+from app.core.config import get_settings
 from app.core.security import get_current_user
+from app.core.uploads import upload_limits
 from app.database import db
 import os, uuid
 
 bp = Blueprint('profile', __name__)
+settings = get_settings()
 
 profile_schema = UserProfileSchema()
 profile_update_schema = UserProfileUpdateSchema()
@@ -86,6 +89,8 @@ def update_my_profile():
 
 
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+# PNG, JPEG, GIF and WebP (a RIFF container whose form type is WEBP) signatures
+PHOTO_MAGIC = (b"\x89PNG\r\n\x1a\n", b"\xff\xd8\xff", b"GIF87a", b"GIF89a", ((0, b"RIFF"), (8, b"WEBP")))
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '..', 'uploads')
 
 def allowed_file(filename):
@@ -93,6 +98,9 @@ def allowed_file(filename):
 
 
 @bp.route("/photo", methods=["POST"])
+@upload_limits(settings.profile_photo_max_bytes, magic=PHOTO_MAGIC,
+               too_large=f"Photo exceeds the {settings.profile_photo_max_bytes / (1024 * 1024):g} MB size limit.",
+               wrong_type="File type not allowed")
 def upload_profile_photo():
     """Upload a profile photo for the current user."""
     current_user = get_current_user()
@@ -0,0 +1,42 @@
+"""
+schemas/job_match.py
+~~~~~~~~~~~~~~~~~~~~
+Request/response models for the /job-match/ router.
+"""
+
+from marshmallow import Schema, fields, validate
+
+from app.services.job_match_service import MAX_DESCRIPTIONS
+
+
+class JobDescriptionSchema(Schema):
+    """One pasted job description; ``id`` and ``title`` are echoed back."""
+    id = fields.String(missing=None, allow_none=True)
+    title = fields.String(missing=None, allow_none=True)
+    text = fields.String(required=True, validate=validate.Length(min=1))
+
+class JobMatchRequestSchema(Schema):
+    """Request payload for POST /job-match."""
+    descriptions = fields.List(
+        fields.Nested(JobDescriptionSchema), required=True,
+        validate=validate.Length(min=1, max=MAX_DESCRIPTIONS),
+    )
+    source = fields.String(missing="profile", validate=validate.OneOf(["profile", "resume"]))
+
+class JobMatchResultSchema(Schema):
+    """Score of one job description, best match first."""
+    index = fields.Integer()
+    id = fields.String(allow_none=True)
+    title = fields.String(allow_none=True)
+    rank = fields.Integer()
+    score = fields.Integer()
+    overlap = fields.Integer()
+    required = fields.Integer()
+    matched = fields.List(fields.String())
+    missing = fields.List(fields.String())
+
+class JobMatchResponseSchema(Schema):
+    """Response payload for POST /job-match."""
+    source = fields.String()
+    candidate_skills = fields.List(fields.String())
+    results = fields.List(fields.Nested(JobMatchResultSchema))
@@ -4,6 +4,8 @@ schemas/resume.py
 Pydantic request/response models for the /resume/ router.
 """
 
+import json
+
 from marshmallow import Schema, fields
 
 class TechnicalSkillsSchema(Schema):
@@ -34,6 +36,7 @@ class ResumeAnalysisOutSchema(Schema):
     inferred_target_role = fields.String(missing=None)
     previous_role = fields.String(missing=None)
     generated_questions = fields.List(fields.Nested(InterviewQuestionSchema), missing=list)
+    partial = fields.Boolean(missing=False)
 
 class GenerateQuestionsRequestSchema(Schema):
     """Request payload for POST /resume/generate-questions."""
@@ -44,3 +47,19 @@ class GenerateQuestionsRequestSchema(Schema):
 class GenerateQuestionsResponseSchema(Schema):
     """Response payload for POST /resume/generate-questions."""
     generated_questions = fields.List(fields.Nested(InterviewQuestionSchema), required=True)
+
+class ResumeJobSchema(Schema):
+    """Response payload for GET /resume/jobs/<job_id>."""
+    job_id = fields.String(attribute="id")
+    status = fields.String()
+    stage = fields.String(allow_none=True)
+    progress = fields.Integer()
+    error = fields.String(allow_none=True)
+    created_at = fields.DateTime()
+    finished_at = fields.DateTime(allow_none=True)
+    result = fields.Method("get_result")
+
+    def get_result(self, job):
+        if not job.result_json:
+            return None
+        return ResumeAnalysisOutSchema().dump(json.loads(job.result_json))
@@ -0,0 +1,309 @@
+"""
+bulk_ingest_service.py — Offline Bulk Resume Ingestion
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Runs the process_resume analysis stages over a directory (or .zip archive)
+of PDFs in a process pool, without Flask or HTTP. Driven by
+``ingest_resumes.py``.
+
+* Results are appended to a JSONL file, one record per PDF:
+  ``{"source", "sha256", "analysis" | "error", "seconds"}``.
+* The JSONL file doubles as the checkpoint: re-running with the same output
+  skips every source already recorded, so a crashed run resumes where it
+  stopped. Records are written (and fsync'd) a batch at a time.
+* ``retry_failed`` first compacts the file, dropping the ``error`` records it
+  is about to retry (atomically, via a rewritten copy), so each source still
+  has exactly one record once the retries are appended.
+* With a user map (CSV with ``file`` and ``email`` columns), each batch also
+  upserts the matching UserProfile rows with two bulk statements, before the
+  batch is checkpointed.
+
+Question generation is user-specific and needs the interview history, so it
+is not part of bulk ingestion.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+
+from werkzeug.exceptions import HTTPException
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.services import resume_service
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Public analysis fields written per resume (ResumeAnalysisOut minus questions).
+ANALYSIS_FIELDS = (
+    "technical_skills", "tools_frameworks", "soft_skills", "unknown_skills",
+    "detected_experience_years", "previous_role", "inferred_target_role",
+)
+
+
+class ResumeSource(NamedTuple):
+    source: str            # stable id, written to the JSONL and used for checkpoints
+    path: str              # the PDF, or the .zip that contains it
+    member: Optional[str]  # archive member name; None for plain files
+
+
+@dataclass
+class IngestSummary:
+    total: int = 0
+    skipped: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    profiles_upserted: int = 0
+    unmatched: int = 0
+    seconds: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def files_per_second(self) -> float:
+        return self.processed / self.seconds if self.seconds else 0.0
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+def discover(root: str) -> list[ResumeSource]:
+    """Lists the PDFs under a directory (recursively) or inside a .zip archive."""
+    if os.path.isdir(root):
+        found = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if name.lower().endswith(".pdf"):
+                    path = os.path.join(dirpath, name)
+                    found.append(ResumeSource(os.path.relpath(path, root).replace(os.sep, "/"), path, None))
+        return found
+    if zipfile.is_zipfile(root):
+        base = os.path.basename(root)
+        with zipfile.ZipFile(root) as zf:
+            return [
+                ResumeSource(f"{base}!{info.filename}", root, info.filename)
+                for info in zf.infolist()
+                if not info.is_dir() and info.filename.lower().endswith(".pdf")
+            ]
+    raise ValueError(f"{root} is neither a directory nor a .zip archive")
+
+
+def load_user_map(path: str) -> dict[str, str]:
+    """
+    Reads a CSV with ``file`` and ``email`` columns. ``file`` may be the
+    source id or just the PDF's file name.
+    """
+    with open(path, newline="", encoding="utf-8") as fh:
+        return {row["file"].strip(): row["email"].strip() for row in csv.DictReader(fh) if row.get("email")}
+
+
+def _email_for(user_map: dict[str, str], source: str) -> Optional[str]:
+    return user_map.get(source) or user_map.get(source.rsplit("/", 1)[-1].rsplit("!", 1)[-1])
+
+
+# ---------------------------------------------------------------------------
+# Pool side
+# ---------------------------------------------------------------------------
+
+def _init_worker() -> None:
+    # Pool processes extract inline; nesting the extraction pool inside them
+    # would only double the process count.
+    settings.pdf_pool_size = 0
+    logging.disable(logging.INFO)
+
+
+def _read(item: ResumeSource) -> bytes:
+    if item.member is None:
+        with open(item.path, "rb") as fh:
+            return fh.read()
+    with zipfile.ZipFile(item.path) as zf:
+        return zf.read(item.member)
+
+
+def analyse_source(item: ResumeSource) -> dict:
+    """Analyses one PDF; never raises — failures become an ``error`` record."""
+    start = time.perf_counter()
+    record: dict = {"source": item.source}
+    try:
+        raw = _read(item)
+        record["sha256"] = hashlib.sha256(raw).hexdigest()
+        if len(raw) > resume_service.MAX_FILE_SIZE_BYTES:
+            raise ValueError("File exceeds the 5 MB size limit.")
+        analysis = resume_service.analyse_resume_bytes(raw)
+        record["analysis"] = {name: analysis[name] for name in ANALYSIS_FIELDS}
+    except HTTPException as e:
+        record["error"] = e.description
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+# ---------------------------------------------------------------------------
+# Checkpoints and output
+# ---------------------------------------------------------------------------
+
+def load_checkpoint(output_path: str, retry_failed: bool = False) -> set[str]:
+    """
+    Returns the sources already recorded in *output_path*. A torn final line
+    (the previous run died mid-write) is truncated away. With *retry_failed*,
+    failed sources are left out and their records removed from the file.
+    """
+    done: set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+    failed = 0
+    with open(output_path, "rb+") as fh:
+        good_end = 0
+        for line in fh:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if retry_failed and "error" in record:
+                failed += 1
+            else:
+                done.add(record["source"])
+            good_end += len(line)
+        fh.truncate(good_end)
+    if failed:
+        _drop_failed(output_path)
+        logger.info(f"[BulkIngest] Removed {failed} failed records to retry")
+    return done
+
+
+def _drop_failed(output_path: str) -> None:
+    """Rewrites *output_path* without its ``error`` records; the rewrite replaces the file atomically."""
+    tmp_path = output_path + ".compact"
+    with open(output_path, "rb") as src, open(tmp_path, "wb") as dst:
+        for line in src:
+            if "error" not in json.loads(line):
+                dst.write(line)
+        dst.flush()
+        os.fsync(dst.fileno())
+    os.replace(tmp_path, output_path)
+
+
+def upsert_profiles(rows: list[tuple[str, dict]]) -> tuple[int, int]:
+    """
+    Bulk-upserts UserProfile skills/roles for ``(email, analysis)`` rows, with
+    the same field mapping as user_profile_service.update_user_profile.
+    Needs an app context. Returns (profiles_written, unknown_emails).
+    """
+    from app.database import db
+    from app.models.user import User
+    from app.models.user_profile import UserProfile
+    from app.services.user_profile_service import profile_values
+
+    emails = {email for email, _ in rows}
+    user_ids = dict(db.session.query(User.email, User.id).filter(User.email.in_(emails)).all())
+    profile_ids = dict(
+        db.session.query(UserProfile.user_id, UserProfile.id)
+        .filter(UserProfile.user_id.in_(list(user_ids.values())))
+        .all()
+    )
+
+    now = datetime.now(timezone.utc)
+    updates: dict[int, dict] = {}
+    inserts: dict[int, dict] = {}
+    unknown = 0
+    for email, analysis in rows:
+        user_id = user_ids.get(email)
+        if user_id is None:
+            unknown += 1
+            continue
+        values = {**profile_values(analysis), "updated_at": now}
+        if user_id in profile_ids:
+            updates[user_id] = {"id": profile_ids[user_id], **values}
+        else:
+            inserts[user_id] = {"user_id": user_id, **values}
+
+    if updates:
+        db.session.bulk_update_mappings(UserProfile, list(updates.values()))
+    if inserts:
+        db.session.bulk_insert_mappings(UserProfile, list(inserts.values()))
+    db.session.commit()
+    return len(updates) + len(inserts), unknown
+
+
+def _flush(batch: list[dict], out, user_map: Optional[dict[str, str]], summary: IngestSummary) -> None:
+    if user_map is not None:
+        rows = [
+            (email, record["analysis"]) for record in batch
+            if "analysis" in record and (email := _email_for(user_map, record["source"]))
+        ]
+        if rows:
+            written, unknown = upsert_profiles(rows)
+            summary.profiles_upserted += written
+            summary.unmatched += unknown
+    # Checkpoint only after the batch's profiles are committed.
+    for record in batch:
+        out.write(json.dumps(record) + "\n")
+    out.flush()
+    os.fsync(out.fileno())
+    batch.clear()
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def ingest(
+    root: str,
+    output_path: str,
+    workers: Optional[int] = None,
+    batch_size: int = 100,
+    user_map: Optional[dict[str, str]] = None,
+    retry_failed: bool = False,
+) -> IngestSummary:
+    """
+    Analyses every PDF under *root* not yet recorded in *output_path*.
+    Pass *user_map* (see load_user_map) to also upsert profiles; that
+    requires an app context.
+    """
+    sources = discover(root)
+    done = load_checkpoint(output_path, retry_failed)
+    todo = [item for item in sources if item.source not in done]
+    summary = IngestSummary(total=len(sources), skipped=len(sources) - len(todo))
+    logger.info(f"[BulkIngest] {len(sources)} PDFs found, {summary.skipped} already done, {len(todo)} to process")
+    if not todo:
+        return summary
+
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    batch: list[dict] = []
+    with open(output_path, "a", encoding="utf-8") as out, \
+            multiprocessing.Pool(workers, initializer=_init_worker, maxtasksperchild=200) as pool:
+        for record in pool.imap_unordered(analyse_source, todo, chunksize=4):
+            if "error" in record:
+                summary.failed += 1
+            else:
+                summary.succeeded += 1
+            batch.append(record)
+            if len(batch) >= batch_size:
+                _flush(batch, out, user_map, summary)
+                summary.seconds = time.perf_counter() - start
+                logger.info(
+                    f"[BulkIngest] {summary.processed}/{len(todo)} files "
+                    f"({summary.files_per_second:.1f} files/s)"
+                )
+        if batch:
+            _flush(batch, out, user_map, summary)
+    summary.seconds = time.perf_counter() - start
+    return summary
@@ -0,0 +1,114 @@
+"""
+circuit_breaker.py — Circuit Breaker for Outbound Calls
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+When a dependency degrades, every caller otherwise waits out its timeout
+before falling back, and the sync workers pile up behind it. A breaker
+counts consecutive failures — errors, timeouts, and calls slower than
+``slow_seconds`` even if they succeeded — and after ``failure_threshold``
+of them it opens:
+
+* closed    — calls go through; a good call resets the count.
+* open      — ``allow()`` is False: callers go straight to their fallback,
+  with no network wait, for ``cooldown_seconds``.
+* half_open — after the cooldown one probe call is let through (others are
+  still refused). If it is good the breaker closes; if not it opens for
+  another cooldown.
+
+State is per process (each gunicorn worker learns about an outage from its
+own calls) and thread-safe.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """The breaker refused the call; use the fallback."""
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, cooldown_seconds: float, slow_seconds: Optional[float] = None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.slow_seconds = slow_seconds
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._counters = {"calls": 0, "failures": 0, "slow_calls": 0, "rejected": 0, "opened": 0}
+
+    def _refresh(self) -> None:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.cooldown_seconds:
+            self._state = HALF_OPEN
+            self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half_open, True for the single probe only."""
+        with self._lock:
+            self._refresh()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self._counters["rejected"] += 1
+            return False
+
+    def record_success(self, seconds: float = 0.0) -> None:
+        """A call returned after *seconds*; a slow one counts as a failure."""
+        if self.slow_seconds is not None and seconds > self.slow_seconds:
+            with self._lock:
+                self._counters["slow_calls"] += 1
+            self.record_failure(f"slow call ({seconds:.1f}s)")
+            return
+        with self._lock:
+            self._counters["calls"] += 1
+            if self._state != CLOSED:
+                logger.info(f"[CircuitBreaker] {self.name}: probe succeeded, closing")
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self, reason: str = "") -> None:
+        with self._lock:
+            self._counters["calls"] += 1
+            self._counters["failures"] += 1
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._counters["opened"] += 1
+                    logger.warning(f"[CircuitBreaker] {self.name}: opening for {self.cooldown_seconds:g}s "
+                                   f"after {self._failures} consecutive failures ({reason})")
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            self._refresh()
+            retry_in = max(0.0, self.cooldown_seconds - (time.monotonic() - self._opened_at)) if self._state == OPEN else 0.0
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "retry_in_seconds": round(retry_in, 1),
+                **self._counters,
+            }
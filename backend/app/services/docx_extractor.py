@@ -0,0 +1,122 @@
+"""
+docx_extractor.py — Streaming DOCX Text Extraction
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A .docx file is a ZIP archive whose body text is word/document.xml. That
+part is inflated and parsed a chunk at a time (XMLPullParser) straight out
+of the archive — no layout engine and no document tree: each paragraph is
+turned into a line as it closes and then dropped, so memory stays flat
+however long the document is.
+
+* ``w:t`` → its text, ``w:tab`` → "\\t", ``w:br`` / ``w:cr`` → "\\n", the
+  end of a ``w:p`` → "\\n". Table cells hold paragraphs, so each cell lands
+  on its own line; deleted revisions and field codes are skipped.
+* Reading stops at PDF_MAX_CHARS characters, as PDF extraction does.
+* Parts that inflate past MAX_XML_BYTES (zip bombs) or declare a DTD
+  (entity expansion) are rejected.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import zipfile
+import zlib
+from typing import Optional, Union
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+from app.core.config import get_settings
+from app.core.uploads import BufferReader
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+DocxInput = Union[bytes, bytearray, mmap.mmap]
+
+DOCUMENT_PART = "word/document.xml"
+
+# Largest document.xml inflated; real resumes are well under 1 MB of XML.
+MAX_XML_BYTES = 32 * 1024 * 1024
+
+_CHUNK_BYTES = 64 * 1024
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_TEXT = _W + "t"
+_TAB = _W + "tab"
+_BREAKS = frozenset((_W + "br", _W + "cr"))
+_PARAGRAPH = _W + "p"
+_BODY = _W + "body"
+
+
+class DocxError(ValueError):
+    """The upload is not a readable Word document."""
+
+
+def extract_text(raw: DocxInput, max_chars: Optional[int] = None) -> str:
+    """Body text of a .docx, one line per paragraph, cut at *max_chars* (default PDF_MAX_CHARS)."""
+    max_chars = settings.pdf_max_chars if max_chars is None else max_chars
+    with io.BytesIO(raw) if isinstance(raw, bytes) else BufferReader(raw) as source:
+        return _extract(source, max_chars)
+
+
+def _extract(source, max_chars: int) -> str:
+    try:
+        archive = zipfile.ZipFile(source)
+        info = archive.getinfo(DOCUMENT_PART)
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise DocxError("not a Word document") from e
+    if info.file_size > MAX_XML_BYTES:
+        raise DocxError(f"{DOCUMENT_PART} is larger than {MAX_XML_BYTES // (1024 * 1024)} MB")
+
+    parser = XMLPullParser(events=("start", "end"))
+    lines: list[str] = []
+    runs: list[str] = []
+    chars = 0
+    inflated = 0
+    prolog = b""          # bytes before the root element, checked for a DTD
+    body = None
+    depth = 0
+    try:
+        with archive.open(info) as part:
+            for chunk in iter(lambda: part.read(_CHUNK_BYTES), b""):
+                inflated += len(chunk)
+                if inflated > MAX_XML_BYTES:
+                    raise DocxError(f"{DOCUMENT_PART} inflates past {MAX_XML_BYTES // (1024 * 1024)} MB")
+                if prolog is not None:
+                    prolog += chunk
+                    if b"<!DOCTYPE" in prolog:
+                        raise DocxError("document type declarations are not allowed")
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if event == "start":
+                        prolog = None
+                        depth += 1
+                        if elem.tag == _BODY:
+                            body = elem
+                        continue
+                    depth -= 1
+                    tag = elem.tag
+                    if tag == _TEXT:
+                        runs.append(elem.text or "")
+                    elif tag == _TAB:
+                        runs.append("\t")
+                    elif tag in _BREAKS:
+                        runs.append("\n")
+                    elif tag == _PARAGRAPH:
+                        line = "".join(runs)
+                        runs.clear()
+                        lines.append(line)
+                        chars += len(line) + 1
+                        elem.clear()
+                        if chars >= max_chars:
+                            logger.info(f"[DocxExtractor] Reached {max_chars} characters — skipping the rest.")
+                            return "\n".join(lines)[:max_chars]
+                    if depth == 2 and body is not None:
+                        # A top-level block (paragraph, table) is done: drop it from the body.
+                        body.clear()
+            parser.close()
+    except ParseError as e:
+        raise DocxError(f"malformed {DOCUMENT_PART}: {e}") from e
+    except (zipfile.BadZipFile, zlib.error) as e:
+        raise DocxError(f"corrupt archive: {e}") from e
+    return "\n".join(lines)
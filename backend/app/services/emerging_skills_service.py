@@ -0,0 +1,231 @@
+"""
+emerging_skills_service.py — Emerging-Skills Frequency Index
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+The candidate skills resume_service.detect_unknown_skills finds in each
+upload (tokens missing from TECH_SKILLS_DB) are counted into two tables
+(models/emerging_skill.py), keyed by the normalised token:
+
+* emerging_skill_counts — uploads mentioning the token, per day,
+* emerging_skill_users  — one row per (token, day, user), from which
+  distinct-user counts for any window are taken.
+
+Both are maintained incrementally, so deciding what to add to the taxonomy
+never means rescanning old resumes.
+
+* ``record`` only adds the upload to an in-process buffer, aggregated by
+  (token, day). The buffer is written once it holds
+  EMERGING_SKILLS_BATCH_UPLOADS uploads or its oldest upload is
+  EMERGING_SKILLS_FLUSH_SECONDS old: one multi-row upsert per table.
+  A worker that exits loses at most its unflushed batch — acceptable for a
+  frequency signal.
+* ``top`` ranks the tokens seen in the last N days by distinct users, then
+  mentions, leaving out tokens the taxonomy has picked up since.
+
+Like resume_cache, the index is bookkeeping: write failures are logged and
+counted, and never fail an upload.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import func
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.database import db
+from app.models.emerging_skill import EmergingSkillCount, EmergingSkillUser
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Column width of token_key / token.
+MAX_TOKEN_LENGTH = 100
+
+# Rows per INSERT statement when a batch is written.
+_ROWS_PER_STATEMENT = 500
+
+
+def normalise_token(token: str) -> str:
+    """Index key of a candidate token: lower-cased and cut to MAX_TOKEN_LENGTH."""
+    return token.strip().lower()[:MAX_TOKEN_LENGTH]
+
+
+# ---------------------------------------------------------------------------
+# Buffer
+# ---------------------------------------------------------------------------
+
+_lock = threading.Lock()
+_mentions: dict[tuple[str, date], list] = {}     # (key, day) -> [display token, mentions]
+_sightings: set[tuple[str, date, int]] = set()   # (key, day, user_id)
+_pending_uploads = 0
+_oldest_pending: Optional[float] = None
+_counters = {"uploads": 0, "flushes": 0, "rows_written": 0, "errors": 0}
+
+
+def record(user_id: int, tokens: Iterable[str]) -> None:
+    """Counts one upload's unknown-skill candidates; writes the buffer when it is due."""
+    today = datetime.now(timezone.utc).date()
+    global _pending_uploads, _oldest_pending
+    with _lock:
+        for key, token in {normalise_token(t): t for t in tokens}.items():
+            if not key:
+                continue
+            entry = _mentions.setdefault((key, today), [token, 0])
+            entry[0] = token[:MAX_TOKEN_LENGTH]
+            entry[1] += 1
+            _sightings.add((key, today, user_id))
+        _pending_uploads += 1
+        _counters["uploads"] += 1
+        if _oldest_pending is None:
+            _oldest_pending = time.monotonic()
+        due = (
+            _pending_uploads >= settings.emerging_skills_batch_uploads
+            or time.monotonic() - _oldest_pending >= settings.emerging_skills_flush_seconds
+        )
+    if due:
+        flush()
+
+
+def _take_batch() -> tuple[dict, set, int]:
+    global _mentions, _sightings, _pending_uploads, _oldest_pending
+    with _lock:
+        batch = _mentions, _sightings, _pending_uploads
+        _mentions, _sightings, _pending_uploads, _oldest_pending = {}, set(), 0, None
+    return batch
+
+
+def _insert(model):
+    """The dialect's INSERT construct, for its upsert clauses."""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model), dialect
+
+
+def _upsert_mentions(rows: list[dict]) -> None:
+    stmt, dialect = _insert(EmergingSkillCount)
+    stmt = stmt.values(rows)
+    if dialect == "mysql":
+        stmt = stmt.on_duplicate_key_update(
+            token=stmt.inserted.token,
+            mentions=EmergingSkillCount.mentions + stmt.inserted.mentions,
+        )
+    else:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["token_key", "day"],
+            set_={"token": stmt.excluded.token, "mentions": EmergingSkillCount.mentions + stmt.excluded.mentions},
+        )
+    db.session.execute(stmt)
+
+
+def _insert_sightings(rows: list[dict]) -> None:
+    stmt, dialect = _insert(EmergingSkillUser)
+    stmt = stmt.values(rows)
+    stmt = stmt.prefix_with("IGNORE") if dialect == "mysql" else stmt.on_conflict_do_nothing()
+    db.session.execute(stmt)
+
+
+def flush() -> int:
+    """Writes the buffered counts. Needs an app context; returns the rows written."""
+    mentions, sightings, uploads = _take_batch()
+    if not uploads:
+        return 0
+
+    mention_rows = [
+        {"token_key": key, "day": day, "token": token, "mentions": count}
+        for (key, day), (token, count) in mentions.items()
+    ]
+    sighting_rows = [{"token_key": key, "day": day, "user_id": user_id} for key, day, user_id in sightings]
+    try:
+        for i in range(0, len(mention_rows), _ROWS_PER_STATEMENT):
+            _upsert_mentions(mention_rows[i:i + _ROWS_PER_STATEMENT])
+        for i in range(0, len(sighting_rows), _ROWS_PER_STATEMENT):
+            _insert_sightings(sighting_rows[i:i + _ROWS_PER_STATEMENT])
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        with _lock:
+            _counters["errors"] += 1
+        logger.warning(f"[EmergingSkills] Could not write {uploads} uploads' counts: {e}")
+        return 0
+
+    written = len(mention_rows) + len(sighting_rows)
+    with _lock:
+        _counters["flushes"] += 1
+        _counters["rows_written"] += written
+    logger.info(f"[EmergingSkills] Wrote {len(mention_rows)} token counts from {uploads} uploads")
+    return written
+
+
+def stats() -> dict:
+    with _lock:
+        return {**_counters, "pending_uploads": _pending_uploads, "pending_tokens": len(_mentions)}
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def top(days: int = 30, limit: int = 50, min_users: int = 1, exclude: Iterable[str] = ()) -> list[dict]:
+    """
+    The tokens seen in the last *days* days (today included), ranked by
+    distinct users then mentions. Tokens whose key is in *exclude* (skills
+    the taxonomy knows by now) are left out. ``first_seen`` is the first
+    day the token was ever recorded, inside the window or not.
+    """
+    since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+    excluded = list({normalise_token(t) for t in exclude})
+
+    users = (
+        db.session.query(
+            EmergingSkillUser.token_key.label("token_key"),
+            func.count(func.distinct(EmergingSkillUser.user_id)).label("users"),
+        )
+        .filter(EmergingSkillUser.day >= since)
+        .group_by(EmergingSkillUser.token_key)
+        .subquery()
+    )
+    query = (
+        db.session.query(
+            EmergingSkillCount.token_key,
+            func.max(EmergingSkillCount.token),
+            func.sum(EmergingSkillCount.mentions),
+            users.c.users,
+        )
+        .join(users, users.c.token_key == EmergingSkillCount.token_key)
+        .filter(EmergingSkillCount.day >= since, users.c.users >= min_users)
+    )
+    if excluded:
+        query = query.filter(EmergingSkillCount.token_key.notin_(excluded))
+    rows = (
+        query.group_by(EmergingSkillCount.token_key, users.c.users)
+        .order_by(users.c.users.desc(), func.sum(EmergingSkillCount.mentions).desc(), EmergingSkillCount.token_key)
+        .limit(limit)
+        .all()
+    )
+
+    first_seen = dict(
+        db.session.query(EmergingSkillCount.token_key, func.min(EmergingSkillCount.day))
+        .filter(EmergingSkillCount.token_key.in_([row[0] for row in rows]))
+        .group_by(EmergingSkillCount.token_key)
+        .all()
+    ) if rows else {}
+
+    return [
+        {
+            "token": token,
+            "key": key,
+            "users": int(user_count),
+            "mentions": int(mentions),
+            "first_seen": first_seen[key].isoformat() if key in first_seen else None,
+        }
+        for key, token, mentions, user_count in rows
+    ]
@@ -1,8 +1,12 @@
 import json
 from collections import defaultdict
+from functools import partial
+from app.core.config import get_settings
 from app.database import db
 from app.models.interview import Interview, QuestionAnswer, Skill
-from app.services import llm_service
+from app.services import llm_fanout, llm_service
+
+settings = get_settings()
 
 
 def _feedback_level(score: int) -> str:
@@ -23,6 +27,17 @@ def _build_summary(score: int, level: str, categories: list[str]) -> str:
     )
 
 
+def _fallback_evaluation(answer: str) -> dict:
+    # Deterministic Fallback if LLM evaluation fails or misses the deadline
+    length_val = min(100, len(answer) // 2)
+    return {
+        "score": length_val,
+        "strengths": ["Length-based fallback scoring applied."],
+        "improvements": ["Answer length could be longer for a better fallback score."],
+        "suggestions": ["Include more technical depth."]
+    }
+
+
 # ---------------------------------------------------------------------------
 # Public service functions
 # ---------------------------------------------------------------------------
@@ -35,36 +50,40 @@ def create_interview(interview_data: dict, user_id: int) -> Interview:
     responses = interview_data.get('responses', [])
     role_applied_for = interview_data.get('role_applied_for')
     
-    # Store AI evaluations per response
+    items = [
+        {
+            'question': r.get('question', ''),
+            'answer': r.get('answer', ''),
+            'category': r.get('category', '').strip(),
+        }
+        for r in responses
+    ]
+
+    # All LLM calls of this request share one deadline; whatever misses it
+    # gets deterministic scoring instead of holding up the request
+    until = llm_fanout.deadline()
+
+    # Store AI evaluations per response: the whole interview in one LLM call,
+    # or one concurrent call per answer when batching is off
+    if settings.llm_batch_evaluation:
+        ai_evals, summary = llm_service.evaluate_interview(items, role_applied_for, until)
+    else:
+        ai_evals = llm_fanout.run(
+            [partial(llm_service.evaluate_answer, item['question'], item['answer'], item['category'], role_applied_for)
+             for item in items],
+            fallback=lambda i: _fallback_evaluation(items[i]['answer']),
+            until=until,
+        )
+        summary = None
+
     evaluated_responses = []
     category_score_sums = defaultdict(int)
     category_counts = defaultdict(int)
 
-    for r in responses:
-        question = r.get('question', '')
-        answer = r.get('answer', '')
-        category = r.get('category', '').strip()
-
-        # Call LLM evaluation with fallback
-        try:
-            ai_eval = llm_service.evaluate_answer(question, answer, category, role_applied_for)
-        except Exception as e:
-            # Deterministic Fallback if LLM evaluation fails
-            length_val = min(100, len(answer) // 2)
-            ai_eval = {
-                "score": length_val,
-                "strengths": ["Length-based fallback scoring applied."],
-                "improvements": ["Answer length could be longer for a better fallback score."],
-                "suggestions": ["Include more technical depth."]
-            }
-        
-        evaluated_responses.append({
-            'question': question,
-            'answer': answer,
-            'category': category,
-            'ai_eval': ai_eval
-        })
+    for item, ai_eval in zip(items, ai_evals):
+        evaluated_responses.append({**item, 'ai_eval': ai_eval})
 
+        category = item['category']
         if category:
             category_score_sums[category] += ai_eval['score']
             category_counts[category] += 1
@@ -80,13 +99,20 @@ def create_interview(interview_data: dict, user_id: int) -> Interview:
         overall_score = int(sum(category_scores.values()) / len(category_scores))
 
     level = _feedback_level(overall_score)
-    # Synthesize the 3-4 line contextual AI summary covering all categories
-    summary = llm_service.generate_interview_summary(
-        role=role_applied_for,
-        overall_score=overall_score,
-        feedback_level=level,
-        category_scores=category_scores
-    )
+    # Synthesize the 3-4 line contextual AI summary covering all categories,
+    # unless the batch evaluation already wrote it
+    if summary is None:
+        summary = llm_fanout.run(
+            [partial(
+                llm_service.generate_interview_summary,
+                role=role_applied_for,
+                overall_score=overall_score,
+                feedback_level=level,
+                category_scores=category_scores
+            )],
+            fallback=lambda _: _build_summary(overall_score, level, list(category_scores)),
+            until=until,
+        )[0]
 
     # Persist Interview
     interview = Interview(
@@ -0,0 +1,137 @@
+"""
+job_match_service.py — Job-Description Matching
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Scores a candidate's skills against a batch of pasted job descriptions.
+
+* Each description is alias-normalised and run through the resume parser's
+  compiled SkillMatcher once; its tech skills become a set of indices into
+  SKILL_VOCABULARY (every TECH_SKILLS_DB skill, in taxonomy order). The
+  indices are cached in a per-worker LRU keyed by sha256(text) and the
+  analysis version, so a posting compared again — by the same user or any
+  other — is never re-scanned, and a taxonomy change never serves stale
+  vectors.
+* The batch becomes one descriptions × vocabulary 0/1 matrix and is scored
+  against the candidate's vector in a single product: overlap, required
+  skills and missing skills for every description at once. Ranking is by
+  coverage (share of the description's skills the candidate has), then
+  overlap, then input order.
+
+The candidate's skills come from their profile (default) or from the
+analysis of their current resume (parsed_resume_service).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.services import resume_service
+from app.services.resume_cache import _LRUCache
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+MAX_DESCRIPTIONS = 50
+MAX_DESCRIPTION_CHARS = 50_000
+
+# Canonical tech skills, in taxonomy order; vectors are indexed by position.
+SKILL_VOCABULARY: list[str] = list(dict.fromkeys(
+    skill for skills in resume_service.TECH_SKILLS_DB.values() for skill in skills
+))
+_VOCABULARY_INDEX = {skill.lower(): i for i, skill in enumerate(SKILL_VOCABULARY)}
+
+_vectors = _LRUCache(settings.job_match_cache_size)
+_counters = {"descriptions": 0, "cache_hits": 0, "scans": 0}
+_counters_lock = threading.Lock()
+
+
+def _indices(skills) -> tuple[int, ...]:
+    """Vocabulary indices of *skills* (names, any case); names outside the taxonomy are dropped."""
+    return tuple(sorted({i for s in skills if (i := _VOCABULARY_INDEX.get(s.lower())) is not None}))
+
+
+def description_skills(text: str, version: Optional[str] = None) -> tuple[int, ...]:
+    """Vocabulary indices of the tech skills a description mentions (cached by content hash)."""
+    version = version or resume_service.analysis_version()
+    key = f"{hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()}:{version}"
+    cached = _vectors.get(key)
+    if cached is not None:
+        with _counters_lock:
+            _counters["cache_hits"] += 1
+        return cached
+    found = resume_service._match_skills_in_text(resume_service.normalize_skill_aliases(text))
+    indices = _indices(skill for skills in found.values() for skill in skills)
+    _vectors.put(key, indices)
+    with _counters_lock:
+        _counters["scans"] += 1
+    return indices
+
+
+def candidate_skills(user_id: int, source: str = "profile") -> Optional[list[str]]:
+    """The user's tech skills from their profile or current resume; None if there is none."""
+    from app.services import parsed_resume_service, user_profile_service
+
+    if source == "resume":
+        analysis = parsed_resume_service.current_analysis(user_id)
+        if analysis is None:
+            return None
+        return [skill for skills in (analysis.get("technical_skills") or {}).values() for skill in skills]
+    profile = user_profile_service.get_user_profile(user_id)
+    if profile is None or not profile.skills_json:
+        return None
+    return user_profile_service._flatten_skills(user_profile_service._load_skills(profile.skills_json))
+
+
+def score(skills: Sequence[str], descriptions: Sequence[str]) -> list[dict]:
+    """
+    Scores *skills* against every description. Returns one entry per
+    description, best match first: ``index`` (position in *descriptions*),
+    ``rank``, ``score`` (coverage percentage), ``overlap``, ``required``,
+    ``matched`` and ``missing`` (skills in taxonomy order).
+    """
+    texts = [text[:MAX_DESCRIPTION_CHARS] for text in descriptions]
+    with _counters_lock:
+        _counters["descriptions"] += len(texts)
+    if not texts:
+        return []
+
+    # Identical postings in one batch are scanned once.
+    version = resume_service.analysis_version()
+    vectors = {text: description_skills(text, version) for text in dict.fromkeys(texts)}
+    matrix = np.zeros((len(texts), len(SKILL_VOCABULARY)), dtype=np.int32)
+    for row, text in enumerate(texts):
+        matrix[row, list(vectors[text])] = 1
+    candidate = np.zeros(len(SKILL_VOCABULARY), dtype=np.int32)
+    candidate[list(_indices(skills))] = 1
+
+    overlap = matrix @ candidate
+    required = matrix.sum(axis=1)
+    coverage = np.divide(overlap, required, out=np.zeros(len(texts), dtype=np.float64), where=required > 0)
+    percent = (coverage * 100).astype(np.int64)
+    missing = matrix & (1 - candidate)
+    # Best coverage first, then most overlap; lexsort keeps input order on ties.
+    order = np.lexsort((np.arange(len(texts)), -overlap, -coverage))
+
+    results = []
+    for rank, row in enumerate(order, start=1):
+        results.append({
+            "index": int(row),
+            "rank": rank,
+            "score": int(percent[row]),
+            "overlap": int(overlap[row]),
+            "required": int(required[row]),
+            "matched": [SKILL_VOCABULARY[i] for i in np.flatnonzero(matrix[row] & candidate)],
+            "missing": [SKILL_VOCABULARY[i] for i in np.flatnonzero(missing[row])],
+        })
+    return results
+
+
+def stats() -> dict:
+    with _counters_lock:
+        counters = dict(_counters)
+    return {**counters, "cache_size": len(_vectors), "cache_max_size": _vectors.max_size}
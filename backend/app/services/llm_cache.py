@@ -0,0 +1,227 @@
+"""
+llm_cache.py — Gemini Response Cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Identical prompts are common: a retried interview submission re-sends the
+same answers, and users re-run question generation with the same skills.
+Responses are cached under sha256(PROMPT_VERSION, model, system
+instruction, prompt, response MIME type):
+
+* L1 — bounded in-process LRU (LLM_CACHE_SIZE per gunicorn worker).
+* L2 — the ``llm_response_cache`` table, shared by all workers and
+  surviving restarts. L2 hits are promoted into L1.
+* Entries expire LLM_CACHE_TTL_SECONDS after they were stored, in both
+  tiers; expired rows are purged every _PURGE_EVERY stores. A TTL of 0
+  turns the cache off.
+* Concurrent misses for one key within a worker are coalesced: the first
+  caller makes the Gemini call and the others wait for its result (or its
+  exception) instead of making their own — for at most
+  LLM_CALL_TIMEOUT_SECONDS, after which they raise and use their fallback.
+  A new leader looks the key up once more before calling, in case the
+  previous leader stored its response just after the first lookup.
+* L2 hit counts are buffered and written in batches (resume_cache._HitBuffer),
+  so a lookup never writes through the request's session.
+* Only responses the caller accepts are stored, so a malformed or failed
+  response is retried next time rather than served until it expires.
+
+llm_service.PROMPT_VERSION is part of every key: bump it whenever a prompt
+changes and the old entries stop matching. Cache failures are logged and
+swallowed — the call is simply made.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from flask import has_app_context
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.database import db
+from app.models.llm_cache import LlmResponseCache
+from app.services.resume_cache import _HitBuffer, _LRUCache
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Stores between purges of expired L2 rows.
+_PURGE_EVERY = 500
+
+_memory = _LRUCache(settings.llm_cache_size)   # key -> (expires_at epoch seconds, response text)
+_hits = _HitBuffer(LlmResponseCache, "LLMCache")
+_counters = {"memory_hits": 0, "db_hits": 0, "misses": 0, "coalesced": 0, "coalesce_timeouts": 0,
+             "late_hits": 0, "stores": 0, "purged": 0, "errors": 0}
+_counters_lock = threading.Lock()
+
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _count(name: str, delta: int = 1) -> None:
+    with _counters_lock:
+        _counters[name] += delta
+
+
+def enabled() -> bool:
+    return settings.llm_cache_ttl_seconds > 0
+
+
+def cache_key(prompt_version: str, model: str, system_instruction: str, prompt: str,
+              mime_type: Optional[str] = None) -> str:
+    """Content address of one Gemini request."""
+    digest = hashlib.sha256()
+    for part in (prompt_version, model, mime_type or "", system_instruction, prompt):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _lookup(key: str) -> tuple[Optional[str], str]:
+    """(response text, counter of the tier that had it), or (None, "misses")."""
+    entry = _memory.get(key)
+    if entry is not None and entry[0] > time.time():
+        return entry[1], "memory_hits"
+
+    if has_app_context():
+        try:
+            row = (
+                db.session.query(LlmResponseCache.response_text, LlmResponseCache.expires_at)
+                .filter_by(cache_key=key)
+                .first()
+            )
+            if row is not None and _aware(row.expires_at) > datetime.now(timezone.utc):
+                _hits.add(key)
+                _memory.put(key, (_aware(row.expires_at).timestamp(), row.response_text))
+                return row.response_text, "db_hits"
+        except Exception as e:
+            db.session.rollback()
+            _count("errors")
+            logger.warning(f"[LLMCache] lookup failed: {e}")
+    return None, "misses"
+
+
+def get(key: str) -> Optional[str]:
+    """Looks *key* up in L1 then L2. Returns the cached response text or None."""
+    text, counter = _lookup(key)
+    _count(counter)
+    return text
+
+
+def put(key: str, text: str) -> None:
+    """Stores *text* in both tiers for LLM_CACHE_TTL_SECONDS, replacing an expired L2 row."""
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=settings.llm_cache_ttl_seconds)
+    _memory.put(key, (expires_at.timestamp(), text))
+    if not has_app_context():
+        return
+    try:
+        row = db.session.query(LlmResponseCache).filter_by(cache_key=key).first()
+        if row is None:
+            db.session.add(LlmResponseCache(cache_key=key, response_text=text, expires_at=expires_at))
+        else:
+            row.response_text, row.expires_at, row.created_at = text, expires_at, datetime.now(timezone.utc)
+        db.session.commit()
+        _count("stores")
+    except Exception as e:
+        # Most likely a concurrent worker inserted the same key first.
+        db.session.rollback()
+        _count("errors")
+        logger.warning(f"[LLMCache] store failed: {e}")
+        return
+    with _counters_lock:
+        purge_due = _counters["stores"] % _PURGE_EVERY == 0
+    if purge_due:
+        purge_expired()
+
+
+def purge_expired() -> int:
+    """Deletes expired L2 rows; returns how many."""
+    try:
+        deleted = (
+            db.session.query(LlmResponseCache)
+            .filter(LlmResponseCache.expires_at <= datetime.now(timezone.utc))
+            .delete(synchronize_session=False)
+        )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        _count("errors")
+        logger.warning(f"[LLMCache] purge failed: {e}")
+        return 0
+    _count("purged", deleted)
+    if deleted:
+        logger.info(f"[LLMCache] Purged {deleted} expired responses")
+    return deleted
+
+
+def get_or_call(key: str, call: Callable[[], str], accept: Callable[[str], bool] = bool) -> str:
+    """
+    The cached response for *key*, or the result of *call*, stored when
+    ``accept(text)`` holds. Concurrent callers with the same key share one
+    call; its exception is raised in every one of them.
+    """
+    if not enabled():
+        return call()
+    text = get(key)
+    if text is not None:
+        return text
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        _count("coalesced")
+        try:
+            return future.result(timeout=settings.llm_call_timeout_seconds)
+        except FutureTimeout:
+            _count("coalesce_timeouts")
+            raise TimeoutError("timed out waiting for a coalesced Gemini call") from None
+
+    try:
+        # The previous leader may have stored the response and left _inflight
+        # between the lookup above and this caller becoming leader.
+        text, counter = _lookup(key)
+        if text is not None:
+            _count("misses", -1)
+            _count(counter)
+            _count("late_hits")
+        else:
+            text = call()
+            if accept(text):
+                put(key, text)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(text)
+        return text
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _aware(moment: datetime) -> datetime:
+    # SQLite hands back naive datetimes even for timezone=True columns.
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def stats() -> dict:
+    """Hit/miss counters for this worker process, for sizing the cache."""
+    with _counters_lock:
+        counters = dict(_counters)
+    lookups = counters["memory_hits"] + counters["db_hits"] + counters["misses"]
+    hits = counters["memory_hits"] + counters["db_hits"]
+    return {
+        **counters,
+        "lookups": lookups,
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        "memory_size": len(_memory),
+        "memory_max_size": _memory.max_size,
+        "in_flight": len(_inflight),
+        "pending_hit_counts": len(_hits),
+    }
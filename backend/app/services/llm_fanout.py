@@ -0,0 +1,141 @@
+"""
+llm_fanout.py — Concurrent LLM Calls Under One Deadline
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Gemini calls spend their time waiting on the network, and the calls one
+request makes (an evaluation per answer, the interview summary) do not
+depend on each other. ``run`` sends them together through a thread pool and
+waits for them against a single deadline shared by the whole request.
+
+* The pool has LLM_MAX_CONCURRENCY threads and each gunicorn worker owns one,
+  lazily created. The cap is shared by every request the worker serves, so
+  concurrent submissions queue behind it rather than opening more calls.
+* The deadline is absolute (``deadline()`` starts one of
+  LLM_REQUEST_DEADLINE_SECONDS). When it passes, every call still queued or in
+  flight is replaced by its fallback and the request moves on. A call already
+  on the wire cannot be interrupted: it finishes in its pool thread and its
+  result is dropped.
+* A call that raises is replaced by its fallback too.
+* Calls run inside the caller's Flask app context (each pool thread pushes
+  its own), so they can use the database.
+* LLM_MAX_CONCURRENCY=0 runs the calls one after another in the caller's
+  thread. Calls still unstarted when the deadline passes get their fallback.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Optional, Sequence, TypeVar
+
+from flask import current_app, has_app_context
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_counters_lock = threading.Lock()
+_counters = {
+    "fanouts": 0,            # run() calls
+    "calls": 0,              # calls submitted
+    "in_flight": 0,          # calls running in a pool thread right now
+    "errors": 0,             # calls that raised (fallback used)
+    "deadlines_hit": 0,      # fan-outs with at least one call past the deadline
+    "deadline_fallbacks": 0, # calls replaced by their fallback at the deadline
+}
+
+
+def _count(**deltas: int) -> None:
+    with _counters_lock:
+        for name, delta in deltas.items():
+            _counters[name] += delta
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.llm_max_concurrency, thread_name_prefix="llm")
+        return _executor
+
+
+def deadline(seconds: Optional[float] = None) -> float:
+    """Absolute deadline (time.monotonic) *seconds* from now; defaults to LLM_REQUEST_DEADLINE_SECONDS."""
+    return time.monotonic() + (settings.llm_request_deadline_seconds if seconds is None else seconds)
+
+
+def _tracked(call: Callable[[], T], app) -> T:
+    _count(in_flight=1)
+    try:
+        if app is None:
+            return call()
+        with app.app_context():
+            return call()
+    finally:
+        _count(in_flight=-1)
+
+
+def run(calls: Sequence[Callable[[], T]], fallback: Callable[[int], T], until: float) -> list[T]:
+    """
+    Runs *calls* concurrently and returns their results in order. A call that
+    raises, or has not finished by the absolute deadline *until*, is replaced
+    by ``fallback(index)``.
+    """
+    if not calls:
+        return []
+    _count(fanouts=1, calls=len(calls))
+    if settings.llm_max_concurrency <= 0:
+        return _run_inline(calls, fallback, until)
+
+    executor = _get_executor()
+    app = current_app._get_current_object() if has_app_context() else None
+    futures = [executor.submit(_tracked, call, app) for call in calls]
+    _, pending = wait(futures, timeout=max(0.0, until - time.monotonic()))
+
+    results: list[T] = []
+    for index, future in enumerate(futures):
+        if future in pending:
+            future.cancel()
+            results.append(fallback(index))
+        elif future.exception() is not None:
+            _count(errors=1)
+            logger.error(f"[LLMFanout] Call {index} failed, using its fallback: {future.exception()}")
+            results.append(fallback(index))
+        else:
+            results.append(future.result())
+    if pending:
+        _count(deadlines_hit=1, deadline_fallbacks=len(pending))
+        logger.warning(f"[LLMFanout] Deadline passed with {len(pending)} of {len(calls)} calls pending; using fallbacks.")
+    return results
+
+
+def _run_inline(calls: Sequence[Callable[[], T]], fallback: Callable[[int], T], until: float) -> list[T]:
+    results: list[T] = []
+    late = 0
+    for index, call in enumerate(calls):
+        if time.monotonic() >= until:
+            late += 1
+            results.append(fallback(index))
+            continue
+        try:
+            results.append(call())
+        except Exception as e:
+            _count(errors=1)
+            logger.error(f"[LLMFanout] Call {index} failed, using its fallback: {e}")
+            results.append(fallback(index))
+    if late:
+        _count(deadlines_hit=1, deadline_fallbacks=late)
+        logger.warning(f"[LLMFanout] Deadline passed with {late} of {len(calls)} calls unstarted; using fallbacks.")
+    return results
+
+
+def stats() -> dict:
+    with _counters_lock:
+        return {**_counters, "max_concurrency": settings.llm_max_concurrency}
@@ -1,8 +1,13 @@
 import json
 import logging
+import threading
+import time
+from functools import partial
 from google import genai
 from google.genai import types
 from app.core.config import get_settings
+from app.services import llm_cache, llm_fanout
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +15,20 @@ settings = get_settings()
 
 MODEL_NAME = "gemini-1.5-flash"
 
+# Part of every response-cache key (services/llm_cache.py): bump it whenever
+# a system instruction or prompt below changes, so cached outputs of the old
+# prompt are never served.
+PROMPT_VERSION = "1"
+
+# Shared by every Gemini call this worker makes: once it opens, callers get
+# their fallbacks immediately instead of each waiting out a timeout.
+breaker = CircuitBreaker(
+    "gemini",
+    failure_threshold=settings.llm_breaker_failures,
+    cooldown_seconds=settings.llm_breaker_cooldown_seconds,
+    slow_seconds=settings.llm_slow_call_seconds,
+)
+
 # Initialise the client once at module load
 _client: genai.Client | None = None
 
@@ -22,12 +41,56 @@ def _get_client() -> genai.Client:
     return _client
 
 
-def evaluate_answer(question: str, answer: str, category: str, role: str = None) -> dict:
+def _is_json(text: str) -> bool:
+    try:
+        json.loads(text)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _generate(system_instruction: str, contents: str, json_response: bool = True) -> str:
     """
-    Evaluates an answer against a question using Gemini.
-    Falls back to deterministic scoring if API key is missing or call fails.
+    Response text of one Gemini call, served from the response cache when an
+    identical request (same prompt version, model, instruction and prompt)
+    was answered before. Only parseable JSON (or, for text, a non-empty
+    reply) is cached.
+
+    Cache misses go through the circuit breaker: while it is open this raises
+    CircuitOpenError without touching the network, and every call is cut off
+    after LLM_CALL_TIMEOUT_SECONDS.
     """
-    fallback_response = {
+    mime_type = "application/json" if json_response else None
+    key = llm_cache.cache_key(PROMPT_VERSION, MODEL_NAME, system_instruction, contents, mime_type)
+
+    def call() -> str:
+        client = _get_client()
+        if not breaker.allow():
+            raise CircuitOpenError("Gemini circuit breaker is open")
+        start = time.monotonic()
+        try:
+            response = client.models.generate_content(
+                model=MODEL_NAME,
+                contents=contents,
+                config=types.GenerateContentConfig(
+                    system_instruction=system_instruction,
+                    response_mime_type=mime_type,
+                    http_options=types.HttpOptions(timeout=int(settings.llm_call_timeout_seconds * 1000)),
+                ),
+            )
+        except Exception as e:
+            breaker.record_failure(type(e).__name__)
+            raise
+        breaker.record_success(time.monotonic() - start)
+        return response.text
+
+    accept = _is_json if json_response else (lambda text: bool(text and text.strip()))
+    return llm_cache.get_or_call(key, call, accept)
+
+
+def _fallback_evaluation(answer: str, category: str) -> dict:
+    """Deterministic, length-based evaluation used whenever Gemini cannot score an answer."""
+    return {
         "score": min(100, max(0, len(answer) // 2)),
         "strengths": [
             f"Addressed the core concept of the {category} question.",
@@ -42,16 +105,37 @@ def evaluate_answer(question: str, answer: str, category: str, role: str = None)
         ]
     }
 
-    if not settings.gemini_api_key:
-        logger.warning("No Gemini API key found. Using fallback scoring.")
-        return fallback_response
 
-    role_context = (
+def _role_context(role: str | None) -> str:
+    return (
         f" The candidate is interviewing for a '{role}' position. "
         f"Vary the strictness and context of the suggestions accurately against "
         f"standard industry expectations for this specific role."
     ) if role else " Provide general technical feedback."
 
+
+def _normalise_evaluation(result: dict) -> dict:
+    return {
+        "score": max(0, min(100, int(result.get("score", 0)))),
+        "strengths": result.get("strengths", []) or ["Good effort."],
+        "improvements": result.get("improvements", []) or ["Detail edge cases."],
+        "suggestions": result.get("suggestions", []) or ["Practice more."]
+    }
+
+
+def evaluate_answer(question: str, answer: str, category: str, role: str = None) -> dict:
+    """
+    Evaluates an answer against a question using Gemini.
+    Falls back to deterministic scoring if API key is missing or call fails.
+    """
+    fallback_response = _fallback_evaluation(answer, category)
+
+    if not settings.gemini_api_key:
+        logger.warning("No Gemini API key found. Using fallback scoring.")
+        return fallback_response
+
+    role_context = _role_context(role)
+
     system_instruction = (
         f"You are an expert technical interviewer evaluating a candidate's answer.\n"
         f"Evaluate the following answer to the given question in the category '{category}'.{role_context}\n"
@@ -65,30 +149,189 @@ def evaluate_answer(question: str, answer: str, category: str, role: str = None)
     prompt = f"Question: {question}\n\nCandidate Answer: {answer}"
 
     try:
-        client = _get_client()
-        response = client.models.generate_content(
-            model=MODEL_NAME,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                response_mime_type="application/json",
-            ),
-        )
+        text = _generate(system_instruction, prompt)
 
-        result = json.loads(response.text)
+        result = json.loads(text)
 
-        return {
-            "score": max(0, min(100, int(result.get("score", 0)))),
-            "strengths": result.get("strengths", []) or ["Good effort."],
-            "improvements": result.get("improvements", []) or ["Detail edge cases."],
-            "suggestions": result.get("suggestions", []) or ["Practice more."]
-        }
+        return _normalise_evaluation(result)
     except Exception as e:
         logger.error(f"Error calling Gemini for evaluation: {e}")
         fallback_response["strengths"] = ["Failed to reach AI. Using length-based scoring."]
         return fallback_response
 
 
+# ---------------------------------------------------------------------------
+# Batch evaluation: a whole interview per Gemini call
+# ---------------------------------------------------------------------------
+
+# Answers scored per Gemini call; longer interviews are split over several calls.
+MAX_BATCH_ITEMS = 20
+
+_counters_lock = threading.Lock()
+_counters = {"batch_calls": 0, "batch_failures": 0, "batch_items": 0, "items_retried": 0, "batch_summaries": 0}
+
+
+def _count(**deltas: int) -> None:
+    with _counters_lock:
+        for name, delta in deltas.items():
+            _counters[name] += delta
+
+
+def _valid_evaluation(item) -> bool:
+    """One evaluation from a batch response: a numeric score and, if present, lists of strings."""
+    if not isinstance(item, dict):
+        return False
+    score = item.get("score")
+    if isinstance(score, bool):
+        return False
+    try:
+        int(score)
+    except (TypeError, ValueError):
+        return False
+    return all(
+        isinstance(item.get(key, []), list) and all(isinstance(v, str) for v in item.get(key, []))
+        for key in ("strengths", "improvements", "suggestions")
+    )
+
+
+def _parse_batch(text: str, count: int) -> tuple[dict[int, dict], str | None]:
+    """
+    Valid evaluations of a batch response by item position (0-based), and its
+    summary. Items are matched by their "item" number, or by position when the
+    response has exactly one entry per item; malformed, missing and duplicate
+    items are left out so the caller can retry just those.
+    """
+    try:
+        result = json.loads(text)
+    except (TypeError, ValueError):
+        return {}, None
+    entries = result.get("evaluations") if isinstance(result, dict) else result
+    if not isinstance(entries, list):
+        return {}, None
+
+    evaluations: dict[int, dict] = {}
+    for position, entry in enumerate(entries):
+        number = entry.get("item") if isinstance(entry, dict) else None
+        if isinstance(number, int) and not isinstance(number, bool) and 1 <= number <= count:
+            index = number - 1
+        elif len(entries) == count:
+            index = position
+        else:
+            continue
+        if index not in evaluations and _valid_evaluation(entry):
+            evaluations[index] = entry
+
+    summary = result.get("summary") if isinstance(result, dict) else None
+    summary = summary.replace('\n', ' ').strip() if isinstance(summary, str) else ""
+    return evaluations, summary or None
+
+
+def _evaluate_batch(items: list[dict], role: str | None, with_summary: bool) -> tuple[dict[int, dict], str | None] | None:
+    """One batch call: its valid evaluations by position and its summary, or None if the call failed."""
+    summary_rule = (
+        f"Then write a concise, professional 3-4 line paragraph summarizing the whole interview: "
+        f"what they excelled at and what their primary weakness was, relating it to the role. "
+        f"The summary is plain text with NO markdown or bullet points.\n"
+    ) if with_summary else ""
+    summary_field = ', "summary": "string"' if with_summary else ""
+    role_context = _role_context(role)
+
+    system_instruction = (
+        f"You are an expert technical interviewer evaluating every answer of a candidate's interview.{role_context}\n"
+        f"Each numbered item gives the category, the question and the candidate's answer. Evaluate each item "
+        f"on its own: a score from 0 to 100, a list of strengths, a list of improvements, "
+        f"and a list of actionable suggestions specifically tailored to their role.\n"
+        f"{summary_rule}"
+        f"You MUST return ONLY a valid JSON object matching this schema exactly, with one evaluation per item "
+        f"in item order, and absolutely NO markdown formatting or other text:\n"
+        f'{{"evaluations": [{{"item": integer, "score": integer, "strengths": ["string"], '
+        f'"improvements": ["string"], "suggestions": ["string"]}}]{summary_field}}}'
+    )
+
+    prompt = "\n\n".join(
+        f"Item {number}\nCategory: {item['category']}\nQuestion: {item['question']}\n"
+        f"Candidate Answer: {item['answer']}"
+        for number, item in enumerate(items, start=1)
+    )
+
+    _count(batch_calls=1, batch_items=len(items))
+    try:
+        text = _generate(system_instruction, prompt)
+        return _parse_batch(text, len(items))
+    except Exception as e:
+        logger.error(f"Error calling Gemini for batch evaluation: {e}")
+        _count(batch_failures=1)
+        return None
+
+
+def _unreachable_evaluation(item: dict) -> dict:
+    fallback = _fallback_evaluation(item["answer"], item["category"])
+    fallback["strengths"] = ["Failed to reach AI. Using length-based scoring."]
+    return fallback
+
+
+def evaluate_interview(items: list[dict], role: str = None, until: float | None = None) -> tuple[list[dict], str | None]:
+    """
+    Evaluates all of an interview's answers (dicts with question, answer and
+    category) in one Gemini call — MAX_BATCH_ITEMS per call for longer
+    interviews, sent concurrently. Items the response leaves out or gets wrong
+    are retried singly (and concurrently) through evaluate_answer. Anything
+    unanswered by the absolute deadline *until* (default: one
+    LLM_REQUEST_DEADLINE_SECONDS from now) gets deterministic scoring.
+
+    Returns one evaluation per item, in order, and the interview summary
+    written in the same call; the summary is None when there is none (no API
+    key, failed call, interview split over several calls), and the caller
+    should then use generate_interview_summary.
+    """
+    if not settings.gemini_api_key:
+        logger.warning("No Gemini API key found. Using fallback scoring.")
+        return [_fallback_evaluation(item["answer"], item["category"]) for item in items], None
+
+    until = llm_fanout.deadline() if until is None else until
+    with_summary = len(items) <= MAX_BATCH_ITEMS
+    starts = range(0, len(items), MAX_BATCH_ITEMS)
+    batches = llm_fanout.run(
+        [partial(_evaluate_batch, items[start:start + MAX_BATCH_ITEMS], role, with_summary) for start in starts],
+        fallback=lambda _: None,
+        until=until,
+    )
+
+    evaluations: list[dict | None] = [None] * len(items)
+    summary = None
+    for start, batch in zip(starts, batches):
+        chunk = items[start:start + MAX_BATCH_ITEMS]
+        if batch is None:
+            evaluations[start:start + len(chunk)] = [_unreachable_evaluation(item) for item in chunk]
+            continue
+        parsed, summary = batch
+        for i, evaluation in parsed.items():
+            evaluations[start + i] = _normalise_evaluation(evaluation)
+
+    missing = [i for i, evaluation in enumerate(evaluations) if evaluation is None]
+    if missing:
+        logger.warning(f"Batch evaluation returned {len(missing)} of {len(items)} items malformed; retrying them singly.")
+        _count(items_retried=len(missing))
+        retried = llm_fanout.run(
+            [partial(evaluate_answer, items[i]["question"], items[i]["answer"], items[i]["category"], role)
+             for i in missing],
+            fallback=lambda j: _fallback_evaluation(items[missing[j]]["answer"], items[missing[j]]["category"]),
+            until=until,
+        )
+        for i, evaluation in zip(missing, retried):
+            evaluations[i] = evaluation
+
+    summary = summary if with_summary else None
+    if summary:
+        _count(batch_summaries=1)
+    return evaluations, summary
+
+
+def stats() -> dict:
+    with _counters_lock:
+        return {**_counters, "breaker": breaker.snapshot()}
+
+
 def generate_questions(question_plan: dict, role: str, experience: int, count: int) -> list[dict]:
     """
     Generates tailored interview questions using Gemini based on the structured question_plan.
@@ -140,16 +383,8 @@ def generate_questions(question_plan: dict, role: str, experience: int, count: i
     prompt = f"Generate exactly {pair_count} question pairs according to the system instructions."
 
     try:
-        client = _get_client()
-        response = client.models.generate_content(
-            model=MODEL_NAME,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                response_mime_type="application/json",
-            ),
-        )
-        result = json.loads(response.text)
+        text = _generate(system_instruction, prompt)
+        result = json.loads(text)
 
         if isinstance(result, list):
             return result[:count]
@@ -162,6 +397,51 @@ def generate_questions(question_plan: dict, role: str, experience: int, count: i
         return []
 
 
+_BAND_EXPERIENCE = {"junior": "0-2 years", "mid": "2-5 years", "senior": "5+ years"}
+
+
+def generate_pool_questions(role: str, skill: str, band: str, count: int, avoid: list[str] = ()) -> list[dict]:
+    """
+    Generates *count* main/follow-up question pairs about one skill for the
+    question pools (services/question_pool_service.py). Questions in *avoid*
+    (already pooled) are listed so Gemini does not repeat them. Returns an
+    empty list if it fails or if no API key is provided.
+    """
+    if not settings.gemini_api_key:
+        return []
+
+    avoid_list = "\n".join(f"- {q}" for q in avoid) or "None"
+    system_instruction = (
+        f"Generate {count} distinct technical interview questions about {skill} for a "
+        f"{role or 'Software Engineer'} candidate with {_BAND_EXPERIENCE.get(band, band)} of experience.\n\n"
+        f"Rules\n\n"
+        f"• Each question must include one follow-up question\n"
+        f"• Follow-up questions must probe deeper into the same topic\n"
+        f"• Questions must match the candidate experience level\n"
+        f"• Each question covers a different aspect of {skill}\n"
+        f"• Do not repeat or rephrase any of these existing questions:\n{avoid_list}\n"
+        f"• Return JSON format\n\n"
+        f"[\n"
+        f' {{\n   "main_question": "...",\n   "follow_up_question": "..."\n }}\n'
+        f"]"
+    )
+
+    try:
+        text = _generate(system_instruction, f"Generate exactly {count} question pairs about {skill}.")
+        result = json.loads(text)
+        if isinstance(result, dict):
+            result = result.get("questions", [])
+        if not isinstance(result, list):
+            return []
+        return [
+            q for q in result
+            if isinstance(q, dict) and isinstance(q.get("main_question"), str) and isinstance(q.get("follow_up_question"), str)
+        ][:count]
+    except Exception as e:
+        logger.error(f"Error calling Gemini for pool generation: {e}")
+        return []
+
+
 def generate_interview_summary(role: str, overall_score: int, feedback_level: str, category_scores: dict) -> str:
     """
     Synthesize a 3-4 line paragraph globally summarizing the interview based on aggregated metrics.
@@ -189,15 +469,8 @@ def generate_interview_summary(role: str, overall_score: int, feedback_level: st
     )
 
     try:
-        client = _get_client()
-        response = client.models.generate_content(
-            model=MODEL_NAME,
-            contents="Generate the 3-4 line summary paragraph.",
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-            ),
-        )
-        return response.text.replace('\n', ' ').strip()
+        text = _generate(system_instruction, "Generate the 3-4 line summary paragraph.", json_response=False)
+        return text.replace('\n', ' ').strip()
     except Exception as e:
         logger.error(f"Error calling Gemini for summary: {e}")
         return fallback_summary
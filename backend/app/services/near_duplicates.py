@@ -0,0 +1,103 @@
+"""
+near_duplicates.py — Near-Duplicate Question Filter
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Replaces the pairwise ``SequenceMatcher(None, new, old).ratio() > 0.85``
+scan over every accepted question. Each check narrows the candidates in
+stages, cheapest first, and only survivors pay for an exact ratio():
+
+1. Shingle index — accepted texts are indexed by their character 3-gram
+   shingles, so only texts sharing at least one shingle are considered.
+2. Length bound — ratio() can never exceed 2·min(la, lb) / (la + lb)
+   (difflib's real_quick_ratio). Exact.
+3. Shingle overlap — candidates whose shingle-set Dice coefficient is below
+   MIN_SHINGLE_DICE are dropped. The only approximate step; its agreement
+   with the plain SequenceMatcher filter is measured by bench_dedup.py.
+4. Character multiset bound — difflib's quick_ratio(), computed from cached
+   Counters instead of being rebuilt for every pair. Exact.
+5. SequenceMatcher(None, new, accepted).ratio(), as the old scan did.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from difflib import SequenceMatcher
+
+SHINGLE_SIZE = 3
+
+# Candidates whose shingle sets overlap less than this (Dice) are never
+# scored exactly. Near-duplicates at ratio > 0.85 share far more than half
+# of their shingles; see bench_dedup.py for the measured agreement.
+MIN_SHINGLE_DICE = 0.5
+
+
+def _shingles(text: str) -> frozenset[str]:
+    if len(text) <= SHINGLE_SIZE:
+        return frozenset((text,))
+    return frozenset(text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1))
+
+
+class NearDuplicateIndex:
+    """
+    Set of accepted texts that answers "is this within *threshold*
+    SequenceMatcher similarity of anything accepted so far?".
+    """
+
+    def __init__(self, threshold: float = 0.85):
+        self.threshold = threshold
+        self._texts: list[str] = []
+        self._shingles: list[frozenset[str]] = []
+        self._counts: list[Counter] = []
+        self._postings: dict[str, list[int]] = {}
+        self.stats = {"checks": 0, "candidates": 0, "exact": 0, "duplicates": 0}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def is_duplicate(self, text: str) -> bool:
+        self.stats["checks"] += 1
+        if not self._texts:
+            return False
+
+        shingles = _shingles(text)
+        shared: Counter = Counter()
+        for shingle in shingles:
+            for i in self._postings.get(shingle, ()):
+                shared[i] += 1
+
+        t = self.threshold
+        la = len(text)
+        counts: Counter | None = None
+        for i, common in shared.items():
+            self.stats["candidates"] += 1
+            other = self._texts[i]
+            lb = len(other)
+            total = la + lb
+            if 2 * min(la, lb) / total <= t:
+                continue
+            if 2 * common / (len(shingles) + len(self._shingles[i])) < MIN_SHINGLE_DICE:
+                continue
+            if counts is None:
+                counts = Counter(text)
+            if 2 * sum((counts & self._counts[i]).values()) / total <= t:
+                continue
+            self.stats["exact"] += 1
+            if SequenceMatcher(None, text, other).ratio() > t:
+                self.stats["duplicates"] += 1
+                return True
+        return False
+
+    def add(self, text: str) -> None:
+        index = len(self._texts)
+        shingles = _shingles(text)
+        self._texts.append(text)
+        self._shingles.append(shingles)
+        self._counts.append(Counter(text))
+        for shingle in shingles:
+            self._postings.setdefault(shingle, []).append(index)
+
+    def add_if_new(self, text: str) -> bool:
+        """Adds *text* unless it near-duplicates an accepted one. Returns True if added."""
+        if self.is_duplicate(text):
+            return False
+        self.add(text)
+        return True
@@ -0,0 +1,97 @@
+"""
+parse_budget.py — Wall-Clock Budget for Resume Analysis
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Resume text is untrusted. The analysis patterns are linear-time (see
+bench_regex.py) and the text is capped at PDF_MAX_CHARS, but a crafted
+resume can still be made as expensive as that allows. ``limit(seconds)``
+gives one analysis a deadline; the scanning loops of the analysis stages
+iterate through ``bounded(stage, matches)``, which stops yielding once the
+deadline has passed. A stage cut short keeps what it found so far, and every
+later bounded loop ends at once, so the analysis returns quickly with
+partial results and the names of the stages that were cut.
+
+The deadline is checked between matches, every ``every`` items: a single
+regex step cannot be interrupted, which is why the patterns themselves must
+stay linear. Outside ``limit`` (or with a budget of 0) ``bounded`` returns
+its iterable unchanged.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ParseBudget:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.deadline = time.monotonic() + seconds
+        self.exhausted: list[str] = []   # stages cut short, in order
+
+    def _cut(self, stage: str) -> None:
+        if stage not in self.exhausted:
+            self.exhausted.append(stage)
+
+    def _bounded(self, stage: str, items: Iterable[T], every: int) -> Iterator[T]:
+        deadline = self.deadline
+        if time.monotonic() > deadline:
+            self._cut(stage)
+            return
+        countdown = every
+        for item in items:
+            yield item
+            countdown -= 1
+            if not countdown:
+                if time.monotonic() > deadline:
+                    self._cut(stage)
+                    return
+                countdown = every
+
+
+_current: ContextVar[Optional[ParseBudget]] = ContextVar("parse_budget", default=None)
+
+_counters_lock = threading.Lock()
+_counters = {"analyses": 0, "exhausted": 0}
+
+
+@contextmanager
+def limit(seconds: float) -> Iterator[Optional[ParseBudget]]:
+    """Runs the enclosed analysis under a *seconds* budget (no budget when <= 0)."""
+    if seconds <= 0:
+        yield None
+        return
+    budget = ParseBudget(seconds)
+    token = _current.set(budget)
+    try:
+        yield budget
+    finally:
+        _current.reset(token)
+        with _counters_lock:
+            _counters["analyses"] += 1
+            if budget.exhausted:
+                _counters["exhausted"] += 1
+        if budget.exhausted:
+            logger.warning(f"[ParseBudget] {seconds:g}s budget exhausted; cut short: {', '.join(budget.exhausted)}")
+
+
+def bounded(stage: str, items: Iterable[T], every: int = 256) -> Iterable[T]:
+    """*items*, cut off once the current budget's deadline has passed."""
+    budget = _current.get()
+    if budget is None:
+        return items
+    return budget._bounded(stage, items, every)
+
+
+def stats() -> dict:
+    """Analyses run under a budget by this worker, and how many ran out of it."""
+    with _counters_lock:
+        return dict(_counters)
@@ -0,0 +1,261 @@
+"""
+parsed_resume_service.py — Stored Resumes and Incremental Re-analysis
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Every upload leaves a ParsedResume row (models/parsed_resume.py): the
+extracted text, zlib-compressed, plus the analysis made from it, stamped
+with resume_service.analysis_version().
+
+* On upload, the user's current record supplies the per-section results of
+  its analysis (when it was made with the same analysis version), so a
+  revised resume only re-scans the sections whose text changed.
+* Changing the parser or the taxonomy changes analysis_version() and leaves
+  every current record stale. ``reanalyse_stale`` (driven by
+  ``reanalyse_resumes.py``) re-runs the analysis stages over the stored
+  text in a process pool — the PDF is never read again — and bulk-updates
+  the records and the profiles built from them, a batch at a time.
+* An upload whose analysis ran out of its parse budget (parse_budget.py) is
+  recorded with partial_version(), which is stale from the start, so the
+  next re-analysis run completes it.
+* A profile is only rewritten while it still holds the skills of the
+  record's old analysis; skills the user has changed since are left alone.
+  A partial analysis was never written to the profile (the upload kept the
+  previous one), so completing it always updates the profile.
+
+Storing a record is bookkeeping: failures are logged and swallowed, like
+resume_cache's, and never fail an upload.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.core.logger import get_logger
+from app.database import db
+from app.models.parsed_resume import ParsedResume
+from app.models.user_profile import UserProfile
+
+logger = get_logger(__name__)
+
+
+def partial_version(version: str) -> str:
+    """analysis_version of an analysis cut short by its parse budget: never current, so always re-analysed."""
+    return f"{version}-partial"
+
+
+def is_partial(version: str) -> bool:
+    return version.endswith("-partial")
+
+
+def compress(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8", "surrogatepass"), 6)
+
+
+def decompress(blob: bytes) -> str:
+    return zlib.decompress(blob).decode("utf-8", "surrogatepass")
+
+
+# ---------------------------------------------------------------------------
+# Upload side
+# ---------------------------------------------------------------------------
+
+def previous_sections(user_id: int, version: str) -> Optional[dict]:
+    """The per-section results of the user's current record, if made with *version*."""
+    try:
+        row = (
+            db.session.query(ParsedResume.analysis_json)
+            .filter_by(user_id=user_id, is_current=True, analysis_version=version)
+            .first()
+        )
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"[ParsedResume] Lookup failed for user {user_id}: {e}")
+        return None
+    if row is None:
+        return None
+    return json.loads(row.analysis_json).get("sections")
+
+
+def current_analysis(user_id: int) -> Optional[dict]:
+    """The analysis of the user's current resume, or None."""
+    row = db.session.query(ParsedResume.analysis_json).filter_by(user_id=user_id, is_current=True).first()
+    return json.loads(row.analysis_json) if row else None
+
+
+def store(user_id: int, pdf_sha256: str, analysis: dict, version: str, text: Optional[str] = None) -> bool:
+    """
+    Records an upload and makes it the user's current resume. Without
+    *text* (the analysis came from resume_cache) the compressed text is
+    taken from any record of the same PDF; returns False when there is
+    none, so the caller can extract the text and call again.
+    """
+    try:
+        record = db.session.query(ParsedResume).filter_by(user_id=user_id, pdf_sha256=pdf_sha256).first()
+        if text is not None:
+            text_z, text_length = compress(text), len(text)
+        else:
+            source = record or db.session.query(ParsedResume).filter_by(pdf_sha256=pdf_sha256).first()
+            if source is None:
+                return False
+            text_z, text_length = source.text_z, source.text_length
+
+        now = datetime.now(timezone.utc)
+        values = {
+            "text_z": text_z,
+            "text_length": text_length,
+            "analysis_version": version,
+            "analysis_json": json.dumps(analysis),
+            "is_current": True,
+            "uploaded_at": now,
+            "analysed_at": now,
+        }
+        if record is None:
+            record = ParsedResume(user_id=user_id, pdf_sha256=pdf_sha256, **values)
+            db.session.add(record)
+            db.session.flush()
+        else:
+            for name, value in values.items():
+                setattr(record, name, value)
+
+        db.session.query(ParsedResume).filter(
+            ParsedResume.user_id == user_id,
+            ParsedResume.id != record.id,
+            ParsedResume.is_current.is_(True),
+        ).update({"is_current": False}, synchronize_session=False)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"[ParsedResume] Could not store the upload of user {user_id}: {e}")
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Re-analysis
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ReanalysisSummary:
+    stale: int = 0
+    reanalysed: int = 0
+    failed: int = 0
+    profiles_updated: int = 0
+    seconds: float = 0.0
+
+
+def _init_worker() -> None:
+    logging.disable(logging.INFO)
+
+
+def _reanalyse(text_z: bytes) -> Optional[dict]:
+    """Pool side: the analysis stages over one stored text; None on failure."""
+    from app.services import resume_service
+
+    try:
+        # Offline, without the per-request parse budget.
+        return resume_service._analyse_text(decompress(text_z), budget_seconds=0)
+    except Exception:
+        return None
+
+
+def stale_count(version: str) -> int:
+    return (
+        db.session.query(ParsedResume.id)
+        .filter(ParsedResume.is_current.is_(True), ParsedResume.analysis_version != version)
+        .count()
+    )
+
+
+def _apply(rows: list, analyses: list[Optional[dict]], version: str, summary: ReanalysisSummary) -> None:
+    """Writes one batch: the records, then the profiles still built from their old analysis."""
+    from app.services.user_profile_service import profile_values
+
+    now = datetime.now(timezone.utc)
+    done = [(row, analysis) for row, analysis in zip(rows, analyses) if analysis is not None]
+    summary.failed += len(rows) - len(done)
+    if not done:
+        return
+
+    profiles = {
+        user_id: (profile_id, skills_json)
+        for profile_id, user_id, skills_json in db.session.query(
+            UserProfile.id, UserProfile.user_id, UserProfile.skills_json
+        ).filter(UserProfile.user_id.in_([row.user_id for row, _ in done]))
+    }
+    profile_updates = []
+    for row, analysis in done:
+        profile = profiles.get(row.user_id)
+        old_skills = json.loads(row.analysis_json).get("technical_skills")
+        if profile and (is_partial(row.analysis_version) or profile[1] == (json.dumps(old_skills) if old_skills else None)):
+            profile_updates.append({"id": profile[0], **profile_values(analysis), "updated_at": now})
+
+    db.session.execute(
+        db.update(ParsedResume),
+        [
+            {"id": row.id, "analysis_version": version, "analysis_json": json.dumps(analysis), "analysed_at": now}
+            for row, analysis in done
+        ],
+    )
+    if profile_updates:
+        db.session.execute(db.update(UserProfile), profile_updates)
+    db.session.commit()
+    summary.reanalysed += len(done)
+    summary.profiles_updated += len(profile_updates)
+
+
+def reanalyse_stale(workers: Optional[int] = None, batch_size: int = 200) -> ReanalysisSummary:
+    """
+    Re-analyses every current record whose analysis_version is not the
+    current one, from its stored text. Needs an app context; the analysis
+    itself runs in *workers* processes (inline with workers=1).
+    Records that fail stay stale and are retried by the next run.
+    """
+    from app.services.resume_service import analysis_version
+
+    version = analysis_version()
+    summary = ReanalysisSummary(stale=stale_count(version))
+    logger.info(f"[ParsedResume] {summary.stale} records older than {version}")
+    if not summary.stale:
+        return summary
+
+    workers = workers or os.cpu_count() or 1
+    pool = multiprocessing.Pool(workers, initializer=_init_worker, maxtasksperchild=500) if workers > 1 else None
+    start = time.perf_counter()
+    last_id = 0
+    try:
+        while True:
+            rows = (
+                db.session.query(ParsedResume.id, ParsedResume.user_id, ParsedResume.text_z, ParsedResume.analysis_json,
+                                 ParsedResume.analysis_version)
+                .filter(
+                    ParsedResume.is_current.is_(True),
+                    ParsedResume.analysis_version != version,
+                    ParsedResume.id > last_id,
+                )
+                .order_by(ParsedResume.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            last_id = rows[-1].id
+            texts = [row.text_z for row in rows]
+            analyses = pool.map(_reanalyse, texts, chunksize=4) if pool else [_reanalyse(t) for t in texts]
+            _apply(rows, analyses, version, summary)
+            summary.seconds = time.perf_counter() - start
+            logger.info(
+                f"[ParsedResume] {summary.reanalysed + summary.failed}/{summary.stale} records re-analysed, "
+                f"{summary.profiles_updated} profiles updated ({summary.seconds:.1f}s)"
+            )
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    summary.seconds = time.perf_counter() - start
+    return summary
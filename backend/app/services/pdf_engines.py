@@ -0,0 +1,214 @@
+"""
+pdf_engines.py — Pluggable PDF Text Extraction Engines
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Engines (selected per deployment with PDF_ENGINE):
+
+* ``pdfplumber`` — layout-aware, slow. The historical behaviour.
+* ``pdfium``     — pypdfium2 text extraction, roughly an order of magnitude
+                   faster on plain single-column resumes.
+* ``auto``       — (default) pdfium first; only pages where it returned
+                   little/no text or text that looks garbled are re-read
+                   with pdfplumber.
+
+Every engine implements ``open(raw)``, returning an EngineDocument that
+extracts one page at a time and frees that page's objects straight away.
+*raw* is the PDF as ``bytes`` or as a buffer such as an upload's memory
+map (core/uploads.py); buffers are read in place, never copied whole.
+``extract(raw, start, stop, max_chars)`` builds on it and returns
+``(total_page_count, [page_text, ...])`` for pages [start, stop), stopping
+early once *max_chars* characters have been collected. Engines run inside
+the extraction pool children (services/pdf_extractor.py).
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import unicodedata
+from typing import Union
+
+import pdfplumber
+import pypdfium2 as pdfium
+
+from app.core.uploads import BufferReader
+
+# A page with fewer non-whitespace characters than this is treated as empty
+# (scanned image, vector-outlined text, ...).
+MIN_PAGE_CHARS = 16
+
+# Share of replacement / private-use / control characters above which a page
+# is considered garbled (typically a font without a usable ToUnicode map).
+MAX_GARBLED_RATIO = 0.05
+
+
+def looks_unusable(text: str) -> bool:
+    """True if *text* is too short or too garbled to trust."""
+    visible = [ch for ch in text if not ch.isspace()]
+    if len(visible) < MIN_PAGE_CHARS:
+        return True
+    bad = sum(
+        1 for ch in visible
+        if ch == "\ufffd" or unicodedata.category(ch) in ("Co", "Cc", "Cn")
+    )
+    return bad / len(visible) > MAX_GARBLED_RATIO
+
+
+PdfInput = Union[bytes, bytearray, mmap.mmap]
+
+
+class EngineDocument:
+    """
+    An open PDF. ``page_text(i)`` extracts one page and immediately releases
+    that page's parsed objects, so documents can be streamed page by page.
+    """
+    page_count = 0
+
+    def page_text(self, index: int) -> str:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _PlumberDocument(EngineDocument):
+    def __init__(self, raw: PdfInput):
+        # BytesIO shares a bytes object's memory; other buffers are read in place.
+        self._stream = io.BytesIO(raw) if isinstance(raw, bytes) else BufferReader(raw)
+        try:
+            self._pdf = pdfplumber.open(self._stream)
+        except Exception:
+            self._stream.close()
+            raise
+        self.page_count = len(self._pdf.pages)
+
+    def page_text(self, index: int) -> str:
+        page = self._pdf.pages[index]
+        try:
+            return page.extract_text() or ""
+        finally:
+            # Drop the cached chars/layout objects; otherwise every page
+            # stays materialised until the document is closed.
+            page.close()
+
+    def close(self) -> None:
+        self._pdf.close()
+        self._stream.close()   # pdfplumber leaves caller-supplied streams open
+
+
+class _PdfiumDocument(EngineDocument):
+    def __init__(self, raw: PdfInput):
+        # bytes are loaded in place; other buffers are read block by block
+        # through a reader that is closed (releasing the buffer) with the document.
+        self._reader = None if isinstance(raw, bytes) else BufferReader(raw)
+        try:
+            self._doc = pdfium.PdfDocument(raw if self._reader is None else self._reader)
+        except Exception:
+            if self._reader is not None:
+                self._reader.close()
+            raise
+        self.page_count = len(self._doc)
+
+    def page_text(self, index: int) -> str:
+        page = self._doc[index]
+        textpage = page.get_textpage()
+        try:
+            text = textpage.get_text_bounded()
+        finally:
+            textpage.close()
+            page.close()
+        # pdfium emits CRLF line breaks; the parser expects plain newlines.
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    def close(self) -> None:
+        self._doc.close()
+        if self._reader is not None:
+            self._reader.close()
+
+
+class _AutoDocument(EngineDocument):
+    """pdfium per page; pdfplumber (opened lazily) only for pages pdfium got wrong."""
+
+    def __init__(self, raw: PdfInput):
+        self._raw = raw
+        self._fast = _PdfiumDocument(raw)
+        self._slow: _PlumberDocument | None = None
+        self.page_count = self._fast.page_count
+
+    def page_text(self, index: int) -> str:
+        text = self._fast.page_text(index)
+        if not looks_unusable(text):
+            return text
+        if self._slow is None:
+            self._slow = _PlumberDocument(self._raw)
+        fallback = self._slow.page_text(index)
+        # Keep whichever engine produced more visible text.
+        return fallback if len(fallback.strip()) > len(text.strip()) else text
+
+    def close(self) -> None:
+        self._fast.close()
+        if self._slow is not None:
+            self._slow.close()
+
+
+class PdfEngine:
+    """Interface for extraction engines: ``open`` returns an EngineDocument."""
+    name = ""
+
+    def open(self, raw: PdfInput) -> EngineDocument:
+        raise NotImplementedError
+
+    def extract(self, raw: PdfInput, start: int, stop: int, max_chars: int) -> tuple[int, list[str]]:
+        texts: list[str] = []
+        collected = 0
+        with self.open(raw) as doc:
+            for index in range(start, min(stop, doc.page_count)):
+                text = doc.page_text(index)
+                texts.append(text)
+                collected += len(text)
+                if collected >= max_chars:
+                    break
+            return doc.page_count, texts
+
+
+class PdfplumberEngine(PdfEngine):
+    name = "pdfplumber"
+
+    def open(self, raw: PdfInput) -> EngineDocument:
+        return _PlumberDocument(raw)
+
+
+class PdfiumEngine(PdfEngine):
+    name = "pdfium"
+
+    def open(self, raw: PdfInput) -> EngineDocument:
+        return _PdfiumDocument(raw)
+
+
+class AutoEngine(PdfEngine):
+    """pdfium fast path with per-page pdfplumber fallback."""
+    name = "auto"
+
+    def open(self, raw: PdfInput) -> EngineDocument:
+        try:
+            return _AutoDocument(raw)
+        except Exception:
+            # pdfium rejected the file outright — let pdfplumber have a go.
+            return _PlumberDocument(raw)
+
+
+ENGINES: dict[str, PdfEngine] = {
+    engine.name: engine for engine in (AutoEngine(), PdfiumEngine(), PdfplumberEngine())
+}
+
+
+def get_engine(name: str) -> PdfEngine:
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF engine '{name}'. Choose one of: {', '.join(ENGINES)}")
@@ -0,0 +1,340 @@
+"""
+pdf_extractor.py — Bounded PDF Text Extraction Pool
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+PDF parsing (pdfplumber in particular) is CPU-heavy and can stall for
+seconds on large or pathological PDFs. Running it inside the gunicorn sync worker blocks health checks and
+logins queued behind the upload, so extraction runs in a small pool of
+dedicated child processes instead.
+
+* Pool size, per-job wall-clock timeout, page cap, character cap and a
+  per-child RSS ceiling are all configurable (see core/config.py).
+* A job that overruns its timeout gets its child killed and replaced;
+  the caller sees PdfExtractionTimeout.
+* A child whose peak RSS crosses the ceiling after a job is recycled.
+* Long documents are split into page ranges, extracted on several children
+  in parallel and streamed back in page order (iter_pages). Ranges are
+  dispatched a wave at a time, so a consumer that stops early skips the rest.
+* PDF_POOL_SIZE=0 extracts inline (handy for scripts and local debugging).
+* The extraction engine itself is pluggable (PDF_ENGINE, pdf_engines.py).
+
+Each gunicorn worker lazily owns its own pool; children are created on the
+first upload that worker serves. They are started with "spawn", never fork:
+by then the worker runs threads (the LLM fan-out pool, cache locks, logging
+handlers), and a forked child can deadlock on a lock held at fork time.
+Children only need the PDF path or bytes, so a fresh interpreter costs
+nothing but start-up time.
+"""
+
+from __future__ import annotations
+
+import atexit
+import mmap
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from typing import Iterator, Optional
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.services import pdf_engines
+from app.services.pdf_engines import PdfInput
+
+try:
+    import resource
+except ImportError:  # Windows — RSS-based recycling is disabled
+    resource = None
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class PdfExtractionError(Exception):
+    """The PDF could not be parsed, or its worker died mid-job."""
+
+
+class PdfExtractionTimeout(PdfExtractionError):
+    """A page-range job overran settings.pdf_job_timeout_seconds."""
+
+
+# ---------------------------------------------------------------------------
+# Child side
+# ---------------------------------------------------------------------------
+
+def _extract_range(source, start: int, stop: int, max_chars: int, engine: str) -> tuple[int, list[str]]:
+    """
+    Extracts pages [start, stop) of *source* with the named engine
+    (services/pdf_engines.py). Returns (total_page_count, page_texts).
+    *source* is the PDF bytes, or the path of a spooled upload, which is
+    mapped here rather than sent through the pipe.
+    """
+    if not isinstance(source, str):
+        return pdf_engines.get_engine(engine).extract(source, start, stop, max_chars)
+    with open(source, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return pdf_engines.get_engine(engine).extract(view, start, stop, max_chars)
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux but bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _worker_main(conn) -> None:
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if job is None:
+            return
+        try:
+            reply = ("ok", _extract_range(*job))
+        except Exception as exc:
+            reply = ("error", str(exc))
+        conn.send((reply, _peak_rss_mb()))
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+class _Worker:
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1)
+
+
+class ExtractionPool:
+    """Fixed-size pool of extraction children with per-job timeouts and RSS recycling."""
+
+    def __init__(self, size: int, timeout: float, max_rss_mb: int):
+        self.size = size
+        self.timeout = timeout
+        self.max_rss_mb = max_rss_mb
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: list[_Worker] = [_Worker(self._ctx) for _ in range(size)]
+        self._cond = threading.Condition()
+        self._closed = False
+        # Request threads and resume_worker job threads share the pool; /metrics reads the counters.
+        self._stats_lock = threading.Lock()
+        self._stats = {"jobs": 0, "timeouts": 0, "errors": 0, "recycled": 0}
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict:
+        """A copy of the counters, taken under their lock."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    # -- worker bookkeeping --------------------------------------------------
+
+    def _acquire(self, wanted: int, deadline: float) -> list[_Worker]:
+        """Blocks for at least one idle worker, then takes up to *wanted*."""
+        with self._cond:
+            while not self._idle:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    raise PdfExtractionTimeout("no extraction worker became available in time")
+                self._cond.wait(remaining)
+            taken, self._idle = self._idle[:wanted], self._idle[wanted:]
+            return taken
+
+    def _release(self, workers: list[_Worker]) -> None:
+        with self._cond:
+            if self._closed:
+                for w in workers:
+                    w.kill()
+                return
+            self._idle.extend(workers)
+            self._cond.notify_all()
+
+    def _replace(self, worker: _Worker, reason: str) -> _Worker:
+        worker.kill()
+        self._count("recycled")
+        logger.info(f"[PdfExtractor] Recycled worker pid={worker.process.pid}: {reason}")
+        return _Worker(self._ctx)
+
+    # -- job execution -------------------------------------------------------
+
+    def _collect(self, worker: _Worker, deadline: float):
+        """
+        Waits for *worker*'s reply until *deadline*.
+        Returns (worker_to_return_to_pool, failure_or_None, payload).
+        """
+        if not worker.conn.poll(max(0.0, deadline - time.monotonic())):
+            self._count("timeouts")
+            failure = PdfExtractionTimeout(f"PDF processing exceeded {self.timeout:g}s")
+            return self._replace(worker, "job timed out"), failure, None
+        try:
+            (status, payload), rss_mb = worker.conn.recv()
+        except (EOFError, OSError) as exc:
+            self._count("errors")
+            return self._replace(worker, "worker died"), PdfExtractionError(f"extraction worker died: {exc}"), None
+
+        self._count("jobs")
+        if self.max_rss_mb and rss_mb > self.max_rss_mb:
+            worker = self._replace(worker, f"peak RSS {rss_mb:.0f} MB")
+        if status != "ok":
+            self._count("errors")
+            return worker, PdfExtractionError(payload), None
+        return worker, None, payload
+
+    def run(self, jobs: list[tuple]) -> list[tuple[int, list[str]]]:
+        """Runs *jobs* (``_extract_range`` argument tuples) and returns results in job order."""
+        results: list = [None] * len(jobs)
+        pending = list(range(len(jobs)))
+        while pending:
+            workers = self._acquire(len(pending), time.monotonic() + self.timeout)
+            wave, pending = pending[:len(workers)], pending[len(workers):]
+            returned: list[_Worker] = []
+            failure: Optional[PdfExtractionError] = None
+            try:
+                deadline = time.monotonic() + self.timeout
+                for worker, idx in zip(workers, wave):
+                    worker.conn.send(jobs[idx])
+                for worker, idx in zip(workers, wave):
+                    if failure is not None:
+                        # The document already failed — don't wait on the rest of the wave.
+                        returned.append(self._replace(worker, "wave aborted"))
+                        continue
+                    worker, failure, results[idx] = self._collect(worker, deadline)
+                    returned.append(worker)
+            except BaseException as exc:
+                self._release([self._replace(w, "wave failed") for w in workers])
+                if isinstance(exc, OSError):
+                    raise PdfExtractionError(f"extraction worker unavailable: {exc}") from exc
+                raise
+            self._release(returned)
+            if failure is not None:
+                raise failure
+        return results
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            worker.kill()
+
+
+_pool: Optional[ExtractionPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ExtractionPool:
+    """Per-process pool, created lazily (and re-created after a fork)."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ExtractionPool(
+                size=settings.pdf_pool_size,
+                timeout=settings.pdf_job_timeout_seconds,
+                max_rss_mb=settings.pdf_worker_max_rss_mb,
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+@atexit.register
+def _shutdown_pool() -> None:
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.close()
+
+
+def pool_stats() -> dict:
+    if _pool is None or _pool_pid != os.getpid():
+        return {"size": settings.pdf_pool_size, "started": False}
+    return {"size": _pool.size, "started": True, **_pool.stats()}
+
+
+def _job_source(raw: PdfInput):
+    """What a child is sent: the upload's path when it is a mapped file, else the bytes."""
+    path = getattr(raw, "path", None)
+    if path:
+        return path
+    return raw if isinstance(raw, bytes) else bytes(raw)
+
+
+def _iter_chunks(raw: PdfInput, engine: str) -> Iterator[list[str]]:
+    """
+    Yields page texts in page order, in chunks. Work is only dispatched once
+    the previous chunk has been consumed, so a caller that stops iterating
+    never pays for the remaining pages.
+    """
+    max_pages = settings.pdf_max_pages
+    max_chars = settings.pdf_max_chars
+    per_job   = max(1, settings.pdf_pages_per_job)
+
+    if settings.pdf_pool_size <= 0:
+        with pdf_engines.get_engine(engine).open(raw) as doc:
+            if doc.page_count > max_pages:
+                logger.warning(f"[PdfExtractor] {doc.page_count} pages — only the first {max_pages} will be read.")
+            for index in range(min(doc.page_count, max_pages)):
+                yield [doc.page_text(index)]
+        return
+
+    pool = _get_pool()
+    source = _job_source(raw)
+    page_count, first = pool.run([(source, 0, min(per_job, max_pages), max_chars, engine)])[0]
+    if page_count > max_pages:
+        logger.warning(f"[PdfExtractor] {page_count} pages — only the first {max_pages} will be read.")
+    yield first
+
+    # Remaining page ranges go out one wave (one range per child) at a time.
+    limit  = min(page_count, max_pages)
+    starts = list(range(per_job, limit, per_job))
+    for i in range(0, len(starts), pool.size):
+        jobs = [(source, start, min(start + per_job, limit), max_chars, engine)
+                for start in starts[i:i + pool.size]]
+        for _, chunk in pool.run(jobs):
+            yield chunk
+
+
+def iter_pages(raw: PdfInput, engine: Optional[str] = None) -> Iterator[str]:
+    """
+    Streams the text of *raw* (PDF bytes or a mapped upload) one page at a time with *engine*
+    (default: settings.pdf_engine), honouring the page and character caps.
+    Long documents are fanned out across the pool by page range and yielded
+    back in order; stop iterating to skip the remaining pages.
+    Raises PdfExtractionError / PdfExtractionTimeout.
+    """
+    engine = (engine or settings.pdf_engine).lower()
+    pdf_engines.get_engine(engine)   # fail fast on a misconfigured PDF_ENGINE
+
+    max_chars = settings.pdf_max_chars
+    collected = 0
+    for chunk in _iter_chunks(raw, engine):
+        for text in chunk:
+            if collected + len(text) > max_chars:
+                logger.warning(f"[PdfExtractor] Text truncated at {max_chars} chars.")
+                yield text[:max_chars - collected]
+                return
+            collected += len(text)
+            yield text
+
+
+def extract_text(raw: PdfInput, engine: Optional[str] = None) -> str:
+    """Extracts the whole (capped) text of *raw*; see iter_pages."""
+    return "\n".join(iter_pages(raw, engine))[:settings.pdf_max_chars]
@@ -0,0 +1,297 @@
+"""
+question_bank_service.py — Indexed Interview Question Bank
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Curated questions live in the ``question_bank`` table (models/question_bank.py)
+and are served from an in-memory QuestionBankIndex keyed by
+(skill, difficulty, type), so picking questions for a skill costs time
+proportional to the questions taken, not to the size of the bank.
+
+* Each worker loads the index lazily and re-checks the table's signature
+  (row count + latest updated_at) every QUESTION_BANK_REFRESH_SECONDS, so
+  edits made by authoring tools show up without a restart.
+* While the table is empty or unavailable (fresh install, scripts without an
+  app context) the index is built from resume_service.QUESTION_BANK, which
+  is also what ``load_question_bank.py`` imports.
+* Difficulty bands come from years of experience (difficulty_for); a skill
+  with no questions at the requested band falls back to the nearest bands.
+  Seeded questions are "mid", so every band sees them.
+* ``search`` is a token-level full-text search (AND of all terms, prefix
+  match on the last one) for authoring tools.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import re
+import threading
+import time
+from typing import Iterable, NamedTuple, Optional
+
+from flask import has_app_context
+from sqlalchemy import func
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.database import db
+from app.models.question_bank import QuestionBankEntry
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+DIFFICULTIES = ("junior", "mid", "senior")
+SEED_DIFFICULTY = "mid"
+
+# Bands tried, in order, when selecting questions for a requested band.
+_FALLBACK_ORDER = {
+    "junior": ("junior", "mid", "senior"),
+    "mid":    ("mid", "junior", "senior"),
+    "senior": ("senior", "mid", "junior"),
+}
+
+# Keeps tokens such as "c++", "c#" and "node.js" whole.
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def difficulty_for(experience: Optional[int]) -> str:
+    """Maps years of experience to a difficulty band."""
+    years = experience or 0
+    if years < 2:
+        return "junior"
+    if years < 5:
+        return "mid"
+    return "senior"
+
+
+def _tokens(text: str) -> list[str]:
+    return [t for t in (m.rstrip(".") for m in _TOKEN_RE.findall(text.lower())) if t]
+
+
+class BankRow(NamedTuple):
+    id: int
+    skill: str
+    difficulty: str
+    type: str
+    text: str
+    parent_id: Optional[int]
+
+
+class QuestionBankIndex:
+    """Immutable in-memory view of the question bank."""
+
+    def __init__(self, rows: Iterable[BankRow], source: str):
+        self.source = source
+        self._rows: dict[int, BankRow] = {}
+        self._by_key: dict[tuple[str, str, str], list[int]] = {}
+        self._follow_up: dict[int, int] = {}
+        self._postings: dict[str, set[int]] = {}
+        for row in rows:
+            self._rows[row.id] = row
+            self._by_key.setdefault((row.skill.lower(), row.difficulty, row.type), []).append(row.id)
+            if row.type == "follow_up" and row.parent_id is not None:
+                self._follow_up.setdefault(row.parent_id, row.id)
+            for token in set(_tokens(row.text)) | set(_tokens(row.skill)):
+                self._postings.setdefault(token, set()).add(row.id)
+        self._vocabulary = sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def pairs(self, skill: str, difficulty: str, limit: Optional[int] = None) -> list[dict[str, str]]:
+        """
+        Complete ``{"main", "follow_up"}`` pairs for *skill*, requested band
+        first, then the fallback bands; at most *limit* of them.
+        """
+        out: list[dict[str, str]] = []
+        key = skill.lower()
+        for band in _FALLBACK_ORDER.get(difficulty, DIFFICULTIES):
+            for main_id in self._by_key.get((key, band, "main"), ()):
+                follow_id = self._follow_up.get(main_id)
+                if follow_id is None:
+                    continue
+                out.append({"main": self._rows[main_id].text, "follow_up": self._rows[follow_id].text})
+                if limit is not None and len(out) >= limit:
+                    return out
+        return out
+
+    def _matching(self, token: str, prefix: bool) -> set[int]:
+        if not prefix:
+            return self._postings.get(token, set())
+        hits: set[int] = set()
+        i = bisect.bisect_left(self._vocabulary, token)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(token):
+            hits |= self._postings[self._vocabulary[i]]
+            i += 1
+        return hits
+
+    def search(self, query: str, skill: Optional[str] = None, difficulty: Optional[str] = None,
+               type: Optional[str] = None, limit: int = 20) -> list[dict]:
+        """
+        Entries containing every term of *query* (the last term also matches
+        as a prefix), optionally filtered. Entries whose skill matches a term
+        rank first, then shorter questions.
+        """
+        terms = _tokens(query)
+        if not terms:
+            return []
+        postings = [self._matching(t, prefix=(i == len(terms) - 1)) for i, t in enumerate(terms)]
+        postings.sort(key=len)
+        hits = set(postings[0])
+        for posting in postings[1:]:
+            hits &= posting
+            if not hits:
+                return []
+
+        skill_key = skill.lower() if skill else None
+        rows = [
+            row for row in (self._rows[i] for i in hits)
+            if (skill_key is None or row.skill.lower() == skill_key)
+            and (difficulty is None or row.difficulty == difficulty)
+            and (type is None or row.type == type)
+        ]
+        term_set = set(terms)
+        ranked = heapq.nsmallest(limit, rows, key=lambda r: (not (set(_tokens(r.skill)) & term_set), len(r.text), r.id))
+        return [row._asdict() for row in ranked]
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+def _seed_rows() -> list[BankRow]:
+    from app.services.resume_service import QUESTION_BANK
+
+    rows: list[BankRow] = []
+    for skill, pairs in QUESTION_BANK.items():
+        for pair in pairs:
+            main_id = len(rows) + 1
+            rows.append(BankRow(main_id, skill, SEED_DIFFICULTY, "main", pair["main"], None))
+            rows.append(BankRow(main_id + 1, skill, SEED_DIFFICULTY, "follow_up", pair["follow_up"], main_id))
+    return rows
+
+
+_seed_index: Optional[QuestionBankIndex] = None
+_index: Optional[QuestionBankIndex] = None
+_signature: Optional[tuple] = None
+_checked_at = 0.0
+_loads = 0
+_lock = threading.Lock()
+
+
+def _get_seed_index() -> QuestionBankIndex:
+    global _seed_index
+    if _seed_index is None:
+        _seed_index = QuestionBankIndex(_seed_rows(), source="seed")
+    return _seed_index
+
+
+def _load_from_db() -> QuestionBankIndex:
+    rows = (
+        db.session.query(
+            QuestionBankEntry.id, QuestionBankEntry.skill, QuestionBankEntry.difficulty,
+            QuestionBankEntry.type, QuestionBankEntry.text, QuestionBankEntry.parent_id,
+        )
+        .filter(QuestionBankEntry.active.is_(True))
+        .order_by(QuestionBankEntry.id)
+        .all()
+    )
+    return QuestionBankIndex((BankRow(*row) for row in rows), source="db")
+
+
+def get_index() -> QuestionBankIndex:
+    """The current index: the DB bank when it has entries, otherwise the seed dict."""
+    global _index, _signature, _checked_at, _loads
+    if not has_app_context():
+        return _get_seed_index()
+
+    now = time.monotonic()
+    if _index is not None and now - _checked_at < settings.question_bank_refresh_seconds:
+        return _index
+
+    with _lock:
+        if _index is not None and now - _checked_at < settings.question_bank_refresh_seconds:
+            return _index
+        try:
+            signature = tuple(
+                db.session.query(func.count(QuestionBankEntry.id), func.max(QuestionBankEntry.updated_at)).one()
+            )
+            if signature != _signature:
+                _index = _load_from_db() if signature[0] else _get_seed_index()
+                _signature = signature
+                _loads += 1
+                logger.info(f"[QuestionBank] Loaded {len(_index)} entries from {_index.source}")
+        except Exception as e:
+            db.session.rollback()
+            if _index is None:
+                logger.warning(f"[QuestionBank] Question bank table unavailable, using the seed bank: {e}")
+                _index = _get_seed_index()
+        _checked_at = now
+        return _index
+
+
+def stats() -> dict:
+    index = _index or _seed_index
+    return {
+        "source": index.source if index else None,
+        "entries": len(index) if index else 0,
+        "loads": _loads,
+    }
+
+
+def import_pairs(pairs: Iterable[dict], source: str, batch_size: int = 1000) -> tuple[int, int]:
+    """
+    Imports ``{"skill", "main", "follow_up", "difficulty"?}`` pairs (difficulty
+    defaults to SEED_DIFFICULTY). Pairs whose main question already exists for
+    the same skill and difficulty are skipped, so re-running is safe.
+    Returns (imported, skipped).
+    """
+    existing = set(
+        db.session.query(QuestionBankEntry.skill_key, QuestionBankEntry.difficulty, QuestionBankEntry.text)
+        .filter(QuestionBankEntry.type == "main")
+        .all()
+    )
+    imported = skipped = 0
+    batch: list[dict] = []
+
+    def flush() -> None:
+        mains = [
+            QuestionBankEntry(skill=p["skill"], skill_key=p["skill"].lower(), difficulty=p["difficulty"],
+                              type="main", text=p["main"], source=source)
+            for p in batch
+        ]
+        db.session.add_all(mains)
+        db.session.flush()   # assigns ids for parent_id
+        db.session.add_all(
+            QuestionBankEntry(skill=p["skill"], skill_key=p["skill"].lower(), difficulty=p["difficulty"],
+                              type="follow_up", text=p["follow_up"], parent_id=main.id, source=source)
+            for p, main in zip(batch, mains)
+        )
+        db.session.commit()
+        batch.clear()
+
+    for pair in pairs:
+        difficulty = pair.get("difficulty") or SEED_DIFFICULTY
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty '{difficulty}' for skill '{pair['skill']}'")
+        key = (pair["skill"].lower(), difficulty, pair["main"])
+        if key in existing:
+            skipped += 1
+            continue
+        existing.add(key)
+        batch.append({**pair, "difficulty": difficulty})
+        imported += 1
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return imported, skipped
+
+
+def seed_pairs() -> list[dict]:
+    """resume_service.QUESTION_BANK flattened into import_pairs input."""
+    from app.services.resume_service import QUESTION_BANK
+
+    return [
+        {"skill": skill, "main": pair["main"], "follow_up": pair["follow_up"], "difficulty": SEED_DIFFICULTY}
+        for skill, pairs in QUESTION_BANK.items() for pair in pairs
+    ]
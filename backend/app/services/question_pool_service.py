@@ -0,0 +1,387 @@
+"""
+question_pool_service.py — Pre-Generated Question Pools
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Question generation used to wait on a live Gemini call for every resume and
+every preferences request, although most users share a handful of roles
+and skill combinations. Question pairs are now generated ahead of time
+into pools keyed by (role, skill, experience band) — models/question_pool.py
+— and live requests assemble their questions from them.
+
+* ``assemble`` takes the question plan _generate_questions builds (weak,
+  primary and secondary skills and their shares) and picks that many pairs
+  from the matching pools, least-served first, in a few indexed queries.
+  When the pools cannot cover the plan it returns None and the
+  caller makes the live Gemini call as before.
+* Every request records which pools it wanted (``requests``), creating the
+  missing ones, so the pools users actually need get built first.
+* A pair is retired once served QUESTION_POOL_MAX_SERVES times, which
+  drains pools as they are used. ``question_pool_worker.py`` runs
+  ``run_builder``: it tops every pool up to QUESTION_POOL_DEPTH live pairs,
+  in demand order, generating through llm_service.generate_pool_questions
+  (concurrently, via llm_fanout) and dropping near-duplicates of pairs the
+  pool already has. ``seed_pools`` creates the pools of every ROLE_PRIORITIES
+  role up front.
+
+QUESTION_POOL_DEPTH=0 turns pools off; without GEMINI_API_KEY they are not
+used either (questions come from the static bank). Pool failures are logged and
+swallowed — the live path always remains.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from functools import partial
+from typing import Optional
+
+from flask import has_app_context
+from sqlalchemy import case, func
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.database import db
+from app.models.question_pool import QuestionPool, QuestionPoolPair
+from app.services import llm_fanout, llm_service, question_bank_service
+from app.services.circuit_breaker import HALF_OPEN, OPEN
+from app.services.near_duplicates import NearDuplicateIndex
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+MAX_ROLE_LENGTH = 60
+
+# Pools one request records demand for; later skills in the plan are ignored.
+MAX_POOLS_PER_REQUEST = 15
+
+# Pairs asked of Gemini per pool per build, and pools built per cycle.
+MAX_PAIRS_PER_BUILD = 6
+POOLS_PER_CYCLE = 8
+BUILD_DEADLINE_SECONDS = 60
+
+# Pools whose last builds all produced nothing are retried last.
+MAX_BUILD_FAILURES = 3
+
+_counters_lock = threading.Lock()
+_counters = {"requests": 0, "hits": 0, "misses": 0, "pairs_served": 0, "pairs_built": 0, "errors": 0}
+
+
+def _count(**deltas: int) -> None:
+    with _counters_lock:
+        for name, delta in deltas.items():
+            _counters[name] += delta
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def role_key(role: Optional[str]) -> str:
+    """Pool key of an applied role; "" when none was given."""
+    return (role or "").strip()[:MAX_ROLE_LENGTH]
+
+
+def _pair_plan(question_plan: dict, pairs: int) -> list[tuple[list[str], int]]:
+    """(skills, pair quota) per group, weak first — the shares llm_service.generate_questions asks for."""
+    dist = question_plan.get("distribution", {})
+    weak = max(1, dist.get("weak", 0) // 2) if dist.get("weak", 0) > 0 else 0
+    primary = max(1, dist.get("primary", 0) // 2) if dist.get("primary", 0) > 0 else 0
+    secondary = max(0, pairs - weak - primary)
+    return [
+        (question_plan.get("weak_skills", []), weak),
+        (question_plan.get("primary_skills", []), primary),
+        (question_plan.get("secondary_skills", []), secondary),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Live side
+# ---------------------------------------------------------------------------
+
+def assemble(question_plan: dict, role: Optional[str], experience: int, count: int) -> Optional[list[dict]]:
+    """
+    *count* questions (main / follow-up pairs) for *question_plan* from the
+    pools, or None on a pool miss. Marks the pairs served and records the
+    demand for every pool the plan touches.
+    """
+    if settings.question_pool_depth <= 0 or not settings.gemini_api_key or not has_app_context():
+        return None
+    role = role_key(role)
+    band = question_bank_service.difficulty_for(experience)
+    plan = _pair_plan(question_plan, count // 2)
+    skills = {s.lower(): s for group, _ in plan for s in group}
+    wanted = dict(list(skills.items())[:MAX_POOLS_PER_REQUEST])
+    _count(requests=1)
+
+    try:
+        pools = {
+            pool.skill_key: pool
+            for pool in db.session.query(QuestionPool.id, QuestionPool.skill_key, QuestionPool.skill)
+            .filter(QuestionPool.role == role, QuestionPool.band == band, QuestionPool.skill_key.in_(list(wanted)))
+        }
+        available: dict[int, list] = {}
+        if pools:
+            rows = (
+                db.session.query(QuestionPoolPair.id, QuestionPoolPair.pool_id, QuestionPoolPair.main,
+                                 QuestionPoolPair.follow_up)
+                .filter(QuestionPoolPair.pool_id.in_([p.id for p in pools.values()]),
+                        QuestionPoolPair.retired.is_(False))
+                .order_by(QuestionPoolPair.served_count, QuestionPoolPair.id)
+                .all()
+            )
+            for row in rows:
+                available.setdefault(row.pool_id, []).append(row)
+
+        chosen = _choose(plan, pools, available, count // 2)
+        hit = len(chosen) >= count // 2
+        if hit:
+            _mark_served([row.id for _, row in chosen])
+            db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        _count(errors=1)
+        logger.warning(f"[QuestionPools] assembly failed: {e}")
+        return None
+
+    try:
+        _record_demand(role, band, wanted, pools)
+        db.session.commit()
+    except Exception as e:
+        # Most likely a concurrent request created the same pool first.
+        db.session.rollback()
+        logger.info(f"[QuestionPools] demand not recorded: {e}")
+
+    if not hit:
+        _count(misses=1)
+        return None
+    _count(hits=1, pairs_served=len(chosen))
+    questions = []
+    for skill, row in chosen:
+        questions.append({"question": row.main, "category": skill, "type": "main"})
+        questions.append({"question": row.follow_up, "category": skill, "type": "follow_up"})
+    return questions[:count]
+
+
+def _choose(plan, pools: dict, available: dict[int, list], pairs: int) -> list[tuple[str, object]]:
+    """Pairs for each group's quota, round-robin over its skills; leftovers from any skill in plan order."""
+    chosen: list[tuple[str, object]] = []
+    queues = {key: available.get(pool.id, []) for key, pool in pools.items()}
+
+    def take(group: list[str], quota: int) -> None:
+        while quota > 0 and len(chosen) < pairs:
+            progressed = False
+            for skill in group:
+                queue = queues.get(skill.lower())
+                if queue and quota > 0 and len(chosen) < pairs:
+                    chosen.append((pools[skill.lower()].skill, queue.pop(0)))
+                    quota -= 1
+                    progressed = True
+            if not progressed:
+                return
+
+    for group, quota in plan:
+        take(group, quota)
+    take([s for group, _ in plan for s in group], pairs - len(chosen))
+    return chosen
+
+
+def _record_demand(role: str, band: str, wanted: dict[str, str], pools: dict) -> None:
+    now = _now()
+    if pools:
+        (
+            db.session.query(QuestionPool)
+            .filter(QuestionPool.id.in_([p.id for p in pools.values()]))
+            .update({QuestionPool.requests: QuestionPool.requests + 1, QuestionPool.last_requested_at: now},
+                    synchronize_session=False)
+        )
+    for key, skill in wanted.items():
+        if key not in pools:
+            db.session.add(QuestionPool(role=role, skill=skill, skill_key=key, band=band, requests=1,
+                                        last_requested_at=now))
+
+
+def _mark_served(pair_ids: list[int]) -> None:
+    (
+        db.session.query(QuestionPoolPair)
+        .filter(QuestionPoolPair.id.in_(pair_ids))
+        .update({QuestionPoolPair.served_count: QuestionPoolPair.served_count + 1}, synchronize_session=False)
+    )
+    (
+        db.session.query(QuestionPoolPair)
+        .filter(QuestionPoolPair.id.in_(pair_ids),
+                QuestionPoolPair.served_count >= settings.question_pool_max_serves)
+        .update({QuestionPoolPair.retired: True}, synchronize_session=False)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Builder side
+# ---------------------------------------------------------------------------
+
+def _depths():
+    """Subquery: pool_id -> live (unretired) pairs."""
+    return (
+        db.session.query(QuestionPoolPair.pool_id.label("pool_id"), func.count(QuestionPoolPair.id).label("depth"))
+        .filter(QuestionPoolPair.retired.is_(False))
+        .group_by(QuestionPoolPair.pool_id)
+        .subquery()
+    )
+
+
+def pools_to_build(limit: int = POOLS_PER_CYCLE) -> list[tuple[QuestionPool, int]]:
+    """(pool, live depth) of the pools below QUESTION_POOL_DEPTH, most requested first."""
+    depths = _depths()
+    depth = func.coalesce(depths.c.depth, 0)
+    return (
+        db.session.query(QuestionPool, depth)
+        .outerjoin(depths, depths.c.pool_id == QuestionPool.id)
+        .filter(depth < settings.question_pool_depth)
+        .order_by(
+            (QuestionPool.build_failures >= MAX_BUILD_FAILURES),
+            QuestionPool.requests.desc(),
+            QuestionPool.last_built_at.is_(None).desc(),
+            QuestionPool.last_built_at,
+            QuestionPool.id,
+        )
+        .limit(limit)
+        .all()
+    )
+
+
+def build_once(limit: int = POOLS_PER_CYCLE) -> int:
+    """
+    Tops up to *limit* pools; returns the pairs added. Call inside an app
+    context. Builds nothing while Gemini's circuit breaker is open, and only
+    one pool while it is probing, so an outage is not charged to the pools
+    as build failures.
+    """
+    from app.services.resume_service import DUPLICATE_SIMILARITY
+
+    state = llm_service.breaker.state
+    if state == OPEN:
+        return 0
+    if state == HALF_OPEN:
+        limit = 1
+    targets = pools_to_build(limit)
+    if not targets:
+        return 0
+    existing = {
+        pool.id: [main for (main,) in db.session.query(QuestionPoolPair.main).filter(QuestionPoolPair.pool_id == pool.id)]
+        for pool, _ in targets
+    }
+    generated = llm_fanout.run(
+        [
+            partial(llm_service.generate_pool_questions, pool.role, pool.skill, pool.band,
+                    min(MAX_PAIRS_PER_BUILD, settings.question_pool_depth - depth), existing[pool.id])
+            for pool, depth in targets
+        ],
+        fallback=lambda _: [],
+        until=llm_fanout.deadline(BUILD_DEADLINE_SECONDS),
+    )
+
+    added = 0
+    now = _now()
+    for (pool, _), pairs in zip(targets, generated):
+        seen = NearDuplicateIndex(DUPLICATE_SIMILARITY)
+        for main in existing[pool.id]:
+            seen.add_if_new(main)
+        new = [
+            QuestionPoolPair(pool_id=pool.id, main=q["main_question"].strip(), follow_up=q["follow_up_question"].strip())
+            for q in pairs
+            if q["main_question"].strip() and q["follow_up_question"].strip() and seen.add_if_new(q["main_question"].strip())
+        ]
+        db.session.add_all(new)
+        pool.last_built_at = now
+        pool.build_failures = 0 if new else pool.build_failures + 1
+        added += len(new)
+    db.session.commit()
+    _count(pairs_built=added)
+    logger.info(f"[QuestionPools] Built {added} pairs into {len(targets)} pools")
+    return added
+
+
+def run_builder(once: bool = False) -> None:
+    """
+    Builder loop; call inside an app context. With *once*, fills every pool
+    it can and returns instead of polling forever.
+    """
+    if not settings.gemini_api_key:
+        logger.warning("[QuestionPools] GEMINI_API_KEY not set; nothing to build pools with.")
+        return
+    logger.info("[QuestionPools] Builder started")
+    while True:
+        try:
+            added = build_once()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"[QuestionPools] build failed: {e}")
+            added = 0
+        if not added:
+            if once:
+                return
+            time.sleep(settings.question_pool_poll_seconds)
+
+
+def seed_pools() -> int:
+    """Creates the (role, skill, band) pools of every ROLE_PRIORITIES role; returns how many were new."""
+    from app.services.resume_service import ROLE_PRIORITIES, TECH_SKILLS_DB
+
+    existing = set(db.session.query(QuestionPool.role, QuestionPool.skill_key, QuestionPool.band).all())
+    created = 0
+    for role, categories in ROLE_PRIORITIES.items():
+        for category in categories:
+            for skill in TECH_SKILLS_DB.get(category, []):
+                for band in question_bank_service.DIFFICULTIES:
+                    if (role, skill.lower(), band) in existing:
+                        continue
+                    existing.add((role, skill.lower(), band))
+                    db.session.add(QuestionPool(role=role, skill=skill, skill_key=skill.lower(), band=band))
+                    created += 1
+    db.session.commit()
+    return created
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+def _depth_summary() -> dict:
+    if not has_app_context():
+        return {}
+    try:
+        depths = _depths()
+        depth = func.coalesce(depths.c.depth, 0)
+        pools, pairs, below, empty = (
+            db.session.query(
+                func.count(QuestionPool.id),
+                func.coalesce(func.sum(depth), 0),
+                func.coalesce(func.sum(case((depth < settings.question_pool_depth, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((depth == 0, 1), else_=0)), 0),
+            )
+            .outerjoin(depths, depths.c.pool_id == QuestionPool.id)
+            .one()
+        )
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"[QuestionPools] depth query failed: {e}")
+        return {}
+    return {
+        "pools": int(pools),
+        "live_pairs": int(pairs),
+        "pools_below_depth": int(below),
+        "empty_pools": int(empty),
+        "mean_depth": round(int(pairs) / int(pools), 2) if pools else 0.0,
+    }
+
+
+def stats() -> dict:
+    """This worker's hit/miss counters and the pools' current depth."""
+    with _counters_lock:
+        counters = dict(_counters)
+    lookups = counters["hits"] + counters["misses"]
+    return {
+        **counters,
+        "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+        "target_depth": settings.question_pool_depth,
+        **_depth_summary(),
+    }
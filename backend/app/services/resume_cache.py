@@ -0,0 +1,204 @@
+"""
+resume_cache.py — Content-Addressed Parsed-Resume Cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Two tiers, keyed by sha256(PDF bytes) + analysis version:
+
+* L1 — bounded in-process LRU (per gunicorn worker).
+* L2 — the ``parsed_resume_cache`` table, shared by all workers and
+  surviving restarts. L2 hits are promoted into L1.
+
+Only the user-independent analysis (skills, experience, roles, unknown
+skills) is cached; question generation always runs per request. Because
+the analysis version is part of the key, bumping the parser or taxonomy
+simply stops old rows from matching.
+
+L2 hits are counted in memory and added to the rows' ``hit_count`` /
+``last_hit_at`` in batches, on a connection of their own (_HitBuffer): a
+lookup never writes, and never commits the request's session.
+
+Cache failures are logged and swallowed — they must never fail an upload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import bindparam, update
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.database import db
+from app.models.resume_cache import ParsedResumeCache
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class _LRUCache:
+    """Thread-safe bounded LRU mapping of cache_key -> analysis dict."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: dict) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _HitBuffer:
+    """
+    Pending L2 hit counts of one cache table (cache_key -> hits, last hit).
+    Flushed by the hit that makes *flush_every* pending, or by the first hit
+    *flush_seconds* after the oldest pending one, as one batched UPDATE in
+    its own transaction. Counts still
+    pending when the process exits are lost; they are statistics only.
+    """
+
+    def __init__(self, model, tag: str, flush_every: int = 50, flush_seconds: float = 60.0):
+        self.model = model
+        self.tag = tag
+        self.flush_every = flush_every
+        self.flush_seconds = flush_seconds
+        self._pending: dict[str, list] = {}
+        self._hits = 0
+        self._since = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, key: str) -> None:
+        with self._lock:
+            entry = self._pending.setdefault(key, [0, None])
+            entry[0] += 1
+            entry[1] = datetime.now(timezone.utc)
+            if self._hits == 0:
+                self._since = time.monotonic()
+            self._hits += 1
+            due = self._hits >= self.flush_every or time.monotonic() - self._since >= self.flush_seconds
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Writes the pending counts; returns how many rows were updated. Needs an app context."""
+        with self._lock:
+            pending, self._pending, self._hits = self._pending, {}, 0
+        if not pending:
+            return 0
+        table = self.model
+        statement = (
+            update(table)
+            .where(table.cache_key == bindparam("k"))
+            .values(hit_count=table.hit_count + bindparam("n"), last_hit_at=bindparam("t"))
+        )
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(statement, [{"k": k, "n": n, "t": t} for k, (n, t) in pending.items()])
+        except Exception as e:
+            logger.warning(f"[{self.tag}] hit count flush failed: {e}")
+            return 0
+        return len(pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+_memory = _LRUCache(settings.resume_cache_size)
+_hits = _HitBuffer(ParsedResumeCache, "ResumeCache")
+_counters = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0, "errors": 0}
+_counters_lock = threading.Lock()
+
+
+def _count(name: str) -> None:
+    with _counters_lock:
+        _counters[name] += 1
+
+
+def cache_key(raw: bytes, version: str) -> str:
+    """Content address of a PDF for a given analysis version."""
+    return digest_key(hashlib.sha256(raw).hexdigest(), version)
+
+
+def digest_key(digest: str, version: str) -> str:
+    """cache_key for a PDF whose sha256 hex digest is already known."""
+    return f"{digest}:{version}"
+
+
+def get(key: str) -> Optional[dict]:
+    """Looks *key* up in L1 then L2. Returns the cached analysis or None."""
+    value = _memory.get(key)
+    if value is not None:
+        _count("memory_hits")
+        return value
+
+    try:
+        row = db.session.query(ParsedResumeCache.analysis_json).filter_by(cache_key=key).first()
+        if row is not None:
+            value = json.loads(row.analysis_json)
+            _hits.add(key)
+            _memory.put(key, value)
+            _count("db_hits")
+            return value
+    except Exception as e:
+        db.session.rollback()
+        _count("errors")
+        logger.warning(f"[ResumeCache] lookup failed: {e}")
+
+    _count("misses")
+    return None
+
+
+def put(key: str, analysis: dict) -> None:
+    """Stores *analysis* in both tiers. An existing L2 row is left as-is."""
+    _memory.put(key, analysis)
+    try:
+        exists = db.session.query(ParsedResumeCache.id).filter_by(cache_key=key).first()
+        if exists is None:
+            db.session.add(ParsedResumeCache(cache_key=key, analysis_json=json.dumps(analysis)))
+            db.session.commit()
+        _count("stores")
+    except Exception as e:
+        # Most likely a concurrent worker inserted the same key first.
+        db.session.rollback()
+        _count("errors")
+        logger.warning(f"[ResumeCache] store failed: {e}")
+
+
+def stats() -> dict:
+    """Hit/miss counters for this worker process, for sizing the cache."""
+    with _counters_lock:
+        counters = dict(_counters)
+    lookups = counters["memory_hits"] + counters["db_hits"] + counters["misses"]
+    hits = counters["memory_hits"] + counters["db_hits"]
+    return {
+        **counters,
+        "lookups": lookups,
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        "memory_size": len(_memory),
+        "memory_max_size": _memory.max_size,
+        "pending_hit_counts": len(_hits),
+    }
@@ -0,0 +1,186 @@
+"""
+resume_document.py — Single-Pass Resume Tokenizer
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+One walk over the (alias-normalised) resume text builds a ResumeDocument:
+
+* line model   — start/end offset of every line (line breaks excluded), held
+                 in int arrays; lines are never copied out, except short
+                 lines that are header candidates,
+* headers      — (line index, section) for every line that is a known header,
+* sections     — per section, the character spans of its body, trimmed of
+                 surrounding whitespace,
+* folded       — the text case-folded once, offset for offset, which the
+                 skill matcher scans span by span.
+
+The analysis stages in resume_service are visitors over this model: each
+scans ``doc.text`` once (or only a span of it, via pos/endpos) and
+attributes hits to sections by offset, instead of re-splitting the text and
+copying section substrings. Offsets always refer to ``doc.text``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from array import array
+from typing import Iterable, NamedTuple
+
+from app.services.skill_matcher import fold_preserving_offsets
+
+# The line breaks str.splitlines() recognises, "\r\n" as one break.
+_LINE_BREAK_RE = re.compile("\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# Lines longer than this (once stripped) are never headers.
+MAX_HEADER_LENGTH = 80
+
+
+class Span(NamedTuple):
+    start: int
+    end: int
+
+
+def normalise_header(raw_line: str) -> str:
+    """
+    Header-candidate form of a line: trailing colon removed, internal
+    whitespace collapsed, lower-cased. Returns "" for lines that are empty
+    or too long (> 80 chars) to be a header.
+    """
+    stripped = raw_line.strip()
+    if not stripped or len(stripped) > MAX_HEADER_LENGTH:
+        return ""
+    return " ".join(stripped.rstrip(":").split()).lower()
+
+
+class EncodedText(NamedTuple):
+    """
+    One encoding of a whole text and its bytes per character: UTF-8 when the
+    text is ASCII, else fixed-width UTF-32, so character offsets map to byte
+    offsets by multiplication.
+    """
+    data: memoryview
+    width: int
+
+    def span(self, span: Span) -> memoryview:
+        return self.data[span.start * self.width:span.end * self.width]
+
+
+class ResumeDocument:
+    """
+    Line/offset model of one resume. *headers* maps normalised header text
+    (see normalise_header) to a canonical section name.
+    """
+
+    def __init__(self, text: str, headers: dict[str, str]):
+        self.text = text
+        self.folded = fold_preserving_offsets(text)
+        self.line_starts = array("q", [0])
+        self.line_ends = array("q")
+        self.headers: list[tuple[int, str]] = []
+
+        for m in _LINE_BREAK_RE.finditer(text):
+            self.line_ends.append(m.start())
+            self.line_starts.append(m.end())
+        # Same line count as str.splitlines(): a final line break ends the last line.
+        if self.line_starts[-1] < len(text):
+            self.line_ends.append(len(text))
+        else:
+            self.line_starts.pop()
+
+        for idx, (start, end) in enumerate(zip(self.line_starts, self.line_ends)):
+            # Only lines that can strip down to MAX_HEADER_LENGTH are normalised.
+            if end - start <= MAX_HEADER_LENGTH or text[start].isspace() or text[end - 1].isspace():
+                section = headers.get(normalise_header(text[start:end]))
+                if section:
+                    self.headers.append((idx, section))
+
+        self.sections: dict[str, list[Span]] = {}
+        if not self.headers:
+            self.sections["_body"] = [Span(0, len(text))]
+            return
+        bounds = [(-1, "_body")] + self.headers + [(len(self.line_starts), "_end")]
+        for (first, label), (stop, _) in zip(bounds, bounds[1:]):
+            span = self.lines_span(first + 1, stop)
+            if span is not None:
+                self.sections.setdefault(label, []).append(span)
+
+    # ------------------------------------------------------------------
+    # Offsets
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.line_starts)
+
+    def trim(self, start: int, end: int) -> Span | None:
+        """*start*..*end* without surrounding whitespace; None if nothing is left."""
+        text = self.text
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return Span(start, end) if start < end else None
+
+    def lines_span(self, first: int, stop: int) -> Span | None:
+        """Trimmed span covering lines ``first`` .. ``stop - 1``."""
+        if first >= stop:
+            return None
+        return self.trim(self.line_starts[first], self.line_ends[stop - 1])
+
+    def line_of(self, offset: int) -> int:
+        """Index of the line containing *offset*."""
+        return bisect.bisect_right(self.line_starts, offset) - 1
+
+    def encoded(self) -> "EncodedText":
+        """The text encoded once, for hashing spans as views into it (see EncodedText)."""
+        if self.text.isascii():
+            return EncodedText(memoryview(self.text.encode("ascii")), 1)
+        return EncodedText(memoryview(self.text.encode("utf-32-le", "surrogatepass")), 4)
+
+    def span_text(self, span: Span) -> str:
+        """The text of *span* with "\\n" line breaks, as "\\n".join(lines) would give."""
+        return "\n".join(self.text[span.start:span.end].splitlines())
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    def spans(self, label: str) -> list[Span]:
+        return self.sections.get(label, [])
+
+    def section_texts(self) -> dict[str, str]:
+        """
+        ``{section: text}`` as detect_sections_dynamic returns it: repeated
+        sections are concatenated, each part prefixed with a newline.
+        """
+        if not self.headers:
+            return {"_body": "\n".join(self.text.splitlines())}
+        return {
+            label: "".join("\n" + self.span_text(span) for span in spans)
+            for label, spans in self.sections.items()
+        }
+
+
+def contains(spans: list[Span], start: int, end: int) -> bool:
+    """True if *start*..*end* lies inside one of *spans* (sorted, disjoint)."""
+    idx = bisect.bisect_right(spans, (start, float("inf"))) - 1
+    return idx >= 0 and end <= spans[idx].end
+
+
+def merge_line_windows(doc: ResumeDocument, lines: Iterable[int], window: int) -> list[Span]:
+    """
+    Spans covering ``line .. line + window - 1`` for every line in *lines*
+    (ascending), with overlapping windows merged. Spans are not trimmed.
+    """
+    spans: list[Span] = []
+    last = len(doc)
+    run_first = run_stop = -1
+    for line in lines:
+        stop = min(line + window, last)
+        if line <= run_stop:
+            run_stop = max(run_stop, stop)
+            continue
+        if run_first >= 0:
+            spans.append(Span(doc.line_starts[run_first], doc.line_ends[run_stop - 1]))
+        run_first, run_stop = line, stop
+    if run_first >= 0:
+        spans.append(Span(doc.line_starts[run_first], doc.line_ends[run_stop - 1]))
+    return spans
@@ -0,0 +1,192 @@
+"""
+resume_job_service.py — DB-Backed Queue for Asynchronous Resume Analysis
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+``POST /resume/upload?async=true`` stores the PDF in a ``resume_jobs`` row and
+returns 202 straight away; one or more ``resume_worker.py`` processes run the
+process_resume stages and record progress on the row, which clients poll via
+``GET /resume/jobs/<id>``.
+
+Claiming is a compare-and-set UPDATE (``status='queued'`` → ``'running'``), so
+any number of workers on any number of hosts can share the table. A running
+job's lease (``locked_at``) is refreshed at every stage; jobs whose lease
+expires (worker crashed) are re-queued until RESUME_JOB_MAX_ATTEMPTS.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from werkzeug.exceptions import HTTPException
+
+from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.database import db
+from app.models.resume_job import ResumeJob
+from app.services import resume_service, user_profile_service
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+QUEUED    = "queued"
+RUNNING   = "running"
+SUCCEEDED = "succeeded"
+FAILED    = "failed"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Web side
+# ---------------------------------------------------------------------------
+
+def enqueue(user_id: int, filename: str, raw: bytes) -> ResumeJob:
+    """Persists an already-validated upload as a queued job."""
+    job = ResumeJob(
+        id=uuid.uuid4().hex,
+        user_id=user_id,
+        status=QUEUED,
+        stage=QUEUED,
+        progress=0,
+        filename=filename,
+        file_data=raw,
+    )
+    db.session.add(job)
+    db.session.commit()
+    logger.info(f"[ResumeJobs] Enqueued job {job.id} for user {user_id}")
+    return job
+
+
+def get_job(job_id: str, user_id: int) -> Optional[ResumeJob]:
+    return db.session.query(ResumeJob).filter_by(id=job_id, user_id=user_id).first()
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def _update_owned(job_id: str, worker_id: str, **values) -> bool:
+    """Updates the job only while *worker_id* still holds its lease."""
+    updated = (
+        db.session.query(ResumeJob)
+        .filter(ResumeJob.id == job_id, ResumeJob.locked_by == worker_id, ResumeJob.status == RUNNING)
+        .update(values, synchronize_session=False)
+    )
+    db.session.commit()
+    return updated == 1
+
+
+def requeue_stale_jobs() -> int:
+    """Returns expired-lease jobs to the queue (or fails them once out of attempts)."""
+    cutoff = _now() - timedelta(seconds=settings.resume_job_lease_seconds)
+    stale = (ResumeJob.status == RUNNING, ResumeJob.locked_at < cutoff)
+    requeued = (
+        db.session.query(ResumeJob)
+        .filter(*stale, ResumeJob.attempts < settings.resume_job_max_attempts)
+        .update({"status": QUEUED, "stage": QUEUED, "locked_by": None, "locked_at": None},
+                synchronize_session=False)
+    )
+    failed = (
+        db.session.query(ResumeJob)
+        .filter(*stale, ResumeJob.attempts >= settings.resume_job_max_attempts)
+        .update({"status": FAILED, "stage": FAILED, "error": "Worker lease expired too many times.",
+                 "file_data": None, "locked_by": None, "finished_at": _now()},
+                synchronize_session=False)
+    )
+    db.session.commit()
+    if requeued or failed:
+        logger.warning(f"[ResumeJobs] Stale leases: {requeued} re-queued, {failed} failed")
+    return requeued
+
+
+def claim_next(worker_id: str) -> Optional[str]:
+    """Atomically claims the oldest queued job. Returns its id, or None."""
+    candidates = (
+        db.session.query(ResumeJob.id)
+        .filter(ResumeJob.status == QUEUED)
+        .order_by(ResumeJob.created_at)
+        .limit(10)
+        .all()
+    )
+    for (job_id,) in candidates:
+        claimed = (
+            db.session.query(ResumeJob)
+            .filter(ResumeJob.id == job_id, ResumeJob.status == QUEUED)
+            .update({"status": RUNNING, "stage": "claimed", "locked_by": worker_id,
+                     "locked_at": _now(), "attempts": ResumeJob.attempts + 1},
+                    synchronize_session=False)
+        )
+        db.session.commit()
+        if claimed == 1:
+            return job_id
+    return None
+
+
+def run_job(job_id: str, worker_id: str) -> None:
+    """Runs the process_resume stages for a claimed job and stores the outcome."""
+    job = db.session.get(ResumeJob, job_id)
+    raw, user_id, attempts = job.file_data, job.user_id, job.attempts
+    db.session.expunge(job)   # keep the PDF bytes out of the session from here on
+
+    def on_stage(stage: str, percent: int) -> None:
+        _update_owned(job_id, worker_id, stage=stage, progress=percent, locked_at=_now())
+
+    try:
+        result = resume_service.process_resume_bytes(raw, user_id, on_stage)
+        on_stage("saving", 90)
+        if not result.get("partial"):
+            # A partial (budget-exhausted) analysis must not replace the profile.
+            user_profile_service.update_user_profile(
+                user_id=user_id,
+                skills=result.get("technical_skills", {}),
+                previous_role=result.get("previous_role"),
+                target_role=result.get("inferred_target_role")
+            )
+    except HTTPException as e:
+        # Invalid or unparseable PDF — retrying will not help.
+        db.session.rollback()
+        _update_owned(job_id, worker_id, status=FAILED, stage=FAILED, error=e.description,
+                      file_data=None, locked_by=None, finished_at=_now())
+        logger.info(f"[ResumeJobs] Job {job_id} failed: {e.description}")
+        return
+    except Exception as e:
+        db.session.rollback()
+        logger.exception(f"[ResumeJobs] Job {job_id} crashed on attempt {attempts}: {e}")
+        if attempts < settings.resume_job_max_attempts:
+            _update_owned(job_id, worker_id, status=QUEUED, stage=QUEUED, progress=0,
+                          locked_by=None, locked_at=None)
+        else:
+            _update_owned(job_id, worker_id, status=FAILED, stage=FAILED,
+                          error="An unexpected error occurred while analysing the resume.",
+                          file_data=None, locked_by=None, finished_at=_now())
+        return
+
+    _update_owned(job_id, worker_id, status=SUCCEEDED, stage="done", progress=100,
+                  result_json=json.dumps(result), file_data=None, locked_by=None,
+                  finished_at=_now())
+    logger.info(f"[ResumeJobs] Job {job_id} succeeded")
+
+
+def run_worker(worker_id: Optional[str] = None, once: bool = False) -> None:
+    """
+    Worker loop; call inside an app context. With *once*, drains the queue
+    and returns instead of polling forever.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    logger.info(f"[ResumeJobs] Worker {worker_id} started")
+    while True:
+        job_id = claim_next(worker_id)
+        if job_id is None:
+            requeue_stale_jobs()
+            if once:
+                return
+            time.sleep(settings.resume_job_poll_seconds)
+            continue
+        run_job(job_id, worker_id)
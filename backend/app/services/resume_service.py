@@ -4,36 +4,65 @@ resume_service.py — Section-Aware Resume Parser
 Strategy
 --------
 * No AI / NLP / external APIs.
-* Dynamic section detection via synonym map + flexible header regex.
+* One tokenizer pass builds a line/offset model with section spans
+  (services/resume_document.py); the stages below are visitors over it.
+* Dynamic section detection via synonym map + flexible header matching.
 * Fallback heuristics when no header is found.
-* Regex word-boundary skill matching (pre-compiled at module load).
+* Single-pass trie skill matcher over the whole taxonomy (built at module load).
 * Experience parsing: "N years" pattern + date-range year difference.
+* Every pattern run over resume text is linear-time (bench_regex.py), and
+  each analysis has a wall-clock budget (services/parse_budget.py).
 * Questions from tech categories only, capped at MAX_QUESTIONS.
 """
 
 from __future__ import annotations
 
-import io
+import hashlib
+import json
 import re
-from typing import Optional
-from difflib import SequenceMatcher
+from typing import Callable, Optional
 
-import pdfplumber
 from werkzeug.exceptions import BadRequest, RequestEntityTooLarge, UnprocessableEntity
 
 # ---------------------------------------------------------------------------
+from app.core import uploads
+from app.core.config import get_settings
 from app.core.logger import get_logger
+from app.core.timing import stage
 from app.services import analytics_service
+from app.services import docx_extractor
+from app.services import emerging_skills_service
 from app.services import llm_service
+from app.services import parse_budget
+from app.services import parsed_resume_service
+from app.services import pdf_extractor
+from app.services import resume_cache
+from app.services import question_bank_service, question_pool_service
+from app.services.near_duplicates import NearDuplicateIndex
+from app.services.parse_budget import bounded
+from app.services.resume_document import EncodedText, ResumeDocument, Span, merge_line_windows, normalise_header
+from app.services.role_scoring import RoleScorer
+from app.services.skill_matcher import AliasNormalizer, AliasRewrite, SkillMatcher
 
 logger = get_logger(__name__)
+settings = get_settings()
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 MAX_FILE_SIZE_BYTES = 5 * 1024 * 1024  # 5 MB
+PDF_MAGIC           = b"%PDF"
+DOCX_MAGIC          = b"PK\x03\x04"   # .docx files are ZIP archives
 MAX_QUESTIONS       = 10
 
+# Questions more similar than this (SequenceMatcher ratio) to an accepted one
+# are dropped as near-duplicates (see services/near_duplicates.py).
+DUPLICATE_SIMILARITY = 0.85
+
+# Bump whenever a change to the parsing stages alters their output, so cached
+# and stored analyses produced by the old code are no longer reused.
+PARSER_VERSION      = 4
+
 # ---------------------------------------------------------------------------
 # Section Synonym Map
 # ---------------------------------------------------------------------------
@@ -74,11 +103,19 @@ SECTION_SYNONYMS: dict[str, list[str]] = {
     ],
 }
 
-# Pre-build a reverse lookup:  normalised_synonym -> canonical_section_name
+# Headers that typically close out a resume. They are not parsed as sections,
+# but seeing one tells the page stream that the preceding section has ended.
+TRAILING_SECTION_HEADERS: set[str] = {
+    "publications", "references", "certifications", "certificates",
+    "awards", "achievements", "awards & achievements", "hobbies", "interests",
+    "hobbies & interests", "volunteering", "volunteer experience", "declaration",
+}
+
+# Sections the analysis needs; once both are closed the remaining pages are skipped.
+_REQUIRED_SECTIONS = ("skills", "experience")
+
+# Reverse lookup:  normalised_synonym -> canonical_section_name (built by reload_taxonomy)
 _SYNONYM_TO_SECTION: dict[str, str] = {}
-for _section, _synonyms in SECTION_SYNONYMS.items():
-    for _syn in _synonyms:
-        _SYNONYM_TO_SECTION[_syn.lower().strip()] = _section
 
 # ---------------------------------------------------------------------------
 # Categorised Technical Skills Knowledge Base
@@ -149,35 +186,30 @@ SKILL_ALIASES: dict[str, list[str]] = {
     "C++": ["CPP"],
 }
 
+def normalize_skill_aliases_with_offsets(text: str) -> tuple[str, list[AliasRewrite]]:
+    """
+    Same as normalize_skill_aliases, but also returns the AliasRewrite spans
+    so matches in the normalised text can be mapped back to the original
+    (see skill_matcher.to_original_offset). The analysis itself only works
+    on the normalised text; the rewrites are returned for callers that need
+    original offsets, such as highlighting matches in the extracted text.
+    """
+    return _ALIAS_NORMALIZER.normalize(text)
+
+
 def normalize_skill_aliases(text: str) -> str:
     """
     Normalises skill name variations to their canonical forms
     so the regex dictionary matcher catches them accurately.
     Uses a single-pass regex to avoid cascading replacements (e.g. Node.js -> Node.JavaScript).
     """
-    alias_map = {}
-    for canonical, aliases in SKILL_ALIASES.items():
-        for alias in aliases:
-            alias_map[alias.lower()] = canonical
-
-    if not alias_map:
-        return text
-
-    # Sort by length descending so 'React JS' matches before 'React' or 'JS'
-    sorted_aliases = sorted(alias_map.keys(), key=len, reverse=True)
-    escaped_aliases = [re.escape(a) for a in sorted_aliases]
-    
-    # \b matches word boundaries
-    pattern = r"\b(" + "|".join(escaped_aliases) + r")\b"
-    
-    def replacer(match):
-        return alias_map[match.group(1).lower()]
-
-    return re.sub(pattern, replacer, text, flags=re.IGNORECASE)
+    return normalize_skill_aliases_with_offsets(text)[0]
 
 # ---------------------------------------------------------------------------
 # Question Bank
 # ---------------------------------------------------------------------------
+# Seed data for the indexed question bank (services/question_bank_service.py):
+# served directly until `load_question_bank.py` has imported it into the DB.
 QUESTION_BANK: dict[str, list[dict[str, str]]] = {
     "Python":      [{"main": "Explain your experience with Python and describe the projects you built with it.",
                      "follow_up": "Which Python frameworks or libraries have you used, and what were your reasons for choosing them?"}],
@@ -252,32 +284,35 @@ QUESTION_BANK: dict[str, list[dict[str, str]]] = {
 }
 
 # ---------------------------------------------------------------------------
-# Pre-compiled skill patterns (module-level — compiled once)
+# Compiled skill matcher (module-level — built once)
 # ---------------------------------------------------------------------------
 
-def _compile_pattern(keyword: str) -> re.Pattern:
-    """
-    Whole-word, case-insensitive match using lookarounds instead of \\b
-    so multi-token and symbol-containing skills (Node.js, CI/CD, C++) work.
-    """
-    escaped = re.escape(keyword.lower())
-    pattern = r"(?<![a-z0-9_])" + escaped + r"(?![a-z0-9_])"
-    return re.compile(pattern, re.IGNORECASE)
+# Pseudo-category under which SOFT_SKILLS_DB entries are registered in the matcher.
+_SOFT_CATEGORY = "_soft"
 
 
-_TECH_PATTERNS: dict[str, dict[str, re.Pattern]] = {
-    category: {skill: _compile_pattern(skill) for skill in skills}
-    for category, skills in TECH_SKILLS_DB.items()
-}
+def _taxonomy_entries() -> list[tuple[str, str, str]]:
+    """
+    Flattens TECH_SKILLS_DB and SOFT_SKILLS_DB into (keyword, canonical_skill,
+    category) entries for the SkillMatcher. Aliases are not registered: the
+    matcher scans text the AliasNormalizer has already rewritten, and an
+    alias matched there (the "JS" in "Node.js") would report a skill the
+    resume never mentions.
+    """
+    entries: list[tuple[str, str, str]] = []
+    for category, skills in TECH_SKILLS_DB.items():
+        entries.extend((skill, skill, category) for skill in skills)
+    entries.extend((skill, skill, _SOFT_CATEGORY) for skill in SOFT_SKILLS_DB)
+    return entries
 
-_SOFT_PATTERNS: dict[str, re.Pattern] = {
-    skill: _compile_pattern(skill) for skill in SOFT_SKILLS_DB
-}
 
-# Pre-compile header detection pattern:
-# Matches a line that is only a section title (with optional trailing colon/whitespace).
-# Groups: (1) = the header text stripped of trailing colon.
-_HEADER_RE = re.compile(r"^\s*([\w][\w\s&,/*-]{0,60}?)\s*:?\s*$")
+def analysis_version() -> str:
+    """
+    Identifies the parser + taxonomy an analysis was produced with:
+    PARSER_VERSION plus a short hash of every table the stages read, as of
+    the last reload_taxonomy().
+    """
+    return _TAXONOMY_VERSION
 
 # ---------------------------------------------------------------------------
 # Role Inference Constants
@@ -291,6 +326,49 @@ ROLE_KEYWORDS = {
     "DevOps Engineer": ["aws", "azure", "docker", "kubernetes", "ci/cd", "devops"]
 }
 
+# ---------------------------------------------------------------------------
+# Compiled taxonomy
+# ---------------------------------------------------------------------------
+# Everything compiled from the tables above — section lookup, alias
+# normaliser, skill matcher, known-skill names and role scorer — is built
+# here, in one go, and stamped with one analysis_version(), so no two of them
+# can come from different versions of a table. Code that edits a table at
+# runtime calls reload_taxonomy() afterwards; nothing re-checks the tables
+# per call.
+
+def reload_taxonomy() -> str:
+    """(Re)builds every structure compiled from the taxonomy tables; returns the new analysis_version()."""
+    global _ALIAS_NORMALIZER, _SKILL_MATCHER, KNOWN_SKILLS_LOWER, ROLE_SCORER, _TAXONOMY_VERSION
+
+    synonym_to_section = {
+        synonym.lower().strip(): section
+        for section, synonyms in SECTION_SYNONYMS.items()
+        for synonym in synonyms
+    }
+    _SYNONYM_TO_SECTION.clear()
+    _SYNONYM_TO_SECTION.update(synonym_to_section)
+
+    _ALIAS_NORMALIZER = AliasNormalizer(SKILL_ALIASES)
+    _SKILL_MATCHER = SkillMatcher(_taxonomy_entries())
+    # Every skill name and alias in the taxonomy, lower-cased.
+    KNOWN_SKILLS_LOWER = frozenset(
+        skill.lower()
+        for names in (*TECH_SKILLS_DB.values(), *SKILL_ALIASES.values())
+        for skill in names
+    )
+    # Roles × keywords incidence matrix shared with user_profile_service.
+    ROLE_SCORER = RoleScorer(ROLE_KEYWORDS)
+
+    taxonomy = json.dumps(
+        [TECH_SKILLS_DB, SOFT_SKILLS_DB, SKILL_ALIASES, SECTION_SYNONYMS, ROLE_KEYWORDS],
+        sort_keys=True,
+    )
+    _TAXONOMY_VERSION = f"p{PARSER_VERSION}-{hashlib.sha1(taxonomy.encode('utf-8')).hexdigest()[:12]}"
+    return _TAXONOMY_VERSION
+
+
+reload_taxonomy()
+
 ROLE_PRIORITIES = {
     "Backend Engineer": ["backend", "database", "languages", "architecture", "frontend"],
     "Frontend Engineer": ["frontend", "languages", "backend", "architecture"],
@@ -304,6 +382,11 @@ ROLE_PRIORITIES = {
 # ❶  Dynamic Section Detection
 # ---------------------------------------------------------------------------
 
+def _tokenize(text: str) -> ResumeDocument:
+    """The single tokenizer pass: line offsets, header lines and section spans."""
+    return ResumeDocument(text, _SYNONYM_TO_SECTION)
+
+
 def detect_sections_dynamic(text: str) -> dict[str, str]:
     """
     Split *text* into labelled sections using flexible, synonym-aware header
@@ -314,48 +397,11 @@ def detect_sections_dynamic(text: str) -> dict[str, str]:
     dict  with keys from SECTION_SYNONYMS (e.g. "skills", "experience")
           mapping to the raw text of that section.
           Unrecognised body text is stored under key "_body".
-    """
-    lines   = text.splitlines()
-    n_lines = len(lines)
-
-    # Pass 1 — find (line_index, canonical_section) pairs
-    header_positions: list[tuple[int, str]] = []
-
-    for idx, raw_line in enumerate(lines):
-        stripped = raw_line.strip()
-
-        # A header line is short, not empty, and matches a synonym exactly
-        # after removing trailing colon and collapsing internal whitespace.
-        if not stripped or len(stripped) > 80:
-            continue
-
-        normalised = re.sub(r"\s+", " ", stripped.rstrip(":").strip()).lower()
-        section = _SYNONYM_TO_SECTION.get(normalised)
-        if section:
-            header_positions.append((idx, section))
 
-    # Pass 2 — slice text between consecutive headers
-    sections: dict[str, list[str]] = {}
-
-    if not header_positions:
-        # No headers found — return entire text as "_body"
-        sections["_body"] = lines
-        return {"_body": "\n".join(lines)}
-
-    # Prepend a virtual "_body" section covering everything before the first header
-    all_bounds: list[tuple[int, str]] = [(-1, "_body")] + header_positions + [(n_lines, "_end")]
-
-    result: dict[str, str] = {}
-    for i in range(len(all_bounds) - 1):
-        start_idx, label  = all_bounds[i]
-        end_idx,   _      = all_bounds[i + 1]
-        section_lines     = lines[start_idx + 1 : end_idx]
-        content           = "\n".join(section_lines).strip()
-        if content:
-            # Last occurrence wins if same section appears twice
-            result[label] = result.get(label, "") + "\n" + content
-
-    return result
+    The pipeline works on the spans of _tokenize(text) directly; this copies
+    them out as strings.
+    """
+    return _tokenize(text).section_texts()
 
 
 # ---------------------------------------------------------------------------
@@ -367,57 +413,133 @@ _SKILLS_TRIGGER_WORDS = re.compile(
     re.IGNORECASE,
 )
 
+FALLBACK_WINDOW = 15
 
-def _extract_skills_section_fallback(lines: list[str]) -> str:
+
+def _fallback_skill_spans(doc: ResumeDocument) -> list[Span]:
     """
-    Scan lines for trigger words commonly found near inline skill lists
-    (e.g. "Programming Languages: Java, Python").
-    Collect that line plus the next FALLBACK_WINDOW lines.
-    Returns joined text or empty string.
+    Scan for trigger words commonly found near inline skill lists
+    (e.g. "Programming Languages: Java, Python") and return spans covering
+    each such line plus the next FALLBACK_WINDOW - 1 lines.
     """
-    FALLBACK_WINDOW = 15
-    collected: list[str] = []
-    seen_indices: set[int] = set()
+    lines = sorted({doc.line_of(m.start()) for m in bounded("skills", _SKILLS_TRIGGER_WORDS.finditer(doc.text))})
+    return merge_line_windows(doc, lines, FALLBACK_WINDOW)
 
-    for idx, line in enumerate(lines):
-        if _SKILLS_TRIGGER_WORDS.search(line):
-            for offset in range(FALLBACK_WINDOW):
-                target = idx + offset
-                if target < len(lines) and target not in seen_indices:
-                    seen_indices.add(target)
-                    collected.append(lines[target])
 
-    return "\n".join(collected)
+def _extract_skills_section_fallback(lines: list[str]) -> str:
+    """
+    String form of _fallback_skill_spans: the collected lines, joined.
+    Returns joined text or empty string.
+    """
+    doc = _tokenize("\n".join(lines))
+    return "\n".join(doc.text[start:end] for start, end in _fallback_skill_spans(doc))
 
 
 # ---------------------------------------------------------------------------
 # ❸  Skill Matching
 # ---------------------------------------------------------------------------
 
+def _split_matches(found: dict[str, list[str]]) -> tuple[dict[str, list[str]], list[str]]:
+    """Splits a SkillMatcher result into (categorised tech skills, soft skills)."""
+    tech = {category: found.get(category, []) for category in TECH_SKILLS_DB}
+    return tech, found.get(_SOFT_CATEGORY, [])
+
+
+def _skill_corpus(doc: ResumeDocument) -> tuple[list[Span], str]:
+    """
+    Spans the skills are matched in, and where they came from:
+      a) a dedicated skills section                 → "section"
+      b) otherwise, lines near trigger words        → "fallback"
+      c) otherwise, the whole resume                → "document"
+    """
+    spans = doc.spans("skills")
+    if spans:
+        return spans, "section"
+    spans = _fallback_skill_spans(doc)
+    if any(doc.trim(*span) for span in spans):
+        return spans, "fallback"
+    return [Span(0, len(doc.text))], "document"
+
+
+def _section_hash(encoded: EncodedText, spans: list[Span]) -> str:
+    # Hashes views into the document's single encoding, so no section is copied.
+    # ASCII documents hash their UTF-8 bytes; others their UTF-32, which only
+    # means a section moved between the two kinds is scanned again.
+    digest = hashlib.sha1()
+    for span in spans:
+        digest.update(encoded.span(span))
+    return digest.hexdigest()
+
+
+def _visit_sections(doc: ResumeDocument, previous: Optional[dict] = None) -> tuple[dict[str, dict], dict[str, set[int]]]:
+    """
+    Skill hits per section, each section scanned in place. A section whose
+    text hash equals the same section of *previous* (the "sections" of an
+    earlier analysis with the same analysis_version) takes its stored hits
+    — and stored "years" for the experience section — without a scan.
+
+    Returns (sections, ranks): the JSON form kept in the analysis,
+    ``{label: {"lines": [[first, stop], ...], "hash", "skills": [[skill, category], ...]}}``,
+    and the hit ranks per section.
+    """
+    previous = previous or {}
+    sections: dict[str, dict] = {}
+    ranks: dict[str, set[int]] = {}
+    reused = 0
+    encoded = doc.encoded()
+    for label, spans in doc.sections.items():
+        digest = _section_hash(encoded, spans)
+        stored = previous.get(label)
+        if stored and stored.get("hash") == digest:
+            found = _SKILL_MATCHER.ranks(stored["skills"])
+            reused += 1
+        else:
+            found = {rank for start, end in spans for _, _, rank in _SKILL_MATCHER.hits(doc.folded, start, end)}
+            stored = None
+        sections[label] = {
+            "lines": [[doc.line_of(start), doc.line_of(end - 1) + 1] for start, end in spans],
+            "hash": digest,
+            "skills": [list(pair) for pair in _SKILL_MATCHER.pairs(found)],
+        }
+        if stored and "years" in stored:
+            sections[label]["years"] = stored["years"]
+        ranks[label] = found
+    if previous:
+        logger.info(f"[ResumeParser] Reused {reused}/{len(sections)} unchanged sections")
+    return sections, ranks
+
+
+def _visit_skills(
+    doc: ResumeDocument,
+    corpus: list[Span],
+    source: str,
+    section_ranks: dict[str, set[int]],
+) -> tuple[dict[str, list[str]], list[str]]:
+    """
+    Tech and soft skills from the hits inside *corpus*; soft skills mentioned
+    anywhere else are appended after them. Sections and header lines
+    partition the non-blank text, so the per-section hits plus the header
+    lines give every hit in the resume; only a "fallback" corpus is scanned
+    again.
+    """
+    anywhere: set[int] = set().union(*section_ranks.values())
+    for idx, _ in doc.headers:
+        anywhere.update(rank for _, _, rank in _SKILL_MATCHER.hits(doc.folded, doc.line_starts[idx], doc.line_ends[idx]))
+
+    if source == "section":
+        in_corpus = section_ranks["skills"]
+    elif source == "fallback":
+        in_corpus = {rank for start, end in corpus for _, _, rank in _SKILL_MATCHER.hits(doc.folded, start, end)}
+    else:
+        in_corpus = anywhere
+    tech_skills, soft_skills = _split_matches(_SKILL_MATCHER.group(in_corpus))
+    soft_skills_body = _SKILL_MATCHER.group(anywhere).get(_SOFT_CATEGORY, [])
+    return tech_skills, list(dict.fromkeys(soft_skills + soft_skills_body))
+
+
 def _match_skills_in_text(text: str) -> dict[str, list[str]]:
     """Match tech skills against *text*. Returns categorised dict."""
-    result: dict[str, list[str]] = {}
-    for category, patterns in _TECH_PATTERNS.items():
-        matched: list[str] = []
-        seen: set[str] = set()
-        for skill, pattern in patterns.items():
-            key = skill.lower()
-            if key not in seen and pattern.search(text):
-                seen.add(key)
-                matched.append(skill)
-        result[category] = matched
-    return result
-
-
-def _match_soft_skills(text: str) -> list[str]:
-    found: list[str] = []
-    seen: set[str] = set()
-    for skill, pattern in _SOFT_PATTERNS.items():
-        key = skill.lower()
-        if key not in seen and pattern.search(text):
-            seen.add(key)
-            found.append(skill)
-    return found
+    return _split_matches(_SKILL_MATCHER.match(text))[0]
 
 
 # ---------------------------------------------------------------------------
@@ -425,26 +547,40 @@ def _match_soft_skills(text: str) -> list[str]:
 # ---------------------------------------------------------------------------
 
 # "3 years", "5+ years experience"
-_YEARS_EXPLICIT_RE = re.compile(r"(\d+)\s*\+?\s*years?", re.IGNORECASE)
+# Only the first digit of a run may start a match, and "+" brings its own
+# trailing whitespace: with ``\d+\s*\+?\s*`` a long run of digits or blanks
+# was re-scanned from every position in it (quadratic).
+_YEARS_EXPLICIT_RE = re.compile(r"(?<!\d)(\d+)\s*(?:\+\s*)?years?", re.IGNORECASE)
+
+_MONTH = (
+    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
+    r"Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|"
+    r"Nov(?:ember)?|Dec(?:ember)?)"
+)
 
 # Full date range examples:
 #   2019 – 2022      Jan 2020 - Present     May 2008 – Sept 2008
+# A match starts at the first year: an optional month before it captures
+# nothing, and trying the month names at every letter of the resume was
+# most of this pattern's cost. The month before the second year takes its
+# own trailing whitespace, so a run of blanks after the dash is crossed once.
 _DATE_RANGE_RE = re.compile(
-    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
-    r"Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|"
-    r"Nov(?:ember)?|Dec(?:ember)?)?\s*"
     r"(\d{4})\s*[-–—]\s*"
-    r"(?:(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
-    r"Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|"
-    r"Nov(?:ember)?|Dec(?:ember)?)?\s*"
-    r"(\d{4})|Present|Current|Now|Till\s*date)",
+    r"(?:(?:" + _MONTH + r"\s*)?(\d{4})|Present|Current|Now|Till\s*date)",
     re.IGNORECASE,
 )
 
 
 def _detect_experience_years(text: str) -> Optional[int]:
+    """Best-estimate integer years of experience in *text*, or None if unknown (see _experience_years_in)."""
+    return _experience_years_in(text, [Span(0, len(text))])
+
+
+def _experience_years_in(text: str, spans: list[Span]) -> Optional[int]:
     """
-    Returns best-estimate integer years of experience, or None if unknown.
+    Best-estimate integer years of experience stated inside *spans* of
+    *text*, or None if unknown. The spans are scanned in place (pos/endpos),
+    never copied out.
 
     Priority
     --------
@@ -457,14 +593,20 @@ def _detect_experience_years(text: str) -> Optional[int]:
     current_year = datetime.date.today().year
 
     # ── Priority 1: explicit statement ───────────────────────────────────────
-    explicit_matches = _YEARS_EXPLICIT_RE.findall(text)
+    explicit_matches = [
+        m.group(1) for start, end in spans
+        for m in bounded("experience", _YEARS_EXPLICIT_RE.finditer(text, start, end))
+    ]
     if explicit_matches:
         years = min(max(int(m) for m in explicit_matches), 30)
         return years
 
     # ── Priority 2: date ranges  ─────────────────────────────────────────────
     years_found: list[int] = []
-    for m in _DATE_RANGE_RE.finditer(text):
+    date_ranges = (
+        m for start, end in spans for m in bounded("experience", _DATE_RANGE_RE.finditer(text, start, end))
+    )
+    for m in date_ranges:
         start_year_str = m.group(1)
         end_year_str   = m.group(2)  # None if group matched "Present/Current"
         try:
@@ -483,6 +625,26 @@ def _detect_experience_years(text: str) -> Optional[int]:
     return None
 
 
+def _visit_experience(doc: ResumeDocument, sections: Optional[dict[str, dict]] = None) -> Optional[int]:
+    """
+    Experience section first; the whole resume if that yields nothing (or
+    there is none). The section result is kept in / reused from
+    ``sections["experience"]["years"]`` (see _visit_sections).
+    """
+    spans = doc.spans("experience")
+    if spans:
+        section = (sections or {}).get("experience")
+        if section is not None and "years" in section:
+            years = section["years"]
+        else:
+            years = _experience_years_in(doc.text, spans)
+            if section is not None:
+                section["years"] = years
+        if years is not None:
+            return years
+    return _experience_years_in(doc.text, [Span(0, len(doc.text))])
+
+
 # ---------------------------------------------------------------------------
 # ❺  Question Generation
 # ---------------------------------------------------------------------------
@@ -536,14 +698,23 @@ def _generate_questions(tech_skills: dict[str, list[str]], applied_role: Optiona
             }
         }
 
-        ai_questions = llm_service.generate_questions(
-            question_plan=question_plan,
-            role=applied_role or "Software Engineer",
-            experience=experience,
-            count=MAX_QUESTIONS
-        )
+        # Pre-generated pools first (services/question_pool_service.py); Gemini only on a pool miss
+        with stage("question_pool"):
+            pooled = question_pool_service.assemble(question_plan, applied_role, experience, MAX_QUESTIONS)
+        if pooled:
+            logger.info(f"[ResumeParser] Pooled questions: {len(pooled)}")
+            return pooled
+
+        with stage("llm"):
+            ai_questions = llm_service.generate_questions(
+                question_plan=question_plan,
+                role=applied_role or "Software Engineer",
+                experience=experience,
+                count=MAX_QUESTIONS
+            )
         if ai_questions and len(ai_questions) > 0:
             final_ai = []
+            seen = NearDuplicateIndex(DUPLICATE_SIMILARITY)
             for q in ai_questions:
                 main_q = {
                     "question": q.get("main_question", ""),
@@ -556,11 +727,11 @@ def _generate_questions(tech_skills: dict[str, list[str]], applied_role: Optiona
                     "type": "follow_up"
                 }
 
-                if main_q["question"] and not any(SequenceMatcher(None, main_q["question"], ex["question"]).ratio() > 0.85 for ex in final_ai):
+                if main_q["question"] and seen.add_if_new(main_q["question"]):
                     final_ai.append(main_q)
                     if len(final_ai) >= MAX_QUESTIONS: break
 
-                if follow_up_q["question"] and not any(SequenceMatcher(None, follow_up_q["question"], ex["question"]).ratio() > 0.85 for ex in final_ai):
+                if follow_up_q["question"] and seen.add_if_new(follow_up_q["question"]):
                     final_ai.append(follow_up_q)
                     if len(final_ai) >= MAX_QUESTIONS: break
 
@@ -571,14 +742,12 @@ def _generate_questions(tech_skills: dict[str, list[str]], applied_role: Optiona
 
     # ── Fallback to Static Question Bank ──
     questions: list[dict] = []
-    
-    def is_similar(new_q: str) -> bool:
-        return any(SequenceMatcher(None, new_q, ex["question"]).ratio() > 0.85 for ex in questions)
+    seen = NearDuplicateIndex(DUPLICATE_SIMILARITY)
     
     def add_question_pair(q_pair: dict, skill: str) -> None:
-        if len(questions) < MAX_QUESTIONS and not is_similar(q_pair["main"]):
+        if len(questions) < MAX_QUESTIONS and seen.add_if_new(q_pair["main"]):
             questions.append({"question": q_pair["main"], "category": skill, "type": "main"})
-        if len(questions) < MAX_QUESTIONS and not is_similar(q_pair["follow_up"]):
+        if len(questions) < MAX_QUESTIONS and seen.add_if_new(q_pair["follow_up"]):
             questions.append({"question": q_pair["follow_up"], "category": skill, "type": "follow_up"})
 
     # Adaptive Weighting: Use the dynamic weakness quota calculated earlier (quota represents pairs so divide by 2)
@@ -605,14 +774,15 @@ def _generate_questions(tech_skills: dict[str, list[str]], applied_role: Optiona
     else:
         categories_to_query = base_categories
         
-    # Build a lowercase mapping for the QUESTION_BANK for fallback lookups
-    lowercase_q_bank = {k.lower(): v for k, v in QUESTION_BANK.items()}
+    # Indexed question bank (services/question_bank_service.py), at the
+    # candidate's difficulty band. No pass needs more than MAX_QUESTIONS pairs.
+    bank = question_bank_service.get_index()
+    band = question_bank_service.difficulty_for(experience)
     
     # Phase 1: Allocate adaptive weakest category questions first
     if weakest_cat_exact:
         for skill in tech_skills.get(weakest_cat_exact, []):
-            skill_lower = skill.lower()
-            q_list = lowercase_q_bank.get(skill_lower, [])
+            q_list = bank.pairs(skill, band, limit=MAX_QUESTIONS)
             # Fallback to general generic if not found
             if not q_list:
                 q_list = [{
@@ -632,8 +802,7 @@ def _generate_questions(tech_skills: dict[str, list[str]], applied_role: Optiona
         if len(questions) >= MAX_QUESTIONS:
             break
         for skill in tech_skills.get(category, []):
-            skill_lower = skill.lower()
-            q_list = lowercase_q_bank.get(skill_lower, [])
+            q_list = bank.pairs(skill, band, limit=MAX_QUESTIONS)
             # Dynamic generic generation if missing from static bank
             if not q_list:
                 q_list = [{
@@ -658,11 +827,10 @@ def _generate_questions(tech_skills: dict[str, list[str]], applied_role: Optiona
             if existing_count >= 2:
                 continue
                 
-            skill_lower = skill.lower()
-            q_list = lowercase_q_bank.get(skill_lower, [{
+            q_list = bank.pairs(skill, band, limit=MAX_QUESTIONS) or [{
                 "main": f"How would you explain the core concepts of {skill} to a junior engineer?",
                 "follow_up": f"Describe a time you had to optimize performance related to {skill}."
-            }])
+            }]
             
             for q_pair in q_list:
                 if len(questions) >= MAX_QUESTIONS:
@@ -679,33 +847,37 @@ def _generate_questions(tech_skills: dict[str, list[str]], applied_role: Optiona
 # Unknown Skills Detection
 # ---------------------------------------------------------------------------
 
-def detect_unknown_skills(text: str, known_skills: set[str]) -> list[str]:
+# Capitalised words, possibly with digits or the symbols common in tech names (e.g. Next.js, C++).
+_UNKNOWN_SKILL_RE = re.compile(r"\b[A-Z][a-zA-Z0-9\.\+\#]{2,}\b")
+
+# Common noise words in resumes
+_NOISE_WORDS = frozenset({
+    "January", "February", "March", "April", "May", "June", "July", "August", "September",
+    "October", "November", "December", "University", "College", "Degree", "Bachelor",
+    "Master", "Ph.D", "School", "Institute", "Academy", "Engineering", "Science",
+    "Technology", "Management", "Application", "Developer", "Engineer", "Manager",
+    "Project", "Product", "System", "Software", "Hardware", "Network", "Database",
+    "Server", "Client", "Frontend", "Backend", "Fullstack", "Agile", "Scrum",
+    "Company", "Inc", "LLC", "Ltd", "Corp", "Corporation", "Technologies", "Solutions",
+})
+
+
+def detect_unknown_skills(text: str, known_skills: Optional[set[str]] = None) -> list[str]:
     """
     Captures technical keywords that may represent valid skills but are missing
-    from the static dictionary (e.g. emerging technologies).
+    from the static dictionary (e.g. emerging technologies). *known_skills*
+    defaults to the taxonomy (KNOWN_SKILLS_LOWER). Each upload's result feeds
+    the emerging-skills index (services/emerging_skills_service.py).
     """
-    # Look for capitalized words with numbers or special chars common in tech (e.g. Next.js, C++)
-    candidates = re.findall(r"\b[A-Z][a-zA-Z0-9\.\+\#]{2,}\b", text)
-    unknown = []
-    
-    # Common noise words in resumes
-    noise_words = {
-        "January", "February", "March", "April", "May", "June", "July", "August", "September",
-        "October", "November", "December", "University", "College", "Degree", "Bachelor",
-        "Master", "Ph.D", "School", "Institute", "Academy", "Engineering", "Science",
-        "Technology", "Management", "Application", "Developer", "Engineer", "Manager",
-        "Project", "Product", "System", "Software", "Hardware", "Network", "Database",
-        "Server", "Client", "Frontend", "Backend", "Fullstack", "Agile", "Scrum",
-        "Company", "Inc", "LLC", "Ltd", "Corp", "Corporation", "Technologies", "Solutions",
-    }
-    
-    known_lower = {k.lower() for k in known_skills}
-    
-    for word in candidates:
-        if word.lower() not in known_lower and word not in noise_words:
-            unknown.append(word)
-            
-    return list(set(unknown))
+    known_lower = KNOWN_SKILLS_LOWER if known_skills is None else {k.lower() for k in known_skills}
+    # Iterated rather than findall'd: a long resume has thousands of candidates.
+    unknown = set()
+    for m in bounded("unknown_skills", _UNKNOWN_SKILL_RE.finditer(text)):
+        word = m.group()
+        if word not in _NOISE_WORDS and word.lower() not in known_lower:
+            unknown.add(word)
+
+    return list(unknown)
 
 # ---------------------------------------------------------------------------
 # ❻  Role Extraction
@@ -716,10 +888,14 @@ def _extract_roles(full_text: str, technical_skills: dict[str, list[str]]) -> tu
     Scans the top 30% for explicit target titles, and the whole resume for inference.
     Returns (previous_role, inferred_target_role).
     """
-    lines = full_text.splitlines()
-    search_cutoff = max(int(len(lines) * 0.3), 10)
-    top_text = "\n".join(lines[:search_cutoff]).lower()
-    
+    return _visit_roles(_tokenize(full_text), technical_skills)
+
+
+def _visit_roles(doc: ResumeDocument, technical_skills: dict[str, list[str]]) -> tuple[Optional[str], Optional[str]]:
+    """_extract_roles over a tokenized resume: the top 30% is located by line offsets."""
+    search_cutoff = min(max(int(len(doc) * 0.3), 10), len(doc))
+    top_text = doc.text[:doc.line_ends[search_cutoff - 1]].lower() if search_cutoff else ""
+
     previous_role = None
     inferred_target_role = None
     
@@ -731,13 +907,8 @@ def _extract_roles(full_text: str, technical_skills: dict[str, list[str]]) -> tu
             
     # Inference by skill density matching
     if not previous_role:
-        best_score = 0
-        all_skill_strings = [s.lower() for cats in technical_skills.values() for s in cats]
-        for role, keywords in ROLE_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw.lower() in all_skill_strings or kw.lower() in full_text.lower())
-            if score > best_score:
-                best_score = score
-                inferred_target_role = role
+        all_skill_strings = [s for cats in technical_skills.values() for s in cats]
+        inferred_target_role = ROLE_SCORER.best_role(ROLE_SCORER.presence(all_skill_strings, doc.text))
                 
     return previous_role, inferred_target_role
 
@@ -746,7 +917,7 @@ def _extract_roles(full_text: str, technical_skills: dict[str, list[str]]) -> tu
 # ---------------------------------------------------------------------------
 
 def _validate_file(file, raw: bytes) -> None:
-    if not file.filename or not file.filename.lower().endswith(".pdf"):
+    if not file.filename or not file.filename.lower().endswith(".pdf") or raw[:len(PDF_MAGIC)] != PDF_MAGIC:
         raise BadRequest(
             description="Only PDF files are accepted."
         )
@@ -756,81 +927,147 @@ def _validate_file(file, raw: bytes) -> None:
         )
 
 
-def _extract_text(raw: bytes) -> str:
+def _validate_docx(file, raw: bytes) -> None:
+    if not file.filename or not file.filename.lower().endswith(".docx") or raw[:len(DOCX_MAGIC)] != DOCX_MAGIC:
+        raise BadRequest(
+            description="Only DOCX files are accepted."
+        )
+    if len(raw) > MAX_FILE_SIZE_BYTES:
+        raise RequestEntityTooLarge(
+            description="File exceeds the 5 MB size limit."
+        )
+
+
+class _SectionStream:
+    """
+    Consumes extracted pages one at a time and tracks section headers, so
+    extraction can stop as soon as the skills and experience sections have
+    both been seen *and* closed by a later header. Trailing pages
+    (publications, references, ...) are then never extracted.
+    """
+
+    def __init__(self):
+        self.pages: list[str] = []
+        self._current: Optional[str] = None
+        self._closed: set[str] = set()
+
+    def feed(self, page_text: str) -> None:
+        self.pages.append(page_text)
+        for line in page_text.splitlines():
+            header = normalise_header(line)
+            if not header:
+                continue
+            section = _SYNONYM_TO_SECTION.get(header)
+            if section is None and header in TRAILING_SECTION_HEADERS:
+                section = header
+            if section and section != self._current:
+                if self._current in _REQUIRED_SECTIONS:
+                    self._closed.add(self._current)
+                self._current = section
+
+    @property
+    def complete(self) -> bool:
+        return all(section in self._closed for section in _REQUIRED_SECTIONS)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.pages)
+
+
+def _extract_text(raw: pdf_extractor.PdfInput) -> str:
+    """
+    Streams pages out of the bounded extraction pool (services/pdf_extractor.py),
+    so a slow PDF never ties up the web worker, and stops reading once the
+    sections the analysis needs are complete. Timeouts surface as 422.
+    """
+    stream = _SectionStream()
     try:
-        with pdfplumber.open(io.BytesIO(raw)) as pdf:
-            pages = [page.extract_text() or "" for page in pdf.pages]
-        return "\n".join(pages)
+        for page_text in pdf_extractor.iter_pages(raw):
+            stream.feed(page_text)
+            if stream.complete:
+                logger.info(f"[ResumeParser] Skills and experience complete after page "
+                            f"{len(stream.pages)} — skipping the remaining pages.")
+                break
+        return stream.text
     except Exception as exc:
         raise UnprocessableEntity(
             description=f"Could not parse PDF: {exc}"
         )
 
 
+def _extract_docx_text(raw: docx_extractor.DocxInput) -> str:
+    """Body text of a .docx (see services/docx_extractor.py); unreadable files surface as 422."""
+    try:
+        return docx_extractor.extract_text(raw)
+    except Exception as exc:
+        raise UnprocessableEntity(
+            description=f"Could not parse DOCX: {exc}"
+        )
+
+
 # ---------------------------------------------------------------------------
 # ❽  Public Service Function
 # ---------------------------------------------------------------------------
 
-def process_resume(file, user_id: int) -> dict:
+def _analyse_text(
+    full_text: str,
+    previous_sections: Optional[dict] = None,
+    budget_seconds: Optional[float] = None,
+) -> dict:
     """
-    Full pipeline:
-      validate → extract text → detect sections → match skills → generate questions.
-    Returns a dict matching ResumeAnalysisOut (schemas/resume.py).
+    The user-independent part of the pipeline:
+      normalise aliases → tokenize (sections) → match skills → experience → roles → unknown skills.
+    Every stage after the tokenizer is a visitor over the same ResumeDocument.
+    *previous_sections* is the "sections" entry of an earlier analysis made
+    with the current analysis_version(); its unchanged sections are not
+    re-scanned. The result is JSON-serialisable so it can be stored in the
+    resume cache and in parsed_resumes.
+
+    Runs under a PARSE_BUDGET_SECONDS budget (*budget_seconds* overrides it,
+    0 for none). When the budget runs out the stages return what they found
+    so far and the result lists the stages cut short under "budget_exhausted".
     """
-    raw: bytes = file.read()
-    _validate_file(file, raw)
-
-    full_text = _extract_text(raw)
-    
-    # Normalise skill aliases (e.g., NodeJS -> Node.js) before any matching
-    full_text = normalize_skill_aliases(full_text)
-    
-    lines     = full_text.splitlines()
-
-    # ── Step 1: Dynamic section detection ────────────────────────────────────
-    sections = detect_sections_dynamic(full_text)
-    logger.info(f"[ResumeParser] Detected sections: {list(sections.keys())}")
-
-    # ── Step 2: Resolve the best text corpus for skill matching ──────────────
+    seconds = settings.parse_budget_seconds if budget_seconds is None else budget_seconds
+    with parse_budget.limit(seconds) as budget:
+        analysis = _analyse_stages(full_text, previous_sections)
+    if budget is not None and budget.exhausted:
+        analysis["budget_exhausted"] = list(budget.exhausted)
+    return analysis
+
+
+def _analyse_stages(full_text: str, previous_sections: Optional[dict]) -> dict:
+    """The stages of _analyse_text, in order."""
+    # Normalise skill aliases (e.g., NodeJS -> Node.js) before any matching.
+    # Everything below works on the normalised text; the rewrites are only counted.
+    with stage("aliases"):
+        full_text, alias_rewrites = normalize_skill_aliases_with_offsets(full_text)
+    logger.info(f"[ResumeParser] Alias rewrites: {len(alias_rewrites)}")
+
+    # ── Step 1: Tokenize — line offsets + section spans ──────────────────────
+    with stage("sections"):
+        doc = _tokenize(full_text)
+    logger.info(f"[ResumeParser] Detected sections: {list(doc.sections)}")
+
+    # ── Step 2: Match skills (tech + soft, one pass over the resume) ─────────
     #
-    # Priority:
+    # Tech skills come from the best corpus (see _skill_corpus):
     #   a) Dedicated skills section found          → use it exclusively
     #   b) No skills section + experience/projects → fallback trigger-word scan
     #   c) Nothing found at all                    → scan entire resume
-
-    skills_section_text: str = sections.get("skills", "")
-    logger.info(f"[ResumeParser] Skills section length: {len(skills_section_text)} chars")
-
-    if not skills_section_text.strip():
-        # Fallback heuristic — look for inline skill indicators
-        skills_section_text = _extract_skills_section_fallback(lines)
-        if skills_section_text.strip():
-            logger.info("[ResumeParser] Skills section obtained via fallback heuristic.")
-        else:
-            # Last resort — scan entire document
-            skills_section_text = full_text
-            logger.info("[ResumeParser] No skills section detected — scanning entire document.")
-
-    # ── Step 3: Experience section corpus for experience heuristic ───────────
-    experience_section_text = sections.get("experience", full_text)
-    logger.info(f"[ResumeParser] Experience section length: {len(experience_section_text)} chars")
-
-    # ── Step 4: Match skills ─────────────────────────────────────────────────
-    tech_skills = _match_skills_in_text(skills_section_text)
-    soft_skills = _match_soft_skills(skills_section_text)
-
-    # Also pick up soft skills mentioned outside the skills section
-    soft_skills_body = _match_soft_skills(full_text)
-    all_soft: list[str] = list(dict.fromkeys(soft_skills + soft_skills_body))
-
-    # ── Step 5: Experience detection ─────────────────────────────────────────
+    with stage("skills"):
+        sections, section_ranks = _visit_sections(doc, previous_sections)
+        skill_spans, skill_source = _skill_corpus(doc)
+        tech_skills, all_soft = _visit_skills(doc, skill_spans, skill_source, section_ranks)
+    logger.info(f"[ResumeParser] Skills corpus: {skill_source}, "
+                f"{sum(end - start for start, end in skill_spans)} chars")
+
+    # ── Step 3: Experience detection ─────────────────────────────────────────
     # Try experience section first; fall back to full text if needed.
-    experience = _detect_experience_years(experience_section_text)
-    if experience is None:
-        experience = _detect_experience_years(full_text)
+    with stage("experience"):
+        experience = _visit_experience(doc, sections)
     experience = experience or 0   # coerce None → 0
 
-    # ── Step 6: Question generation + Role Extraction ────────────────────────
+    # ── Step 4: Role Extraction ──────────────────────────────────────────────
     
     # Build structured technical_skills dict first
     technical_skills = {
@@ -845,27 +1082,10 @@ def process_resume(file, user_id: int) -> dict:
         "testing":      tech_skills.get("testing",      []),
     }
     
-    previous_role, inferred_target_role = _extract_roles(full_text, technical_skills)
-    fallback_role = previous_role or inferred_target_role
-    
-    analytics_data = analytics_service.get_category_performance_data(user_id)
-    weakest_category = analytics_data.get("weakest_category")
-    # Get the score so we can pass it down for dynamic weakness quota calculation
-    weak_score = 100.0
-    if weakest_category and "category_scores" in analytics_data:
-        scores = [cat["score"] for cat in analytics_data["category_scores"] if cat["category"] == weakest_category]
-        if scores:
-            weak_score = scores[0]
-    
-    questions = _generate_questions(
-        tech_skills, 
-        applied_role=fallback_role, 
-        weakest_category=weakest_category, 
-        weak_score=weak_score,
-        experience=experience
-    )
+    with stage("roles"):
+        previous_role, inferred_target_role = _visit_roles(doc, technical_skills)
 
-    # ── Step 7: tools_frameworks (web + devops + testing, flat, deduped) ─────
+    # ── Step 5: tools_frameworks (web + devops + testing, flat, deduped) ─────
     tools_set: list[str] = []
     seen_tools: set[str] = set()
     for cat in ("web", "devops", "testing"):
@@ -874,24 +1094,18 @@ def process_resume(file, user_id: int) -> dict:
                 seen_tools.add(skill.lower())
                 tools_set.append(skill)
                 
-    # ── Step 8: Unknown Skills Detection ─────────────────────────────────────
-    # Build complete known skills set
-    all_known_skills = set()
-    for cat_skills in TECH_SKILLS_DB.values():
-        all_known_skills.update(cat_skills)
-    for aliases in SKILL_ALIASES.values():
-        all_known_skills.update(aliases)
-        
-    unknown_skills = detect_unknown_skills(full_text, all_known_skills)
+    # ── Step 6: Unknown Skills Detection ─────────────────────────────────────
+    with stage("unknown_skills"):
+        unknown_skills = detect_unknown_skills(doc.text)
 
     logger.info(f"[ResumeParser] Tech skills found: "
           f"{ {k: len(v) for k, v in technical_skills.items() if v} }")
     logger.info(f"[ResumeParser] Soft skills found: {all_soft}")
     logger.info(f"[ResumeParser] Unknown skills detected: {unknown_skills}")
     logger.info(f"[ResumeParser] Experience years : {experience}")
-    logger.info(f"[ResumeParser] Questions generated: {len(questions)}")
 
     return {
+        "tech_skills":               tech_skills,
         "technical_skills":          technical_skills,
         "tools_frameworks":          tools_set,
         "soft_skills":               all_soft,
@@ -899,7 +1113,173 @@ def process_resume(file, user_id: int) -> dict:
         "detected_experience_years": experience,
         "previous_role":             previous_role,
         "inferred_target_role":      inferred_target_role,
+        "sections":                  sections,
+    }
+
+
+def process_resume(file, user_id: int) -> dict:
+    """
+    Full pipeline:
+      validate → extract text → detect sections → match skills → generate questions.
+    Returns a dict matching ResumeAnalysisOut (schemas/resume.py).
+    The upload is parsed from a memory map of its spooled file (core/uploads.py),
+    never read into memory as a whole.
+    """
+    with uploads.mapped(file) as raw:
+        _validate_file(file, raw)
+        return process_resume_bytes(raw, user_id)
+
+
+def process_resume_docx(file, user_id: int) -> dict:
+    """process_resume for a .docx upload: its XML is streamed (services/docx_extractor.py) instead of laid out."""
+    with uploads.mapped(file) as raw:
+        _validate_docx(file, raw)
+        with stage("cache_lookup"):
+            digest = hashlib.sha256(raw).hexdigest()
+        return _process_document(digest, lambda: _extract_docx_text(raw), user_id)
+
+
+def process_resume_text(text: str, user_id: int) -> dict:
+    """
+    process_resume for resume text extracted by the client or pasted in: the
+    stages after extraction, and the result, are the same. Text past
+    PDF_MAX_CHARS is ignored, as it is for PDFs.
+    """
+    text = text[:settings.pdf_max_chars]
+    if not text.strip():
+        raise BadRequest(description="The resume text is empty.")
+    with stage("cache_lookup"):
+        digest = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+    return _process_document(digest, lambda: text, user_id)
+
+
+def read_validated_upload(file) -> bytes:
+    """
+    Checks an uploaded resume's extension, magic bytes and size against the
+    memory map of its spooled file (core/uploads.py), then copies it out of
+    the map once, for storage in a queued job.
+    """
+    with uploads.mapped(file) as raw:
+        _validate_file(file, raw)
+        return raw[:]
+
+
+def analyse_resume_bytes(raw: bytes) -> dict:
+    """
+    The PDF analysis stages of process_resume (extract → sections → skills →
+    experience → roles) with no cache, DB access or question generation.
+    Used by bulk ingestion (services/bulk_ingest_service.py).
+    """
+    return _analyse_text(_extract_text(raw))
+
+
+def process_resume_bytes(
+    raw: pdf_extractor.PdfInput,
+    user_id: int,
+    on_stage: Optional[Callable[[str, int], None]] = None,
+) -> dict:
+    """
+    process_resume for an already-validated PDF (bytes or a mapped upload). *on_stage(stage, percent)*
+    is called as the pipeline advances (used by resume_job_service).
+    """
+    with stage("cache_lookup"):
+        digest = hashlib.sha256(raw).hexdigest()
+    return _process_document(digest, lambda: _extract_text(raw), user_id, on_stage)
+
+
+def _process_document(
+    digest: str,
+    extract: Callable[[], str],
+    user_id: int,
+    on_stage: Optional[Callable[[str, int], None]] = None,
+) -> dict:
+    """
+    Everything after validation, for a document whose content hash is
+    *digest* and whose text *extract()* returns.
+    The analysis stages are skipped when the same document was already parsed with
+    the current analysis_version() (see resume_cache); otherwise sections
+    unchanged since the user's previous upload are not re-scanned. Either
+    way the upload is recorded in parsed_resumes (see parsed_resume_service)
+    and its unknown skills are counted (see emerging_skills_service).
+    Question generation is user-specific and always runs.
+    """
+    report = on_stage or (lambda stage, percent: None)
+
+    with stage("cache_lookup"):
+        version = analysis_version()
+        key = resume_cache.digest_key(digest, version)
+        analysis = resume_cache.get(key)
+    if analysis is not None:
+        logger.info("[ResumeParser] Cache hit — skipping extraction and matching.")
+        with stage("record_store"):
+            stored = parsed_resume_service.store(user_id, digest, analysis, version)
+        if not stored:
+            # No stored text for this document yet: extract it once so the record can be re-analysed later.
+            with stage("extract"):
+                full_text = extract()
+            with stage("record_store"):
+                parsed_resume_service.store(user_id, digest, analysis, version, text=full_text)
+    else:
+        report("extracting", 10)
+        with stage("extract"):
+            full_text = extract()
+        report("analysing", 40)
+        with stage("record_lookup"):
+            previous = parsed_resume_service.previous_sections(user_id, version)
+        analysis = _analyse_text(full_text, previous)
+        if analysis.get("budget_exhausted"):
+            # Partial results are served but not cached; the record is left
+            # stale so reanalyse_resumes.py completes it.
+            record_version = parsed_resume_service.partial_version(version)
+        else:
+            record_version = version
+            with stage("cache_store"):
+                resume_cache.put(key, analysis)
+        with stage("record_store"):
+            parsed_resume_service.store(user_id, digest, analysis, record_version, text=full_text)
+
+    with stage("emerging_skills"):
+        emerging_skills_service.record(user_id, analysis["unknown_skills"])
+
+    tech_skills = analysis["tech_skills"]
+    experience  = analysis["detected_experience_years"]
+
+    # ── Question generation (user-specific, never cached) ────────────────────
+    report("generating_questions", 60)
+    fallback_role = analysis["previous_role"] or analysis["inferred_target_role"]
+    
+    with stage("analytics"):
+        analytics_data = analytics_service.get_category_performance_data(user_id)
+    weakest_category = analytics_data.get("weakest_category")
+    # Get the score so we can pass it down for dynamic weakness quota calculation
+    weak_score = 100.0
+    if weakest_category and "category_scores" in analytics_data:
+        scores = [cat["score"] for cat in analytics_data["category_scores"] if cat["category"] == weakest_category]
+        if scores:
+            weak_score = scores[0]
+    
+    with stage("questions"):
+        questions = _generate_questions(
+            tech_skills,
+            applied_role=fallback_role,
+            weakest_category=weakest_category,
+            weak_score=weak_score,
+            experience=experience
+        )
+    logger.info(f"[ResumeParser] Questions generated: {len(questions)}")
+
+    return {
+        "technical_skills":          analysis["technical_skills"],
+        "tools_frameworks":          analysis["tools_frameworks"],
+        "soft_skills":               analysis["soft_skills"],
+        "unknown_skills":            analysis["unknown_skills"],
+        "detected_experience_years": experience,
+        "previous_role":             analysis["previous_role"],
+        "inferred_target_role":      analysis["inferred_target_role"],
         "generated_questions":       questions,
+        # Set when the parse budget cut the analysis short: callers must not
+        # overwrite the user's profile with it (reanalyse_resumes.py completes it).
+        "partial":                   bool(analysis.get("budget_exhausted")),
     }
 
 
@@ -939,22 +1319,25 @@ def generate_questions_from_preferences(
         return []
 
     # Map the flat list of skills into the category format expected by the DB logic
-    technical_skills = bucket_skills(skills)
-            
+    with stage("bucket_skills"):
+        technical_skills = bucket_skills(skills)
+
     # Try getting the analytics weakest category for adaptive generation
     weakest_category = None
     if user_id is not None:
         try:
-            analytics_data = analytics_service.get_category_performance_data(user_id)
+            with stage("analytics"):
+                analytics_data = analytics_service.get_category_performance_data(user_id)
             weakest_category = analytics_data.get("weakest_category")
         except Exception as e:
             logger.warning(f"[generate_questions_from_preferences] failed to get analytics: {e}")
 
     # Pass the synthesised skills dict into the standard question generator
     # We guarantee these are the ONLY skills passed in.
-    return _generate_questions(
-        tech_skills=technical_skills,
-        applied_role=role,
-        weakest_category=weakest_category,
-        experience=experience
-    )
+    with stage("questions"):
+        return _generate_questions(
+            tech_skills=technical_skills,
+            applied_role=role,
+            weakest_category=weakest_category,
+            experience=experience
+        )
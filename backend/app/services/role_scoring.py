@@ -0,0 +1,88 @@
+"""
+role_scoring.py — Vectorised Role Scoring
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+ROLE_KEYWORDS precomputed as a roles × keywords incidence matrix. A resume or
+a user's skills become a 0/1 vector over the keyword vocabulary, and one
+matrix product scores it against every role; a stack of users is scored with
+a single (users × keywords) @ (keywords × roles) product.
+
+Shared by resume_service._extract_roles (role inference from a resume) and
+user_profile_service (suggest_roles, recompute_role_suggestions).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+class RoleScorer:
+    """Scores skill sets against every role of a ``{role: [keywords]}`` table."""
+
+    def __init__(self, role_keywords: dict[str, list[str]]):
+        self.roles: list[str] = list(role_keywords)
+        self.keywords: list[str] = list(dict.fromkeys(
+            kw.lower() for keywords in role_keywords.values() for kw in keywords
+        ))
+        self._index = {kw: i for i, kw in enumerate(self.keywords)}
+
+        # matrix[r, k] = how often keyword k is listed for role r
+        self.matrix = np.zeros((len(self.roles), len(self.keywords)), dtype=np.int32)
+        for r, keywords in enumerate(role_keywords.values()):
+            for kw in keywords:
+                self.matrix[r, self._index[kw.lower()]] += 1
+        self.keyword_counts = np.array([len(kws) for kws in role_keywords.values()], dtype=np.float64)
+
+        # Stored suggestions carry this, so a ROLE_KEYWORDS change invalidates them.
+        self.version = hashlib.sha1(json.dumps(role_keywords, sort_keys=True).encode()).hexdigest()[:12]
+
+    def presence(self, skills: Iterable[str], text: Optional[str] = None) -> np.ndarray:
+        """
+        0/1 vector over ``self.keywords``: a keyword is present if it equals one
+        of *skills* (case-insensitively) or, when *text* is given, occurs
+        anywhere in it.
+        """
+        vec = np.zeros(len(self.keywords), dtype=np.int32)
+        for skill in skills:
+            i = self._index.get(skill.lower())
+            if i is not None:
+                vec[i] = 1
+        if text is not None:
+            lowered = text.lower()
+            for i, kw in enumerate(self.keywords):
+                if not vec[i] and kw in lowered:
+                    vec[i] = 1
+        return vec
+
+    def best_role(self, presence: np.ndarray) -> Optional[str]:
+        """Role with the most present keywords (first role on ties), or None if none match."""
+        scores = self.matrix @ presence
+        best = int(np.argmax(scores))
+        return self.roles[best] if scores[best] > 0 else None
+
+    def score_many(self, skill_sets: Iterable[Iterable[str]]) -> np.ndarray:
+        """Keyword overlap of every skill set with every role, shape (len(skill_sets), roles)."""
+        rows = [self.presence(skills) for skills in skill_sets]
+        if not rows:
+            return np.zeros((0, len(self.roles)), dtype=np.int32)
+        return np.stack(rows) @ self.matrix.T
+
+    def match_scores(self, overlaps: np.ndarray) -> np.ndarray:
+        """Overlap → integer percentage of each role's keywords (0 for roles without keywords)."""
+        # Divide first, then scale: truncates exactly like
+        # int((overlap / len(keywords)) * 100) in plain Python.
+        ratio = np.divide(overlaps, self.keyword_counts,
+                          out=np.zeros(overlaps.shape, dtype=np.float64), where=self.keyword_counts > 0)
+        return (ratio * 100).astype(np.int64)
+
+    def suggestions(self, overlaps: np.ndarray, limit: int = 3) -> list[dict]:
+        """Top *limit* non-zero ``{"role", "match_score"}`` entries for one row of overlaps."""
+        scores = self.match_scores(overlaps)
+        order = np.argsort(-scores, kind="stable")
+        return [
+            {"role": self.roles[i], "match_score": int(scores[i])}
+            for i in order[:limit] if scores[i] > 0
+        ]
@@ -0,0 +1,252 @@
+"""
+skill_matcher.py — Single-Pass Multi-Pattern Skill Matcher
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Strategy
+--------
+* All keywords (skills + aliases) are folded into one character trie.
+* One C-level regex sweep finds every candidate start position, i.e. a
+  character that can begin a keyword and is not preceded by [a-z0-9_].
+* From each start position the trie is walked; a keyword counts as a hit
+  only if the next character is not in [a-z0-9_].
+
+This is exactly the lookaround semantics of the old per-skill patterns
+``(?<![a-z0-9_])keyword(?![a-z0-9_])`` (so ``C++``, ``Node.js`` and ``CI/CD``
+keep working), but the text is scanned once regardless of taxonomy size.
+Both scans stop early when the analysis runs out of its parse_budget.
+Overlapping hits are all reported, e.g. "React Native" yields both
+"React" and "React Native" just like the old loop did.
+
+AliasNormalizer is the matching pre-pass: a compiled alias rewriter that also
+reports which spans it rewrote, so later stages can map hits back to the
+original (pre-normalisation) text.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from app.services.parse_budget import bounded
+
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+# Trie key holding the ranks of every entry that terminates at a node.
+# Real keys are single characters, so None can never collide.
+_TERMINAL = None
+
+
+class SkillMatch(NamedTuple):
+    """One keyword hit. Offsets refer to the text passed to ``scan``."""
+    start: int
+    end: int
+    skill: str
+    category: str
+
+
+def fold_preserving_offsets(text: str) -> str:
+    """
+    Case-folds *text* while keeping a 1:1 character mapping, mirroring what
+    re.IGNORECASE treats as equal (e.g. 'ſ' == 's'). A few code points fold to
+    two characters ('ß', 'İ'), which would shift every later offset, so those
+    fall back to the first character of their lower-case form.
+    """
+    folded = text.casefold()
+    if len(folded) == len(text):
+        return folded
+    return "".join(f if len(f := ch.casefold()) == 1 else ch.lower()[:1] for ch in text)
+
+
+class SkillMatcher:
+    """
+    Compiled matcher over ``(keyword, skill, category)`` entries.
+
+    Several keywords may point at the same ``(skill, category)`` pair
+    (aliases); results are always reported under the canonical skill and
+    ordered by the position of that pair in the entry list, so output is
+    stable regardless of where the skill appears in the text.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str, str]]):
+        self._trie: dict = {}
+        self._pairs: list[tuple[str, str]] = []          # rank -> (skill, category)
+        self._rank_of: dict[tuple[str, str], int] = {}   # (skill, category) -> rank
+        rank_of = self._rank_of
+        first_chars: set[str] = set()
+        self.keyword_count = 0
+
+        for keyword, skill, category in entries:
+            key = fold_preserving_offsets(keyword)
+            if not key:
+                continue
+            pair = (skill, category)
+            rank = rank_of.get(pair)
+            if rank is None:
+                rank = rank_of[pair] = len(self._pairs)
+                self._pairs.append(pair)
+
+            node = self._trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            ranks = node.get(_TERMINAL)
+            if ranks is None:
+                ranks = node[_TERMINAL] = []
+                self.keyword_count += 1
+            if rank not in ranks:
+                ranks.append(rank)
+            first_chars.add(key[0])
+
+        if first_chars:
+            char_class = "".join(re.escape(ch) for ch in sorted(first_chars))
+            self._start_re = re.compile(r"(?<![a-z0-9_])(?=[" + char_class + r"])", re.IGNORECASE)
+        else:
+            self._start_re = None
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def _scan_ranks(self, lowered: str, pos: int = 0, endpos: Optional[int] = None) -> Iterator[tuple[int, int, int]]:
+        """Yields (start, end, rank) for every boundary-respecting hit in ``lowered[pos:endpos]``, in place."""
+        if self._start_re is None:
+            return
+        trie = self._trie
+        n    = len(lowered) if endpos is None else endpos
+        for m in bounded("skills", self._start_re.finditer(lowered, pos, n)):
+            start = m.start()
+            node  = trie
+            i     = start
+            while i < n:
+                node = node.get(lowered[i])
+                if node is None:
+                    break
+                i += 1
+                ranks = node.get(_TERMINAL)
+                if ranks and (i == n or lowered[i] not in _WORD_CHARS):
+                    for rank in ranks:
+                        yield start, i, rank
+
+    def scan(self, text: str) -> Iterator[SkillMatch]:
+        """Yields every keyword hit in *text*, in order of start offset."""
+        pairs = self._pairs
+        for start, end, rank in self._scan_ranks(fold_preserving_offsets(text)):
+            skill, category = pairs[rank]
+            yield SkillMatch(start, end, skill, category)
+
+    def hits(self, folded: str, start: int = 0, end: Optional[int] = None) -> Iterator[tuple[int, int, int]]:
+        """
+        Yields every hit in ``folded[start:end]`` as ``(start, end, rank)``, in
+        order of start offset. *folded* is a text already passed through
+        fold_preserving_offsets (ResumeDocument.folded), so one folded copy of
+        a document serves every span scanned in it; the span is walked in
+        place, never sliced. *start* and *end* should sit on whitespace or
+        line boundaries. Callers keep the ranks they need and pass them to
+        ``group``.
+        """
+        return self._scan_ranks(folded, start, end)
+
+    def group(self, ranks: Iterable[int]) -> dict[str, list[str]]:
+        """``{category: [skill, ...]}`` for a set of hit ranks, in entry order."""
+        result: dict[str, list[str]] = {}
+        for rank in sorted(set(ranks)):
+            skill, category = self._pairs[rank]
+            result.setdefault(category, []).append(skill)
+        return result
+
+    def pairs(self, ranks: Iterable[int]) -> list[tuple[str, str]]:
+        """``(skill, category)`` for a set of hit ranks, in entry order (storable form of ranks)."""
+        return [self._pairs[rank] for rank in sorted(set(ranks))]
+
+    def ranks(self, pairs: Iterable[Iterable[str]]) -> set[int]:
+        """Inverse of ``pairs``; pairs no longer in the taxonomy are dropped."""
+        rank_of = self._rank_of
+        return {rank for pair in pairs if (rank := rank_of.get(tuple(pair))) is not None}
+
+    def match(self, text: str) -> dict[str, list[str]]:
+        """
+        Returns ``{category: [skill, ...]}`` for every category with at least
+        one hit. Skills are de-duplicated and kept in entry order.
+        """
+        return self.group(rank for _, _, rank in self._scan_ranks(fold_preserving_offsets(text)))
+
+
+# ---------------------------------------------------------------------------
+# Alias normalisation
+# ---------------------------------------------------------------------------
+
+class AliasRewrite(NamedTuple):
+    """
+    One alias replaced by its canonical form.
+    ``src_*`` offsets refer to the input text, ``dst_*`` to the normalised text.
+    """
+    src_start: int
+    src_end: int
+    dst_start: int
+    dst_end: int
+    canonical: str
+
+
+class AliasNormalizer:
+    """
+    Pre-compiled single-pass alias rewriter (e.g. NodeJS -> Node.js).
+    Longer aliases win ('React JS' before 'JS') and replacements are never
+    re-scanned, so there are no cascading rewrites. Canonical names are
+    matched too and left as they are, so the 'JS' inside a literal 'Node.js'
+    is not rewritten to 'Node.js.JavaScript'.
+    """
+
+    def __init__(self, aliases: dict[str, list[str]]):
+        self._alias_map: dict[str, str] = {}
+        for canonical, alias_list in aliases.items():
+            for alias in alias_list:
+                self._alias_map[alias.lower()] = canonical
+        # Canonical spellings that are not themselves an alias: matched, never rewritten.
+        self._canonical = {canonical.lower() for canonical in aliases} - self._alias_map.keys()
+
+        if self._alias_map:
+            # Sort by length descending so 'React JS' matches before 'React' or 'JS'
+            sorted_aliases = sorted((*self._alias_map, *self._canonical), key=len, reverse=True)
+            pattern = r"\b(" + "|".join(re.escape(a) for a in sorted_aliases) + r")\b"
+            self._pattern: re.Pattern | None = re.compile(pattern, re.IGNORECASE)
+        else:
+            self._pattern = None
+
+    def normalize(self, text: str) -> tuple[str, list[AliasRewrite]]:
+        """Returns (normalised_text, rewrites) with rewrites in text order."""
+        if self._pattern is None:
+            return text, []
+
+        pieces: list[str] = []
+        rewrites: list[AliasRewrite] = []
+        last  = 0
+        shift = 0
+        for m in bounded("aliases", self._pattern.finditer(text)):
+            canonical  = self._alias_map.get(m.group(1).lower())
+            if canonical is None:
+                continue
+            start, end = m.span()
+            pieces.append(text[last:start])
+            pieces.append(canonical)
+            dst_start = start + shift
+            rewrites.append(AliasRewrite(start, end, dst_start, dst_start + len(canonical), canonical))
+            shift += len(canonical) - (end - start)
+            last = end
+
+        if not rewrites:
+            return text, []
+        pieces.append(text[last:])
+        return "".join(pieces), rewrites
+
+
+def to_original_offset(rewrites: list[AliasRewrite], offset: int) -> int:
+    """
+    Maps an offset in normalised text back to the text before alias rewriting.
+    Offsets inside a rewritten span map to the start of the original alias.
+    """
+    idx = bisect.bisect_right([r.dst_start for r in rewrites], offset) - 1
+    if idx < 0:
+        return offset
+    rewrite = rewrites[idx]
+    if offset < rewrite.dst_end:
+        return rewrite.src_start
+    return offset - rewrite.dst_end + rewrite.src_end
@@ -1,23 +1,26 @@
 import json
 from app.database import db
 from app.models.user_profile import UserProfile
-from app.services.resume_service import ROLE_KEYWORDS
+from app.services import resume_service
 
 def update_user_profile(user_id: int, skills: dict, previous_role: str | None, target_role: str | None) -> UserProfile:
     profile = db.session.query(UserProfile).filter_by(user_id=user_id).first()
     
     skills_json = json.dumps(skills) if skills else None
+    suggested_roles_json = role_suggestions_json(skills)
     
     if profile:
         profile.skills_json = skills_json
         profile.previous_role = previous_role
         profile.target_role = target_role
+        profile.suggested_roles_json = suggested_roles_json
     else:
         profile = UserProfile(
             user_id=user_id,
             skills_json=skills_json,
             previous_role=previous_role,
-            target_role=target_role
+            target_role=target_role,
+            suggested_roles_json=suggested_roles_json
         )
         db.session.add(profile)
         
@@ -28,38 +31,91 @@ def update_user_profile(user_id: int, skills: dict, previous_role: str | None, t
 def get_user_profile(user_id: int) -> UserProfile | None:
     return db.session.query(UserProfile).filter_by(user_id=user_id).first()
 
-def suggest_roles(user_id: int) -> list[dict]:
-    profile = get_user_profile(user_id)
-    if not profile or not profile.skills_json:
+def _flatten_skills(skills: dict | None) -> list[str]:
+    if not isinstance(skills, dict):
         return []
-        
+    return [skill for category_skills in skills.values() for skill in category_skills]
+
+def _load_skills(skills_json: str | None) -> dict | None:
+    if not skills_json:
+        return None
     try:
-        skills_dict = json.loads(profile.skills_json)
+        return json.loads(skills_json)
     except Exception:
+        return None
+
+def role_suggestions_json(skills: dict | None) -> str:
+    """Scores *skills* against every role and returns the value stored in suggested_roles_json."""
+    scorer = resume_service.ROLE_SCORER
+    overlaps = scorer.score_many([_flatten_skills(skills)])[0]
+    return json.dumps({"version": scorer.version, "roles": scorer.suggestions(overlaps)})
+
+def profile_values(analysis: dict) -> dict:
+    """
+    The UserProfile columns a resume analysis sets, as update_user_profile
+    writes them; for bulk update/insert mappings.
+    """
+    skills = analysis.get("technical_skills")
+    return {
+        "skills_json": json.dumps(skills) if skills else None,
+        "previous_role": analysis.get("previous_role"),
+        "target_role": analysis.get("inferred_target_role"),
+        "suggested_roles_json": role_suggestions_json(skills),
+    }
+
+def suggest_roles(user_id: int) -> list[dict]:
+    profile = get_user_profile(user_id)
+    if not profile or not profile.skills_json:
         return []
-        
-    # Flatten all detected skills into a lowercase set for matching
-    user_skills_flat = set()
-    for category_skills in skills_dict.values():
-        for skill in category_skills:
-            user_skills_flat.add(skill.lower())
-            
-    if not user_skills_flat:
+
+    # Precomputed on every profile update / by recompute_role_suggestions;
+    # only trusted while ROLE_KEYWORDS is unchanged.
+    if profile.suggested_roles_json:
+        try:
+            stored = json.loads(profile.suggested_roles_json)
+            if stored.get("version") == resume_service.ROLE_SCORER.version:
+                return stored["roles"]
+        except Exception:
+            pass
+
+    skills = _load_skills(profile.skills_json)
+    if skills is None:
         return []
+    return json.loads(role_suggestions_json(skills))["roles"]
 
-    suggestions = []
-    
-    for role, keywords in ROLE_KEYWORDS.items():
-        overlap = sum(1 for kw in keywords if kw.lower() in user_skills_flat)
-        # Calculate a rough percentage match score
-        match_score = int((overlap / len(keywords)) * 100) if keywords else 0
-        suggestions.append({
-            "role": role,
-            "match_score": match_score
-        })
-        
-    # Sort descending by match score
-    suggestions.sort(key=lambda x: x["match_score"], reverse=True)
-    
-    # Return top 3 non-zero suggestions
-    return [s for s in suggestions if s["match_score"] > 0][:3]
+def recompute_role_suggestions(batch_size: int = 1000) -> int:
+    """
+    Re-scores every profile's role suggestions, one matrix product per batch
+    of profiles (run after changing ROLE_KEYWORDS). Returns profiles updated.
+    """
+    scorer = resume_service.ROLE_SCORER
+    updated = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.session.query(UserProfile.id, UserProfile.skills_json, UserProfile.updated_at)
+            .filter(UserProfile.id > last_id)
+            .order_by(UserProfile.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return updated
+        last_id = rows[-1].id
+
+        overlaps = scorer.score_many(_flatten_skills(_load_skills(row.skills_json)) for row in rows)
+        db.session.execute(
+            db.update(UserProfile),
+            [
+                {
+                    "id": row.id,
+                    "updated_at": row.updated_at,   # derived data — don't bump onupdate
+                    "suggested_roles_json": json.dumps(
+                        {"version": scorer.version, "roles": scorer.suggestions(overlaps[i])}
+                    ),
+                }
+                for i, row in enumerate(rows)
+            ],
+        )
+        db.session.commit()
+        updated += len(rows)
@@ -0,0 +1,183 @@
+"""
+bench_corpus.py — helpers for building local resume PDFs for the bench_* scripts.
+
+The checked-in test PDFs (test_core_competencies.pdf, test_no_skills_header.pdf)
+are used as text templates: their "(...) Tj" lines are read straight from the
+file and re-rendered into well-formed PDFs with a proper xref table.
+
+build_synthetic_corpus() varies those templates (length, page count, header
+style, skill density) into a larger, seeded and therefore reproducible corpus.
+"""
+import glob
+import os
+import random
+import re
+
+TEMPLATE_GLOB = "test_*.pdf"
+
+_TJ_RE = re.compile(rb"\(((?:[^()\\]|\\.)*)\)\s*Tj")
+
+
+def template_lines(path: str) -> list[str]:
+    """Returns the text lines drawn by a template PDF, in content-stream order."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    lines = []
+    for m in _TJ_RE.finditer(data):
+        text = re.sub(rb"\\(.)", rb"\1", m.group(1))
+        lines.append(text.decode("latin-1"))
+    return lines
+
+
+def templates() -> dict[str, list[str]]:
+    return {os.path.basename(p): template_lines(p) for p in sorted(glob.glob(TEMPLATE_GLOB))}
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: list[list[str]], font_size: int = 11, leading: int = 14) -> bytes:
+    """Renders *pages* (lists of text lines) as a minimal single-column Helvetica PDF."""
+    n = len(pages)
+    font_id = 3 + 2 * n
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(n))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {n} >>",
+    ]
+    for i, lines in enumerate(pages):
+        ops = ["BT", f"/F1 {font_size} Tf"]
+        y = 800
+        for line in lines:
+            ops.append(f"1 0 0 1 40 {y} Tm ({_escape(line)}) Tj")
+            y -= leading
+        ops.append("ET")
+        stream = "\n".join(ops)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref_at = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return out
+
+
+def paginate(lines: list[str], lines_per_page: int = 52) -> list[list[str]]:
+    return [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+
+def build_basic_corpus(out_dir: str) -> list[str]:
+    """Writes each template as a valid PDF plus a long multi-page variant. Returns the paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for name, lines in templates().items():
+        for label, body in (("", lines), ("_long", lines * 12)):
+            path = os.path.join(out_dir, name.replace(".pdf", f"{label}.pdf"))
+            with open(path, "wb") as fh:
+                fh.write(make_pdf(paginate(body)))
+            paths.append(path)
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+# Alternative spellings for the template headers, keyed by the template text.
+HEADER_VARIANTS = {
+    "professional summary": ["PROFESSIONAL SUMMARY", "Summary", "Profile:", "CAREER OBJECTIVE"],
+    "core competencies": ["Core Competencies", "TECHNICAL SKILLS", "Key Skills:", "Areas of Expertise", "Skills & Strengths"],
+    "professional experience": ["PROFESSIONAL EXPERIENCE", "Work History", "Employment History:", "EXPERIENCE"],
+    "work experience": ["WORK EXPERIENCE", "Career History", "Experience:", "Professional Experience"],
+    "education": ["EDUCATION", "Academic Background", "Qualifications:"],
+}
+
+# Skills mentioned per resume at each density level.
+SKILL_DENSITY = {"low": 3, "medium": 15, "high": 60}
+
+# Extra experience entries appended per resume at each length level.
+LENGTHS = {"short": 0, "medium": 6, "long": 40}
+
+_FILLER = [
+    "Led a team of {n} engineers delivering features on schedule.",
+    "Reduced latency by {n}% through profiling and caching.",
+    "Worked closely with product and design on quarterly planning.",
+    "Mentored {n} junior developers and ran weekly code reviews.",
+    "Owned on-call rotation for {n} production services.",
+]
+
+
+def _is_header(line: str) -> bool:
+    return line.strip().lower().rstrip(":") in HEADER_VARIANTS
+
+
+def synthetic_resume(lines: list[str], rng: random.Random, skills: list[str],
+                     length: str, density: str, entries: int | None = None) -> list[str]:
+    """
+    Rewrites one template: swapped header styles, injected skills and extra
+    experience. *entries* overrides the number of experience entries implied
+    by *length*.
+    """
+    picked = rng.sample(skills, min(len(skills), SKILL_DENSITY[density]))
+    extra: list[str] = []
+    for i in range(LENGTHS[length] if entries is None else entries):
+        year = 2000 + rng.randrange(0, 24)
+        extra += [
+            "",
+            f"Software Engineer - Company{i}  {year} - {year + rng.randrange(1, 5)}",
+            rng.choice(_FILLER).format(n=rng.randrange(2, 40)) + f" Used {rng.choice(picked)}.",
+        ]
+
+    out: list[str] = []
+    section = ""
+    skills_injected = False
+    for line in lines:
+        if _is_header(line):
+            if "experience" in section:
+                # Lengthen the experience section in place (before its trailing blank line).
+                at = len(out) - 1 if out and not out[-1] else len(out)
+                out[at:at] = extra
+                extra = []
+            section = line.strip().lower().rstrip(":")
+            out.append(rng.choice(HEADER_VARIANTS[section]))
+            continue
+        out.append(line)
+        if not skills_injected and "," in line and (section == "core competencies" or ":" in line):
+            # A skills line — widen it to the requested density, ~8 skills per line.
+            out += [", ".join(picked[i:i + 8]) for i in range(0, len(picked), 8)]
+            skills_injected = True
+    return out + extra
+
+
+def build_synthetic_corpus(out_dir: str, skills: list[str], count: int = 48, seed: int = 1234) -> list[str]:
+    """
+    Writes *count* resumes cycling through every template × length × density
+    combination, with random header styles and page heights. Returns the paths.
+    *skills* is the vocabulary injected into skills sections (e.g. the taxonomy).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    sources = list(templates().items())
+    combos = [(name, lines, length, density)
+              for name, lines in sources for length in LENGTHS for density in SKILL_DENSITY]
+    paths = []
+    for i in range(count):
+        name, lines, length, density = combos[i % len(combos)]
+        body = synthetic_resume(lines, rng, skills, length, density)
+        path = os.path.join(out_dir, f"{i:03d}_{length}_{density}_{name}")
+        with open(path, "wb") as fh:
+            fh.write(make_pdf(paginate(body, rng.choice((30, 45, 52)))))
+        paths.append(path)
+    return paths
@@ -0,0 +1,142 @@
+"""
+bench_dedup.py — near-duplicate question filter: agreement and speed.
+Run with:
+    venv\\Scripts\\python.exe bench_dedup.py [--seed 7]
+
+Builds question streams from QUESTION_BANK, the generic per-skill templates
+of _generate_questions and seeded near-variants of them (word swaps, typos,
+appended clauses, skill substitutions), then compares
+NearDuplicateIndex (services/near_duplicates.py) with the plain
+"any(SequenceMatcher(None, new, ex).ratio() > 0.85)" scan it replaced:
+
+  * pairwise agreement on near pairs — the only possible disagreement is a
+    missed duplicate (the shingle prefilter is the only approximate stage;
+    every duplicate verdict is confirmed by an exact ratio());
+  * whether the accepted lists are identical on whole streams;
+  * time per stream at several stream sizes.
+"""
+import argparse
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+
+sys.path.insert(0, ".")
+
+THRESHOLD = 0.85
+STREAM_SIZES = (20, 100, 500, 2000)
+
+_TEMPLATES = (
+    "Describe your experience with {s} in a production environment.",
+    "What are the most challenging aspects of working with {s}?",
+    "Can you walk me through a complex problem you solved using {s}?",
+    "How do you stay updated with the latest developments in {s}?",
+    "How would you explain the core concepts of {s} to a junior engineer?",
+    "Describe a time you had to optimize performance related to {s}.",
+)
+
+_CLAUSES = (" Give a concrete example.", " What would you do differently?", " Why?",
+            " Keep it brief.", " Include any metrics you tracked.")
+
+
+def _mutate(text: str, rng: random.Random, skills: list[str]) -> str:
+    words = text.split()
+    kind = rng.randrange(5)
+    if kind == 0 and len(words) > 3:
+        words[rng.randrange(len(words))] = rng.choice(("really", "the", "a", "your", "complex", "key"))
+        return " ".join(words)
+    if kind == 1:
+        chars = list(text)
+        for _ in range(rng.randrange(1, 4)):
+            i = rng.randrange(len(chars))
+            chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz ")
+        return "".join(chars)
+    if kind == 2:
+        return text + rng.choice(_CLAUSES)
+    if kind == 3:
+        return text.replace(rng.choice(skills), rng.choice(skills), 1) if skills else text
+    i = rng.randrange(len(words))
+    return " ".join(words[:i] + [rng.choice(("please", "briefly", "exactly"))] + words[i:])
+
+
+def build_pool(rng: random.Random) -> tuple[list[str], list[str]]:
+    from app.services.resume_service import QUESTION_BANK, TECH_SKILLS_DB
+
+    skills = [s for cat in TECH_SKILLS_DB.values() for s in cat]
+    base = [q[k] for pairs in QUESTION_BANK.values() for q in pairs for k in ("main", "follow_up")]
+    base += [t.format(s=s) for s in skills for t in _TEMPLATES]
+    return base, skills
+
+
+def stream(base: list[str], skills: list[str], size: int, rng: random.Random) -> list[str]:
+    out = []
+    for _ in range(size):
+        q = rng.choice(base)
+        if rng.random() < 0.4:
+            q = _mutate(q, rng, skills)
+        out.append(q)
+    return out
+
+
+def legacy_filter(questions: list[str]) -> list[str]:
+    accepted: list[str] = []
+    for q in questions:
+        if not any(SequenceMatcher(None, q, ex).ratio() > THRESHOLD for ex in accepted):
+            accepted.append(q)
+    return accepted
+
+
+def index_filter(questions: list[str]) -> list[str]:
+    from app.services.near_duplicates import NearDuplicateIndex
+
+    seen = NearDuplicateIndex(THRESHOLD)
+    return [q for q in questions if seen.add_if_new(q)]
+
+
+def pairwise_agreement(base: list[str], skills: list[str], rng: random.Random, pairs: int) -> None:
+    from app.services.near_duplicates import NearDuplicateIndex
+
+    missed = false_dups = legacy_dups = 0
+    for _ in range(pairs):
+        a = rng.choice(base)
+        b = _mutate(a, rng, skills)
+        if rng.random() < 0.5:
+            b = _mutate(b, rng, skills)
+        legacy = SequenceMatcher(None, b, a).ratio() > THRESHOLD
+        index = NearDuplicateIndex(THRESHOLD)
+        index.add(a)
+        new = index.is_duplicate(b)
+        legacy_dups += legacy
+        missed += legacy and not new
+        false_dups += new and not legacy
+    print(f"Pairwise ({pairs} near pairs): {legacy_dups} duplicates by SequenceMatcher, "
+          f"{missed} missed ({missed / max(legacy_dups, 1):.3%}), {false_dups} false duplicates")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Near-duplicate filter benchmark")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--pairs", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    base, skills = build_pool(rng)
+    print(f"Question pool: {len(base)} base questions\n")
+    pairwise_agreement(base, skills, rng, args.pairs)
+
+    print(f"\n{'stream':>6} | {'accepted':>8} | {'identical':>9} | {'legacy ms':>9} | {'index ms':>8} | {'speedup':>7}")
+    print("-" * 64)
+    for size in STREAM_SIZES:
+        questions = stream(base, skills, size, rng)
+        start = time.perf_counter()
+        legacy = legacy_filter(questions)
+        legacy_s = time.perf_counter() - start
+        start = time.perf_counter()
+        new = index_filter(questions)
+        new_s = time.perf_counter() - start
+        print(f"{size:>6} | {len(new):>8} | {str(new == legacy):>9} | {legacy_s * 1000:>9.1f} | "
+              f"{new_s * 1000:>8.1f} | {legacy_s / new_s:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+bench_interview.py — POST /interviews/ latency: serial, concurrent and batched Gemini calls.
+Run with:
+    venv\\Scripts\\python.exe bench_interview.py [--quick]
+
+The app runs against a throwaway SQLite database with llm_service's Gemini
+client replaced by a local stand-in. The stand-in answers every prompt the
+service sends (single evaluation, batch evaluation, summary) and sleeps as
+the API would: FIRST_TOKEN_SECONDS plus the response's tokens (4 characters
+each) at TOKENS_PER_SECOND. In batch responses MALFORMED_RATE of the items
+come back broken (score "high"), so the single-item retry path is part of
+the measurement. Scores are a function of the answer alone, so every mode
+must store the same per-answer scores — checked for every interview.
+
+Modes:
+  * serial      — one call per answer, one after another (LLM_MAX_CONCURRENCY=0)
+  * concurrent  — one call per answer, fanned out (services/llm_fanout.py)
+  * batched     — the whole interview per call (LLM_BATCH_EVALUATION)
+
+The response cache (services/llm_cache.py) is off for these runs. A
+further run submits one interview twice per mode with the cache on, and a
+last one stalls STALL_RATE of the calls for STALL_SECONDS under a
+DEADLINE_SECONDS request deadline, to show the deadline fallback.
+
+--quick divides all delays by 10.
+"""
+import json
+import logging
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, ".")
+
+FIRST_TOKEN_SECONDS = 0.40
+TOKENS_PER_SECOND = 200
+MALFORMED_RATE = 0.1
+INTERVIEW_SIZES = (5, 10, 20)
+REPEATS = 2
+STALL_RATE = 0.2
+STALL_SECONDS = 6.0
+DEADLINE_SECONDS = 3.0
+
+MODES = {
+    # name: (LLM_BATCH_EVALUATION, LLM_MAX_CONCURRENCY)
+    "serial": (False, 0),
+    "concurrent": (False, 8),
+    "batched": (True, 8),
+}
+
+CATEGORIES = ("Python", "Django", "PostgreSQL", "Docker", "System Design")
+
+
+class FakeGemini:
+    """Stands in for genai.Client: client.models.generate_content(...)."""
+
+    def __init__(self, scale: float, seed: int = 21):
+        self.models = self
+        self.scale = scale
+        self.calls = 0
+        self.stall_rate = 0.0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _evaluation(answer: str) -> dict:
+        return {
+            "score": min(100, 35 + len(answer) % 60),
+            "strengths": ["Explained the core mechanism clearly.", "Gave a concrete example from practice."],
+            "improvements": ["Discuss failure modes and how to detect them."],
+            "suggestions": ["Compare the approach with one alternative and its trade-offs."],
+        }
+
+    def generate_content(self, model, contents, config):
+        instruction = config.system_instruction
+        if '"evaluations"' in instruction:
+            answers = re.findall(r"Candidate Answer: (.*?)(?=\n\nItem \d+\n|\Z)", contents, re.S)
+            evaluations = []
+            for number, answer in enumerate(answers, start=1):
+                evaluation = {"item": number, **self._evaluation(answer)}
+                with self._lock:
+                    if self._rng.random() < MALFORMED_RATE:
+                        evaluation["score"] = "high"
+                evaluations.append(evaluation)
+            body = {"evaluations": evaluations}
+            if '"summary"' in instruction:
+                body["summary"] = ("The candidate showed solid fundamentals across the stack and explained "
+                                   "their design choices well. Their primary weakness was operational depth: "
+                                   "failure handling and monitoring came up only when prompted.")
+            text = json.dumps(body)
+        elif getattr(config, "response_mime_type", None) == "application/json":
+            text = json.dumps(self._evaluation(contents.split("Candidate Answer: ", 1)[1]))
+        else:
+            text = ("The candidate showed solid fundamentals across the stack and explained their design "
+                    "choices well. Their primary weakness was operational depth.")
+        with self._lock:
+            self.calls += 1
+            stalled = self._rng.random() < self.stall_rate
+        seconds = STALL_SECONDS if stalled else FIRST_TOKEN_SECONDS + len(text) / 4 / TOKENS_PER_SECOND
+        time.sleep(seconds * self.scale)
+        return type("Response", (), {"text": text})()
+
+
+def build_client():
+    from app.core.config import settings
+
+    settings.database_url = "sqlite:///" + tempfile.mktemp(suffix=".db")
+    settings.stage_timing = False
+    from app.database import db
+    from app.main import create_app
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+    client = app.test_client()
+    client.post("/auth/register", json={"email": "bench@example.com", "password": "password123"})
+    token = client.post("/auth/login", json={"email": "bench@example.com", "password": "password123"}).get_json()
+    return client, {"Authorization": "Bearer " + token["access_token"]}, settings.database_url
+
+
+def interview(size: int, rng: random.Random) -> dict:
+    return {
+        "role_applied_for": "Backend Developer",
+        "responses": [
+            {
+                "question": f"Question {i}: how would you approach {CATEGORIES[i % len(CATEGORIES)]} at scale?",
+                "answer": " ".join(rng.choice(("index", "cache", "queue", "retry", "shard", "replica", "lock"))
+                                   for _ in range(rng.randint(20, 90))),
+                "category": CATEGORIES[i % len(CATEGORIES)],
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    scale = 0.1 if "--quick" in sys.argv else 1.0
+    from app.core.config import settings
+    from app.services import llm_cache, llm_fanout, llm_service
+
+    settings.gemini_api_key = "bench"
+    cache_ttl, settings.llm_cache_ttl_seconds = settings.llm_cache_ttl_seconds, 0
+    fake = FakeGemini(scale)
+    llm_service._client = fake
+    client, headers, database_url = build_client()
+
+    print(f"Gemini stand-in: {FIRST_TOKEN_SECONDS * scale:.2f}s to first token, "
+          f"{TOKENS_PER_SECOND / scale:.0f} tokens/s, {MALFORMED_RATE:.0%} malformed batch items\n")
+    header = " | ".join(f"{name + ' ms':>13} | calls" for name in MODES)
+    print(f"{'answers':>7} | {header} | scores equal")
+    print("-" * (22 + 22 * len(MODES)))
+    ok = True
+    rng = random.Random(0)
+    for size in INTERVIEW_SIZES:
+        cells, scores = [], []
+        payloads = [interview(size, rng) for _ in range(REPEATS)]
+        for batched, concurrency in MODES.values():
+            settings.llm_batch_evaluation, settings.llm_max_concurrency = batched, concurrency
+            times, calls, mode_scores = [], fake.calls, []
+            for payload in payloads:
+                start = time.perf_counter()
+                response = client.post("/interviews/", headers=headers, json=payload)
+                times.append(time.perf_counter() - start)
+                assert response.status_code == 201, response.get_data(as_text=True)
+                mode_scores.append([r["score"] for r in response.get_json()["responses"]])
+            scores.append(mode_scores)
+            cells.append(f"{statistics.median(times) * 1000:13.0f} | {(fake.calls - calls) / REPEATS:5.1f}")
+        equal = all(s == scores[0] for s in scores)
+        ok &= equal
+        print(f"{size:7} | {' | '.join(cells)} | {'yes' if equal else 'NO'}")
+
+    settings.llm_cache_ttl_seconds = cache_ttl
+    print("\nSame 10-answer interview submitted twice, response cache on:")
+    for name, (batched, concurrency) in MODES.items():
+        settings.llm_batch_evaluation, settings.llm_max_concurrency = batched, concurrency
+        payload = interview(10, rng)
+        cells = []
+        for _ in range(2):
+            calls = fake.calls
+            start = time.perf_counter()
+            assert client.post("/interviews/", headers=headers, json=payload).status_code == 201
+            cells.append(f"{(time.perf_counter() - start) * 1000:6.0f} ms, {fake.calls - calls:2} calls")
+        print(f"  {name:>10}: first {cells[0]}; resubmitted {cells[1]}")
+    settings.llm_cache_ttl_seconds = 0
+
+    fake.stall_rate = STALL_RATE
+    settings.llm_request_deadline_seconds = DEADLINE_SECONDS * scale
+    print(f"\n{STALL_RATE:.0%} of calls stalled for {STALL_SECONDS * scale:g}s, "
+          f"{DEADLINE_SECONDS * scale:g}s request deadline, 10 answers:")
+    for name, (batched, concurrency) in MODES.items():
+        settings.llm_batch_evaluation, settings.llm_max_concurrency = batched, concurrency
+        before = llm_fanout.stats()["deadline_fallbacks"]
+        start = time.perf_counter()
+        response = client.post("/interviews/", headers=headers, json=interview(10, rng))
+        ms = (time.perf_counter() - start) * 1000
+        # Inline (serial) calls cannot be cut off mid-call, so one stall may overrun the deadline.
+        overrun = STALL_SECONDS if concurrency == 0 else FIRST_TOKEN_SECONDS
+        ok &= response.status_code == 201 and ms < (DEADLINE_SECONDS + overrun) * scale * 1000 * 1.2
+        print(f"  {name:>10}: {ms:6.0f} ms, {llm_fanout.stats()['deadline_fallbacks'] - before} answers "
+              f"or summaries given fallbacks at the deadline")
+
+    print(f"\nllm_fanout.stats():  {llm_fanout.stats()}")
+    print(f"\nllm_service.stats(): {llm_service.stats()}")
+    print(f"\nllm_cache.stats():   {llm_cache.stats()}")
+    os.remove(database_url.removeprefix("sqlite:///"))
+    print("\nOK" if ok else "\nFAILED")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
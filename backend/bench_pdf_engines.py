@@ -0,0 +1,114 @@
+"""
+bench_pdf_engines.py — compare PDF extraction engines on a corpus of PDFs.
+Run with:
+    venv\\Scripts\\python.exe bench_pdf_engines.py [corpus_dir]
+
+Without a corpus_dir, the test PDFs are rendered into a temporary corpus
+(see bench_corpus.py). For every engine in app.services.pdf_engines it reports
+  * extraction time per page,
+  * peak memory (RSS growth of a fresh process running only that engine), and
+  * whether the resume analysis (skills, experience, roles) is identical to
+    the pdfplumber baseline for every file.
+"""
+import glob
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, ".")
+
+BASELINE_ENGINE = "pdfplumber"
+COMPARED_FIELDS = (
+    "technical_skills", "tools_frameworks", "soft_skills",
+    "detected_experience_years", "previous_role", "inferred_target_role",
+)
+
+
+def _rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_engine(engine_name: str, paths: list[str], queue) -> None:
+    """Child process: extract + analyse every PDF with one engine."""
+    import logging
+    logging.disable(logging.INFO)
+    from app.services import pdf_engines, resume_service
+
+    engine = pdf_engines.get_engine(engine_name)
+    baseline_rss = _rss_mb()
+    files = {}
+    for path in paths:
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        start = time.perf_counter()
+        try:
+            page_count, texts = engine.extract(raw, 0, 10_000, 10**9)
+        except Exception as exc:
+            files[path] = {"error": str(exc)}
+            continue
+        elapsed = time.perf_counter() - start
+        analysis = resume_service._analyse_text("\n".join(texts))
+        files[path] = {
+            "pages": page_count,
+            "seconds": elapsed,
+            "analysis": {field: analysis[field] for field in COMPARED_FIELDS},
+        }
+    queue.put({"files": files, "peak_rss_delta_mb": _rss_mb() - baseline_rss})
+
+
+def main() -> None:
+    from app.services.pdf_engines import ENGINES
+
+    if len(sys.argv) > 1:
+        paths = sorted(glob.glob(os.path.join(sys.argv[1], "*.pdf")))
+    else:
+        import bench_corpus
+        paths = bench_corpus.build_basic_corpus(tempfile.mkdtemp(prefix="pdf_corpus_"))
+    if not paths:
+        sys.exit("No PDFs found.")
+    print(f"Corpus: {len(paths)} PDFs\n")
+
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for name in ENGINES:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_run_engine, args=(name, paths, queue))
+        proc.start()
+        results[name] = queue.get()
+        proc.join()
+
+    baseline = results[BASELINE_ENGINE]["files"]
+    print(f"{'engine':>11} | {'ms / page':>9} | {'peak RSS +MB':>12} | {'errors':>6} | {'identical to ' + BASELINE_ENGINE:>24}")
+    print("-" * 75)
+    for name, result in results.items():
+        files = result["files"]
+        ok = [f for f in files.values() if "error" not in f]
+        pages = sum(f["pages"] for f in ok) or 1
+        ms_per_page = sum(f["seconds"] for f in ok) / pages * 1000
+        identical = sum(
+            1 for path, f in files.items()
+            if "error" not in f and "error" not in baseline[path] and f["analysis"] == baseline[path]["analysis"]
+        )
+        print(f"{name:>11} | {ms_per_page:>9.2f} | {result['peak_rss_delta_mb']:>12.1f} | "
+              f"{len(files) - len(ok):>6} | {f'{identical}/{len(files)}':>24}")
+
+    for name, result in results.items():
+        for path, f in result["files"].items():
+            if "error" in f:
+                print(f"\n[{name}] {os.path.basename(path)} failed: {f['error']}")
+            elif "error" not in baseline[path] and f["analysis"] != baseline[path]["analysis"]:
+                print(f"\n[{name}] {os.path.basename(path)} differs from {BASELINE_ENGINE}:")
+                for field in COMPARED_FIELDS:
+                    if f["analysis"][field] != baseline[path]["analysis"][field]:
+                        print(f"    {field}: {f['analysis'][field]!r} != {baseline[path]['analysis'][field]!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+bench_pipeline.py — stage-level benchmark for the resume parsing pipeline.
+Run with:
+    venv\\Scripts\\python.exe bench_pipeline.py                  # compare against the baseline
+    venv\\Scripts\\python.exe bench_pipeline.py --save-baseline  # record a new baseline
+
+Builds a seeded synthetic corpus (bench_corpus.build_synthetic_corpus: the test
+PDFs re-rendered with varied lengths, page counts, header styles and skill
+densities) and times every stage of process_resume separately, in the same
+order and on the same inputs as _analyse_text:
+
+    _extract_text, normalize_skill_aliases, detect_sections_dynamic,
+    _match_skills_in_text, _detect_experience_years, _extract_roles,
+    detect_unknown_skills, _generate_questions (Gemini stubbed)
+
+Extraction runs inline (PDF_POOL_SIZE=0) so the numbers measure parsing, not
+IPC. Each stage's corpus total is the median of --repeat runs. Results are
+compared with the JSON baseline (default bench_pipeline_baseline.json); a
+stage slower than the baseline by more than --threshold makes the run exit 1.
+Baselines are machine-specific — record one on the machine that compares.
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, ".")
+
+DEFAULT_BASELINE = "bench_pipeline_baseline.json"
+
+STAGES = (
+    "_extract_text",
+    "normalize_skill_aliases",
+    "detect_sections_dynamic",
+    "_match_skills_in_text",
+    "_detect_experience_years",
+    "_extract_roles",
+    "detect_unknown_skills",
+    "_generate_questions",
+)
+
+
+def _fake_generate_questions(question_plan: dict, role: str, experience: int, count: int) -> list[dict]:
+    """Deterministic stand-in for llm_service.generate_questions (no network)."""
+    skills = question_plan["weak_skills"] + question_plan["primary_skills"] + question_plan["secondary_skills"]
+    return [
+        {
+            "main_question": f"Describe how you have used {skill} in production as a {role}.",
+            "follow_up_question": f"What trade-offs did you weigh when choosing {skill}?",
+            "category": skill,
+        }
+        for skill in skills[:count // 2]
+    ]
+
+
+def _run_corpus(docs: list[bytes]) -> dict[str, float]:
+    """One pass over the corpus; returns seconds spent per stage."""
+    from app.services import resume_service as rs
+
+    totals = dict.fromkeys(STAGES, 0.0)
+
+    def timed(stage, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        totals[stage] += time.perf_counter() - start
+        return result
+
+    for raw in docs:
+        text = timed("_extract_text", rs._extract_text, raw)
+        text = timed("normalize_skill_aliases", rs.normalize_skill_aliases, text)
+
+        def resolve_sections(full_text):
+            # Section detection plus the skills-corpus fallbacks of _analyse_text.
+            sections = rs.detect_sections_dynamic(full_text)
+            skills_text = sections.get("skills", "")
+            if not skills_text.strip():
+                skills_text = rs._extract_skills_section_fallback(full_text.splitlines())
+            if not skills_text.strip():
+                skills_text = full_text
+            return sections, skills_text
+
+        sections, skills_text = timed("detect_sections_dynamic", resolve_sections, text)
+        found = timed("_match_skills_in_text", rs._match_skills_in_text, skills_text)
+
+        def experience(full_text):
+            years = rs._detect_experience_years(sections.get("experience", full_text))
+            return years if years is not None else rs._detect_experience_years(full_text)
+
+        years = timed("_detect_experience_years", experience, text) or 0
+        technical = {cat: found.get(cat, []) for cat in rs.TECH_SKILLS_DB}
+        previous_role, target_role = timed("_extract_roles", rs._extract_roles, text, technical)
+
+        def unknown(full_text):
+            known = set()
+            for cat_skills in rs.TECH_SKILLS_DB.values():
+                known.update(cat_skills)
+            for aliases in rs.SKILL_ALIASES.values():
+                known.update(aliases)
+            return rs.detect_unknown_skills(full_text, known)
+
+        timed("detect_unknown_skills", unknown, text)
+        timed("_generate_questions", rs._generate_questions, found,
+              previous_role or target_role, None, 100.0, years)
+    return totals
+
+
+def measure(paths: list[str], repeat: int) -> dict:
+    from app.core.config import settings
+    from app.services import resume_service
+
+    settings.pdf_pool_size = 0
+    settings.gemini_api_key = "bench"   # force the LLM branch, served by the stub
+    resume_service.llm_service.generate_questions = _fake_generate_questions
+
+    docs = []
+    for path in paths:
+        with open(path, "rb") as fh:
+            docs.append(fh.read())
+
+    runs = []
+    with contextlib.redirect_stdout(io.StringIO()):   # _generate_questions prints
+        _run_corpus(docs[:4])                          # warm-up (imports, regex caches)
+        for _ in range(repeat):
+            runs.append(_run_corpus(docs))
+
+    stages = {}
+    for stage in STAGES:
+        total = statistics.median(run[stage] for run in runs)
+        stages[stage] = {
+            "total_ms": round(total * 1000, 3),
+            "per_resume_us": round(total / len(docs) * 1e6, 1),
+        }
+    return {
+        "meta": {
+            "resumes": len(docs),
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()} {platform.node()}",
+            "pdf_engine": settings.pdf_engine,
+        },
+        "stages": stages,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float, min_ms: float) -> list[str]:
+    """Returns one message per stage that regressed beyond *threshold*."""
+    regressions = []
+    print(f"\n{'stage':>26} | {'baseline ms':>11} | {'current ms':>10} | {'change':>7}")
+    print("-" * 66)
+    for stage in STAGES:
+        now = current["stages"][stage]["total_ms"]
+        before = baseline["stages"].get(stage, {}).get("total_ms")
+        if before is None:
+            print(f"{stage:>26} | {'—':>11} | {now:>10.2f} | {'new':>7}")
+            continue
+        change = (now - before) / before if before else 0.0
+        flag = ""
+        if change > threshold and before >= min_ms:
+            flag = "  <-- REGRESSION"
+            regressions.append(f"{stage}: {before:.2f} ms -> {now:.2f} ms ({change:+.0%})")
+        print(f"{stage:>26} | {before:>11.2f} | {now:>10.2f} | {change:>+7.0%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stage-level resume pipeline benchmark")
+    parser.add_argument("--count", type=int, default=48, help="synthetic resumes to generate")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes; the median is kept")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown per stage (0.25 = 25%%)")
+    parser.add_argument("--min-ms", type=float, default=1.0,
+                        help="stages whose baseline total is below this never fail (too noisy)")
+    parser.add_argument("--json", help="also write the current results to this file")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    import bench_corpus
+    from app.services.resume_service import TECH_SKILLS_DB
+
+    vocabulary = [skill for skills in TECH_SKILLS_DB.values() for skill in skills]
+    corpus_dir = tempfile.mkdtemp(prefix="pipeline_corpus_")
+    paths = bench_corpus.build_synthetic_corpus(corpus_dir, vocabulary, args.count, args.seed)
+    print(f"Corpus: {len(paths)} synthetic resumes (seed {args.seed}) in {corpus_dir}")
+
+    current = measure(paths, args.repeat)
+    current["meta"].update({"seed": args.seed, "count": args.count})
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(current, fh, indent=2)
+
+    if args.save_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(current, fh, indent=2)
+        print(f"\n{'Saved' if args.save_baseline else 'No baseline found — saved'} baseline to {args.baseline}")
+        for stage in STAGES:
+            s = current["stages"][stage]
+            print(f"{stage:>26} | {s['total_ms']:>10.2f} ms | {s['per_resume_us']:>10.1f} us/resume")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    for key in ("seed", "count", "machine"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"Warning: baseline {key} {baseline['meta'].get(key)!r} != current {current['meta'].get(key)!r}")
+
+    regressions = compare(current, baseline, args.threshold, args.min_ms)
+    if regressions:
+        print(f"\nFAILED — {len(regressions)} stage(s) regressed by more than {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"\nOK — no stage regressed by more than {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+bench_question_bank.py — question selection cost vs. question bank size.
+Run with:
+    venv\\Scripts\\python.exe bench_question_bank.py
+
+Builds synthetic QuestionBankIndex instances of growing size (the real seed
+pairs plus generated pairs over every taxonomy skill and difficulty band)
+and times a full static-bank _generate_questions call and a full-text
+search against each. Selection should stay flat as the bank grows.
+"""
+import contextlib
+import io
+import logging
+import random
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+BANK_SIZES = (1_000, 10_000, 50_000)
+CALLS = 200
+
+
+def build_index(pairs: int):
+    from app.services import question_bank_service as qbs
+    from app.services.resume_service import TECH_SKILLS_DB
+
+    rows = list(qbs._seed_rows())
+    skills = [s for cat in TECH_SKILLS_DB.values() for s in cat]
+    rng = random.Random(pairs)
+    words = ("latency", "caching", "schema", "rollback", "threads", "memory", "testing", "queues",
+             "deployment", "security", "indexes", "migrations", "profiling", "retries", "observability")
+    i = 0
+    while len(rows) < pairs * 2:
+        skill = skills[i % len(skills)]
+        band = qbs.DIFFICULTIES[(i // len(skills)) % 3]
+        main_id = len(rows) + 1
+        a, b, c = rng.sample(words, 3)
+        rows.append(qbs.BankRow(main_id, skill, band, "main", f"How do {a} and {b} interact in {skill} ({i})?", None))
+        rows.append(qbs.BankRow(main_id + 1, skill, band, "follow_up", f"What {c} trade-offs did you make with {skill}?", main_id))
+        i += 1
+    return qbs.QuestionBankIndex(rows, source="bench")
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    from app.core.config import settings
+    from app.services import question_bank_service as qbs
+    from app.services import resume_service as rs
+
+    settings.gemini_api_key = ""   # static-bank path only
+    tech_skills = {"languages": ["Python", "Java"], "backend": ["Django", "Spring Boot"],
+                   "database": ["PostgreSQL"], "devops": ["Docker", "Kubernetes"]}
+
+    print(f"{'bank pairs':>10} | {'build s':>7} | {'generate us':>11} | {'search us':>9}")
+    print("-" * 48)
+    for size in BANK_SIZES:
+        start = time.perf_counter()
+        index = build_index(size)
+        build_s = time.perf_counter() - start
+
+        qbs.get_index = lambda: index   # serve the synthetic bank (no app context needed)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for _ in range(CALLS):
+                rs._generate_questions(tech_skills, "Backend Engineer", "backend", 50.0, 6)
+            gen_us = (time.perf_counter() - start) / CALLS * 1e6
+
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            index.search("python trade-off", limit=20)
+        search_us = (time.perf_counter() - start) / CALLS * 1e6
+        print(f"{size:>10} | {build_s:>7.2f} | {gen_us:>11.1f} | {search_us:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+bench_regex.py — worst-case matching time of the resume parser's patterns.
+Run with:
+    venv\\Scripts\\python.exe bench_regex.py [--quick]
+
+Resume text comes from untrusted PDFs, so every pattern run over it must be
+linear in the length of its input. This script
+
+  * feeds each pattern adversarial inputs (long runs of digits, blanks,
+    month names, dashes, capitals followed by symbols, ...) at doubling
+    sizes and reports the time per input and the growth exponent between
+    the two largest sizes (1 = linear, 2 = quadratic);
+  * does the same for the previous _YEARS_EXPLICIT_RE / _DATE_RANGE_RE, up
+    to the size where one scan passes a second;
+  * fuzzes the rewritten patterns against the previous ones with seeded
+    random token soup and checks they capture the same groups;
+  * runs the whole analysis (_analyse_text) over each adversarial family at
+    PDF_MAX_CHARS characters, then once with a 1 ms parse budget to show
+    the partial result it degrades to.
+
+Exits non-zero if a current pattern grows faster than GROWTH_LIMIT or a
+rewritten pattern disagrees with the one it replaced.
+"""
+import logging
+import math
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+SIZES = (4_000, 8_000, 16_000, 32_000, 64_000, 128_000)
+QUICK_SIZES = (4_000, 8_000, 16_000)
+LEGACY_SECONDS = 1.0
+GROWTH_LIMIT = 1.5
+FUZZ_DOCS = 20_000
+
+# ---------------------------------------------------------------------------
+# Patterns as shipped before the linear-time rewrites
+# ---------------------------------------------------------------------------
+
+_LEGACY_YEARS_EXPLICIT_RE = re.compile(r"(\d+)\s*\+?\s*years?", re.IGNORECASE)
+
+_LEGACY_DATE_RANGE_RE = re.compile(
+    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
+    r"Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|"
+    r"Nov(?:ember)?|Dec(?:ember)?)?\s*"
+    r"(\d{4})\s*[-–—]\s*"
+    r"(?:(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
+    r"Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|"
+    r"Nov(?:ember)?|Dec(?:ember)?)?\s*"
+    r"(\d{4})|Present|Current|Now|Till\s*date)",
+    re.IGNORECASE,
+)
+
+# ---------------------------------------------------------------------------
+# Adversarial inputs: name -> text of about n characters
+# ---------------------------------------------------------------------------
+
+FAMILIES = {
+    "digits":            lambda n: "1" * n,
+    "blanks":            lambda n: " " * n,
+    "digit, blanks":     lambda n: "1" + " " * n + "x",
+    "digit, +, blanks":  lambda n: "1" + " " * (n // 2) + "+" + " " * (n // 2) + "x",
+    "year, dash, blanks": lambda n: "2019 -" + " " * n + "x",
+    "month, blanks":     lambda n: "Jan" + " " * n + "x",
+    "year, months":      lambda n: "2019 - " + "Sept " * (n // 5),
+    "years, blanks":     lambda n: ("2019" + " " * 60) * (n // 64),
+    "capital, dots":     lambda n: "A" + "." * n,
+    "capitals, plus":    lambda n: "A+" * (n // 2),
+    "keyword prefixes":  lambda n: "javascrip " * (n // 10),
+    "alias prefixes":    lambda n: "reactj nodej " * (n // 13),
+    "line breaks":       lambda n: "\r\r\n" * (n // 3),
+    "no breaks":         lambda n: "x" * n,
+}
+
+
+def _scanners() -> dict:
+    """name -> (current scan, legacy scan or None); a scan consumes every match in a text."""
+    from app.services import resume_service as rs
+    from app.services.resume_document import _LINE_BREAK_RE
+    from app.services.skill_matcher import fold_preserving_offsets
+
+    def finditer(pattern):
+        return lambda text: sum(1 for _ in pattern.finditer(text))
+
+    return {
+        "_YEARS_EXPLICIT_RE":    (finditer(rs._YEARS_EXPLICIT_RE), finditer(_LEGACY_YEARS_EXPLICIT_RE)),
+        "_DATE_RANGE_RE":        (finditer(rs._DATE_RANGE_RE), finditer(_LEGACY_DATE_RANGE_RE)),
+        "_UNKNOWN_SKILL_RE":     (finditer(rs._UNKNOWN_SKILL_RE), None),
+        "_SKILLS_TRIGGER_WORDS": (finditer(rs._SKILLS_TRIGGER_WORDS), None),
+        "alias normaliser":      (lambda text: len(rs.normalize_skill_aliases_with_offsets(text)[1]), None),
+        "skill matcher":         (lambda text: sum(1 for _ in rs._SKILL_MATCHER.hits(fold_preserving_offsets(text))), None),
+        "_LINE_BREAK_RE":        (finditer(_LINE_BREAK_RE), None),
+    }
+
+
+def _time(scan, text: str, repeats: int = 3) -> float:
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        scan(text)
+        best = min(best, time.perf_counter() - start)
+        if best > 0.1:
+            break
+    return best
+
+
+def _growth(times: list[float]) -> float:
+    """Exponent k in time ~ n**k between the last two (doubling) sizes; noise below 1 ms counts as linear."""
+    if len(times) < 2 or times[-1] < 1e-3:
+        return 1.0
+    return math.log2(times[-1] / max(times[-2], 1e-9))
+
+
+def worst_case(sizes: tuple) -> bool:
+    ok = True
+    print(f"{'pattern':>22} | {'input':>18} | {'max n':>7} | {'ms':>8} | growth | legacy n | legacy ms | legacy growth")
+    print("-" * 110)
+    for name, (scan, legacy) in _scanners().items():
+        for family, build in FAMILIES.items():
+            times = [_time(scan, build(n)) for n in sizes]
+            growth = _growth(times)
+            flag = " !" if growth > GROWTH_LIMIT else ""
+            ok &= not flag
+            line = f"{name:>22} | {family:>18} | {sizes[-1]:7} | {times[-1] * 1000:8.2f} | {growth:5.2f}{flag:2}"
+            if legacy is not None:
+                legacy_times, n = [], 0
+                for n in sizes:
+                    legacy_times.append(_time(legacy, build(n), repeats=1))
+                    if legacy_times[-1] > LEGACY_SECONDS:
+                        break
+                line += f" | {n:8} | {legacy_times[-1] * 1000:9.1f} | {_growth(legacy_times):5.2f}"
+            if growth > 1.2 or legacy is not None:
+                print(line)
+    print("(families with growth <= 1.2 and no legacy pattern are not listed)")
+    return ok
+
+
+def fuzz(docs: int) -> bool:
+    from app.services import resume_service as rs
+
+    tokens = ["2019", "2020", "1999", " ", "  ", "\n", "-", "–", "—", "+", "Jan", "Sept", "sep", "March",
+              "Mar2019", "May", "Present", "now", "Till date", "till  date", "years", "year", "Years",
+              "yrs", "1", "12", "123", "x", "a", "Current", ".", "5+"]
+    pairs = (
+        ("_YEARS_EXPLICIT_RE", _LEGACY_YEARS_EXPLICIT_RE, rs._YEARS_EXPLICIT_RE),
+        ("_DATE_RANGE_RE", _LEGACY_DATE_RANGE_RE, rs._DATE_RANGE_RE),
+    )
+    rnd = random.Random(18)
+    mismatches = {name: 0 for name, _, _ in pairs}
+    for _ in range(docs):
+        text = "".join(rnd.choice(tokens) for _ in range(rnd.randint(1, 40)))
+        for name, legacy, current in pairs:
+            if [m.groups() for m in legacy.finditer(text)] != [m.groups() for m in current.finditer(text)]:
+                mismatches[name] += 1
+                if mismatches[name] <= 3:
+                    print(f"  {name} differs on {text!r}")
+    for name, count in mismatches.items():
+        print(f"{name:>22}: {count} of {docs} fuzzed texts capture different groups")
+    return not any(mismatches.values())
+
+
+def end_to_end() -> None:
+    from app.core.config import settings
+    from app.services import resume_service as rs
+
+    n = settings.pdf_max_chars
+    print(f"\n_analyse_text over {n:,}-character adversarial resumes "
+          f"(budget {settings.parse_budget_seconds:g}s):")
+    for family, build in FAMILIES.items():
+        text = build(n)
+        start = time.perf_counter()
+        analysis = rs._analyse_text(text)
+        ms = (time.perf_counter() - start) * 1000
+        print(f"  {family:>18}: {ms:8.1f} ms  {analysis.get('budget_exhausted') or ''}")
+
+    text = "\n".join(["Python developer, 5 years. Skills: Python, Django, Docker"] * (n // 60))
+    start = time.perf_counter()
+    analysis = rs._analyse_text(text, budget_seconds=0.001)
+    ms = (time.perf_counter() - start) * 1000
+    found = sum(len(v) for v in analysis["technical_skills"].values())
+    print(f"  with a 1 ms budget: {ms:.1f} ms, {found} tech skills, "
+          f"experience {analysis['detected_experience_years']}, cut short: {analysis.get('budget_exhausted')}")
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    quick = "--quick" in sys.argv
+    ok = worst_case(QUICK_SIZES if quick else SIZES)
+    print()
+    ok &= fuzz(FUZZ_DOCS // 10 if quick else FUZZ_DOCS)
+    end_to_end()
+    print("\nOK" if ok else "\nFAILED")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
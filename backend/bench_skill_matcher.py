@@ -0,0 +1,124 @@
+"""
+bench_skill_matcher.py — single-pass SkillMatcher vs the legacy per-skill regex loop.
+Run with:
+    venv\\Scripts\\python.exe bench_skill_matcher.py
+
+For taxonomies of 50, 500 and 5,000 skills this
+  * checks both implementations return identical skills, and
+  * prints the mean time per resume for each.
+
+Like the pipeline, both sides see the resume after normalize_skill_aliases,
+and every taxonomy includes the canonical skills of SKILL_ALIASES, so an
+alias that leaks into the matcher shows up as a difference. The matcher the
+pipeline actually uses (_match_skills_in_text) is checked against the legacy
+loop over the full TECH_SKILLS_DB as well.
+"""
+import re
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+from app.services.resume_service import (
+    SKILL_ALIASES, TECH_SKILLS_DB, _match_skills_in_text, normalize_skill_aliases,
+)
+from app.services.skill_matcher import SkillMatcher
+
+SIZES   = (50, 500, 5000)
+REPEATS = 30
+
+RESUME = """\
+John Doe | john@example.com
+PROFESSIONAL SUMMARY
+Backend engineer with 5 years of experience building scalable services in C++ and Python.
+
+Core Competencies
+Python, FastAPI, Django, PostgreSQL, Docker, REST API, System Design, Microservices,
+React Native, NodeJS, CI/CD, GitHub Actions, C#, Go, Kubernetes, Tool-17.jsx, Lib88++
+
+PROFESSIONAL EXPERIENCE
+Backend Developer - TechCorp  2019 - 2024
+Built Python FastAPI services. Managed PostgreSQL. Deployed with Docker on AWS.
+Led migration to microservices using gRPC and Frame 412. Mentored 4 engineers.
+Shipped ReactJS dashboards on a NodeJS / Node JS gateway, Postgres and CPP tooling.
+""" * 4
+
+
+def build_taxonomy(size: int) -> dict[str, list[str]]:
+    """
+    Canonical skills of SKILL_ALIASES first, then the other real skills,
+    padded with synthetic symbol-heavy / multi-token names.
+    """
+    real = [(cat, s) for cat, skills in TECH_SKILLS_DB.items() for s in skills]
+    real.sort(key=lambda entry: entry[1] not in SKILL_ALIASES)
+    entries = real[:size]
+    shapes = ("Skillz{i}", "Tool-{i}.jsx", "Lib{i}++", "Frame {i}", "api/{i}")
+    i = 0
+    while len(entries) < size:
+        entries.append((f"synthetic{i % 10}", shapes[i % len(shapes)].format(i=i)))
+        i += 1
+    taxonomy: dict[str, list[str]] = {}
+    for cat, skill in entries:
+        taxonomy.setdefault(cat, []).append(skill)
+    return taxonomy
+
+
+# ---------------------------------------------------------------------------
+# Legacy implementation (as shipped before the SkillMatcher)
+# ---------------------------------------------------------------------------
+
+def _compile_pattern(keyword: str) -> re.Pattern:
+    escaped = re.escape(keyword.lower())
+    return re.compile(r"(?<![a-z0-9_])" + escaped + r"(?![a-z0-9_])", re.IGNORECASE)
+
+
+def legacy_match(patterns: dict[str, dict[str, re.Pattern]], text: str) -> dict[str, list[str]]:
+    result: dict[str, list[str]] = {}
+    for category, cat_patterns in patterns.items():
+        matched: list[str] = []
+        seen: set[str] = set()
+        for skill, pattern in cat_patterns.items():
+            key = skill.lower()
+            if key not in seen and pattern.search(text):
+                seen.add(key)
+                matched.append(skill)
+        result[category] = matched
+    return result
+
+
+def _timeit(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        fn()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main() -> None:
+    resume = normalize_skill_aliases(RESUME)
+    print(f"Resume length: {len(resume)} chars, {REPEATS} repeats per measurement\n")
+    patterns = {cat: {s: _compile_pattern(s) for s in skills} for cat, skills in TECH_SKILLS_DB.items()}
+    expected = {cat: found for cat, found in legacy_match(patterns, resume).items() if found}
+    actual   = {cat: found for cat, found in _match_skills_in_text(resume).items() if found}
+    assert actual == expected, f"FAIL: pipeline matcher differs from the legacy loop:\n{actual}\n{expected}"
+
+    print(f"{'skills':>7} | {'legacy loop (ms)':>17} | {'SkillMatcher (ms)':>17} | {'speed-up':>8}")
+    print("-" * 60)
+    for size in SIZES:
+        taxonomy = build_taxonomy(size)
+        patterns = {cat: {s: _compile_pattern(s) for s in skills} for cat, skills in taxonomy.items()}
+        matcher  = SkillMatcher((s, s, cat) for cat, skills in taxonomy.items() for s in skills)
+
+        expected = legacy_match(patterns, resume)
+        found    = matcher.match(resume)
+        actual   = {cat: found.get(cat, []) for cat in taxonomy}
+        assert actual == expected, f"FAIL: results differ at {size} skills:\n{actual}\n{expected}"
+
+        legacy_ms  = _timeit(lambda: legacy_match(patterns, resume))
+        matcher_ms = _timeit(lambda: matcher.match(resume))
+        print(f"{size:>7} | {legacy_ms:>17.3f} | {matcher_ms:>17.3f} | {legacy_ms / matcher_ms:>7.1f}x")
+
+    print("\nResults identical at every size ✅")
+
+
+if __name__ == "__main__":
+    main()
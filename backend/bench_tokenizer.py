@@ -0,0 +1,336 @@
+"""
+bench_tokenizer.py — single-pass tokenizer vs the previous multi-pass parser.
+Run with:
+    venv\\Scripts\\python.exe bench_tokenizer.py [--sizes 10000,50000,200000]
+
+Builds large synthetic CVs (bench_corpus.synthetic_resume with hundreds of
+experience entries, up to PDF_MAX_CHARS) and runs, on the same text:
+
+  * legacy — the analysis stages as they were before services/resume_document.py:
+    every stage re-splits the text or copies its section out as a string,
+    skill matching runs twice (skills corpus + whole text for soft skills)
+    and experience is re-scanned on the whole text when the section yields
+    nothing or is missing;
+  * current — resume_service._analyse_text: one tokenizer pass, then
+    visitors working on offsets.
+
+Reported per CV size:
+  * passes — characters scanned, divided by the CV length: every regex and
+    skill-matcher scan (of the whole text or of a section), plus whole-text
+    splitlines/lower/casefold/strip calls. Operations on section copies and
+    the role-keyword substring checks (``kw in text``, the same in both)
+    are not counted, so the legacy figure is a lower bound;
+  * peak KiB — tracemalloc peak above the input text while the stages run;
+  * ms — median wall time of --repeat runs (without tracemalloc);
+  * identical — whether both produce the same analysis.
+"""
+import argparse
+import contextlib
+import logging
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, ".")
+
+DEFAULT_SIZES = "10000,50000,200000"
+
+
+class _Counter:
+    chars = 0
+
+
+class _CountedPattern:
+    """Compiled-pattern proxy that adds the length of every scanned range to _Counter."""
+
+    def __init__(self, pattern: re.Pattern):
+        self._pattern = pattern
+
+    def _count(self, string: str, pos: int = 0, endpos: int | None = None) -> None:
+        _Counter.chars += (len(string) if endpos is None else min(endpos, len(string))) - pos
+
+    def finditer(self, string, *args):
+        self._count(string, *args)
+        return self._pattern.finditer(string, *args)
+
+    def findall(self, string, *args):
+        self._count(string, *args)
+        return self._pattern.findall(string, *args)
+
+    def search(self, string, *args):
+        self._count(string, *args)
+        return self._pattern.search(string, *args)
+
+
+class _CountedMatcher:
+    def __init__(self, matcher):
+        self._matcher = matcher
+
+    def hits(self, folded, start=0, end=None):
+        # Spans are scanned in place in the document's one folded copy (folding it is a counted casefold pass).
+        _Counter.chars += (len(folded) if end is None else end) - start
+        return self._matcher.hits(folded, start, end)
+
+    def match(self, text):
+        _Counter.chars += len(text)
+        return self._matcher.match(text)
+
+    def group(self, ranks):
+        return self._matcher.group(ranks)
+
+    def pairs(self, ranks):
+        return self._matcher.pairs(ranks)
+
+    def ranks(self, pairs):
+        return self._matcher.ranks(pairs)
+
+
+class _TracedText(str):
+    """The alias-normalised resume; whole-text str passes add its length to _Counter."""
+
+    def _pass(self):
+        _Counter.chars += len(self)
+
+    def splitlines(self, *args):
+        self._pass()
+        return super().splitlines(*args)
+
+    def lower(self):
+        self._pass()
+        return super().lower()
+
+    def casefold(self):
+        self._pass()
+        return super().casefold()
+
+    def strip(self, *args):
+        self._pass()
+        return super().strip(*args)
+
+
+# ---------------------------------------------------------------------------
+# The previous implementation, kept here for comparison
+# ---------------------------------------------------------------------------
+
+def _legacy_normalise_header(raw_line: str) -> str:
+    stripped = raw_line.strip()
+    if not stripped or len(stripped) > 80:
+        return ""
+    return re.sub(r"\s+", " ", stripped.rstrip(":").strip()).lower()
+
+
+def _legacy_sections(rs, text: str) -> dict[str, str]:
+    lines = text.splitlines()
+    header_positions = []
+    for idx, raw_line in enumerate(lines):
+        section = rs._SYNONYM_TO_SECTION.get(_legacy_normalise_header(raw_line))
+        if section:
+            header_positions.append((idx, section))
+    if not header_positions:
+        return {"_body": "\n".join(lines)}
+    bounds = [(-1, "_body")] + header_positions + [(len(lines), "_end")]
+    result: dict[str, str] = {}
+    for i in range(len(bounds) - 1):
+        start_idx, label = bounds[i]
+        end_idx, _ = bounds[i + 1]
+        content = "\n".join(lines[start_idx + 1:end_idx]).strip()
+        if content:
+            result[label] = result.get(label, "") + "\n" + content
+    return result
+
+
+def _legacy_fallback(rs, lines: list[str]) -> str:
+    collected: list[str] = []
+    seen: set[int] = set()
+    for idx, line in enumerate(lines):
+        if rs._SKILLS_TRIGGER_WORDS.search(line):
+            for offset in range(15):
+                target = idx + offset
+                if target < len(lines) and target not in seen:
+                    seen.add(target)
+                    collected.append(lines[target])
+    return "\n".join(collected)
+
+
+_LEGACY_UNKNOWN_RE = _CountedPattern(re.compile(r"\b[A-Z][a-zA-Z0-9\.\+\#]{2,}\b"))
+
+
+_LEGACY_NOISE_WORDS = {
+    "January", "February", "March", "April", "May", "June", "July", "August", "September",
+    "October", "November", "December", "University", "College", "Degree", "Bachelor",
+    "Master", "Ph.D", "School", "Institute", "Academy", "Engineering", "Science",
+    "Technology", "Management", "Application", "Developer", "Engineer", "Manager",
+    "Project", "Product", "System", "Software", "Hardware", "Network", "Database",
+    "Server", "Client", "Frontend", "Backend", "Fullstack", "Agile", "Scrum",
+    "Company", "Inc", "LLC", "Ltd", "Corp", "Corporation", "Technologies", "Solutions",
+}
+
+
+def _legacy_unknown(text: str, known_skills: set[str]) -> list[str]:
+    candidates = _LEGACY_UNKNOWN_RE.findall(text)
+    known_lower = {k.lower() for k in known_skills}
+    unknown = [w for w in candidates if w.lower() not in known_lower and w not in _LEGACY_NOISE_WORDS]
+    return list(set(unknown))
+
+
+def _legacy_experience(rs, text: str):
+    return rs._experience_years_in(text, [(0, len(text))])
+
+
+def _legacy_roles(rs, full_text: str, technical_skills: dict):
+    lines = full_text.splitlines()
+    top_text = "\n".join(lines[:max(int(len(lines) * 0.3), 10)]).lower()
+    for role in rs.ROLE_KEYWORDS:
+        if role.lower() in top_text:
+            return role, None
+    skills = [s for cats in technical_skills.values() for s in cats]
+    return None, rs.ROLE_SCORER.best_role(rs.ROLE_SCORER.presence(skills, full_text))
+
+
+def legacy_analyse(text: str) -> dict:
+    from app.services import resume_service as rs
+
+    full_text = rs.normalize_skill_aliases(text)
+    lines = full_text.splitlines()
+    sections = _legacy_sections(rs, full_text)
+    skills_text = sections.get("skills", "")
+    if not skills_text.strip():
+        skills_text = _legacy_fallback(rs, lines)
+        if not skills_text.strip():
+            skills_text = full_text
+    experience_text = sections.get("experience", full_text)
+
+    tech_skills, soft = rs._split_matches(rs._SKILL_MATCHER.match(skills_text))
+    soft_body = rs._SKILL_MATCHER.match(full_text).get(rs._SOFT_CATEGORY, [])
+    experience = _legacy_experience(rs, experience_text)
+    if experience is None:
+        experience = _legacy_experience(rs, full_text)
+    technical = {cat: tech_skills.get(cat, []) for cat in rs.TECH_SKILLS_DB}
+    previous_role, target_role = _legacy_roles(rs, full_text, technical)
+    known = {s for skills in rs.TECH_SKILLS_DB.values() for s in skills}
+    known.update(a for aliases in rs.SKILL_ALIASES.values() for a in aliases)
+    return {
+        "tech_skills": tech_skills,
+        "soft_skills": list(dict.fromkeys(soft + soft_body)),
+        "detected_experience_years": experience or 0,
+        "previous_role": previous_role,
+        "inferred_target_role": target_role,
+        "unknown_skills": sorted(_legacy_unknown(full_text, known)),
+    }
+
+
+def current_analyse(text: str) -> dict:
+    from app.services import resume_service as rs
+
+    result = rs._analyse_text(text)
+    result["unknown_skills"] = sorted(result["unknown_skills"])
+    return {key: result[key] for key in (
+        "tech_skills", "soft_skills", "detected_experience_years",
+        "previous_role", "inferred_target_role", "unknown_skills",
+    )}
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def build_cv(size: int, rng: random.Random) -> str:
+    import bench_corpus
+    from app.services.resume_service import TECH_SKILLS_DB
+
+    vocabulary = [skill for skills in TECH_SKILLS_DB.values() for skill in skills]
+    template = max(bench_corpus.templates().values(), key=len)
+    entries = 8
+    while True:
+        lines = bench_corpus.synthetic_resume(template, random.Random(rng.random()), vocabulary,
+                                              "long", "high", entries=entries)
+        text = "\n".join(lines)
+        if len(text) >= size:
+            return text[:size]
+        entries = int(entries * size / len(text)) + 1
+
+
+@contextlib.contextmanager
+def counting():
+    """Swaps the scanning primitives of resume_service / resume_document for counting proxies."""
+    from app.services import resume_document as rd
+    from app.services import resume_service as rs
+
+    names = ("_SKILL_MATCHER", "_YEARS_EXPLICIT_RE", "_DATE_RANGE_RE", "_SKILLS_TRIGGER_WORDS",
+             "_UNKNOWN_SKILL_RE", "normalize_skill_aliases_with_offsets")
+    saved = {name: getattr(rs, name) for name in names}
+    saved_line_re = rd._LINE_BREAK_RE
+
+    def normalize(text):
+        normalised, rewrites = saved["normalize_skill_aliases_with_offsets"](text)
+        return _TracedText(normalised), rewrites
+
+    rs._SKILL_MATCHER = _CountedMatcher(saved["_SKILL_MATCHER"])
+    for name in ("_YEARS_EXPLICIT_RE", "_DATE_RANGE_RE", "_SKILLS_TRIGGER_WORDS", "_UNKNOWN_SKILL_RE"):
+        setattr(rs, name, _CountedPattern(saved[name]))
+    rs.normalize_skill_aliases_with_offsets = normalize
+    rd._LINE_BREAK_RE = _CountedPattern(saved_line_re)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(rs, name, value)
+        rd._LINE_BREAK_RE = saved_line_re
+
+
+def passes(fn, text: str) -> float:
+    _Counter.chars = 0
+    with counting():
+        fn(text)
+    return _Counter.chars / len(text)
+
+
+def peak_kib(fn, text: str) -> float:
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    fn(text)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (peak - base) / 1024
+
+
+def median_ms(fn, text: str, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Single-pass tokenizer benchmark")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated CV sizes in characters")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    cvs = [build_cv(int(size), rng) for size in args.sizes.split(",")]
+
+    print(f"{'chars':>7} | {'lines':>5} | {'passes':>13} | {'peak KiB':>15} | {'ms':>13} | identical")
+    print(f"{'':>7} | {'':>5} | {'legacy':>6} {'now':>6} | {'legacy':>7} {'now':>7} | {'legacy':>6} {'now':>6} |")
+    print("-" * 78)
+    for text in cvs:
+        same = legacy_analyse(text) == current_analyse(text)   # also warms up both
+        print(
+            f"{len(text):>7} | {len(text.splitlines()):>5} | "
+            f"{passes(legacy_analyse, text):>6.2f} {passes(current_analyse, text):>6.2f} | "
+            f"{peak_kib(legacy_analyse, text):>7.0f} {peak_kib(current_analyse, text):>7.0f} | "
+            f"{median_ms(legacy_analyse, text, args.repeat):>6.1f} {median_ms(current_analyse, text, args.repeat):>6.1f} | "
+            f"{same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
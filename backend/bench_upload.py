@@ -0,0 +1,103 @@
+"""
+bench_upload.py — buffered vs streamed resume uploads.
+Run with:
+    venv\\Scripts\\python.exe bench_upload.py
+
+Posts PDFs of growing size (a one-page resume padded with a PDF comment)
+to two minimal Flask views that extract the text inline (PDF_POOL_SIZE=0):
+
+  * buffered — the previous upload path: no MAX_CONTENT_LENGTH, Werkzeug's
+    default stream, ``file.read()`` and the size check afterwards;
+  * streamed — core/uploads.py: @upload_limits spool, magic check on the
+    first chunk, parsers reading a memory map of the spooled file.
+
+Reported per payload: status, peak Python heap during the request
+(tracemalloc) and how much of the request body was read. Oversized and
+non-PDF bodies are sent without Content-Length (chunked), so only the
+streaming checks can stop them early.
+"""
+import io
+import logging
+import sys
+import tracemalloc
+
+sys.path.insert(0, ".")
+
+MB = 1024 * 1024
+SIZES = (0.5, 4.5, 20)
+
+
+def build_app():
+    from flask import Flask, jsonify, request
+
+    from app.core import uploads
+    from app.core.errors import register_error_handlers
+    from app.services import pdf_extractor
+    from app.services.resume_service import MAX_FILE_SIZE_BYTES, PDF_MAGIC, _validate_file
+
+    app = Flask(__name__)
+    register_error_handlers(app)
+
+    @app.post("/buffered")
+    def buffered():
+        file = request.files["file"]
+        raw = file.read()
+        _validate_file(file, raw)
+        return jsonify(chars=len(pdf_extractor.extract_text(raw)))
+
+    @app.post("/streamed")
+    @uploads.upload_limits(MAX_FILE_SIZE_BYTES, magic=(PDF_MAGIC,), too_large="too large", wrong_type="not a PDF")
+    def streamed():
+        file = request.files["file"]
+        with uploads.mapped(file) as raw:
+            _validate_file(file, raw)
+            return jsonify(chars=len(pdf_extractor.extract_text(raw)))
+
+    app.request_class = uploads.UploadRequest
+    return app
+
+
+def payload(size_mb: float, pdf: bytes) -> bytes:
+    return pdf + b"\n%" + b"x" * max(0, int(size_mb * MB) - len(pdf) - 2)
+
+
+def post(app, path: str, body_file: bytes, chunked: bool) -> tuple[str, float, int, int]:
+    from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+    env = EnvironBuilder(path=path, method="POST", data={"file": (io.BytesIO(body_file), "cv.pdf")}).get_environ()
+    body = env["wsgi.input"].read()
+    env["wsgi.input"] = io.BytesIO(body)
+    if chunked:
+        del env["CONTENT_LENGTH"]
+        env["wsgi.input_terminated"] = True
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    app_iter, status, _ = run_wsgi_app(app, env, buffered=True)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return status.split()[0], peak / MB, env["wsgi.input"].tell(), len(body)
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    from app.core.config import settings
+    import bench_corpus
+
+    settings.pdf_pool_size = 0
+    pdf = bench_corpus.make_pdf([bench_corpus.templates()["test_core_competencies.pdf"]])
+    app = build_app()
+
+    cases = [(f"{size:g} MB PDF", payload(size, pdf), size > 5) for size in SIZES]
+    cases.append(("20 MB non-PDF", b"GIF89a" + b"x" * (20 * MB), True))
+
+    print(f"{'payload':>14} | {'path':>8} | {'status':>6} | {'peak MB':>7} | {'body read':>14}")
+    print("-" * 64)
+    for label, body_file, chunked in cases:
+        for path in ("buffered", "streamed"):
+            status, peak, read, total = post(app, "/" + path, body_file, chunked)
+            print(f"{label:>14} | {path:>8} | {status:>6} | {peak:7.2f} | {read / MB:5.1f}/{total / MB:5.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
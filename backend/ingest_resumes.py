@@ -0,0 +1,60 @@
+"""
+Bulk-analyse a directory (or .zip archive) of resume PDFs without the API.
+Run with:
+    venv\Scripts\python.exe ingest_resumes.py <dir-or-zip> -o results.jsonl [--workers N]
+        [--batch-size 100] [--user-map users.csv] [--retry-failed]
+
+Re-running with the same output file resumes where the previous run stopped.
+--retry-failed removes the failed records from it and processes those files again.
+--user-map takes a CSV with "file" and "email" columns and upserts the
+matching users' profiles (skills, previous/target role) as it goes.
+See app/services/bulk_ingest_service.py.
+"""
+import argparse
+import sys
+from contextlib import nullcontext
+
+from app.services import bulk_ingest_service
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk resume ingestion")
+    parser.add_argument("input", help="directory of PDFs or a .zip archive")
+    parser.add_argument("-o", "--output", required=True, help="JSONL results file (also the checkpoint)")
+    parser.add_argument("--workers", type=int, default=None, help="pool processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=100, help="records per checkpoint / profile upsert")
+    parser.add_argument("--user-map", help="CSV mapping file -> email; enables profile upserts")
+    parser.add_argument("--retry-failed", action="store_true", help="re-process sources recorded with an error")
+    args = parser.parse_args()
+
+    user_map = None
+    context = nullcontext()
+    if args.user_map:
+        from app.main import create_app
+        user_map = bulk_ingest_service.load_user_map(args.user_map)
+        context = create_app().app_context()
+
+    with context:
+        summary = bulk_ingest_service.ingest(
+            args.input,
+            args.output,
+            workers=args.workers,
+            batch_size=max(1, args.batch_size),
+            user_map=user_map,
+            retry_failed=args.retry_failed,
+        )
+
+    print(f"\nFiles found       : {summary.total}")
+    print(f"Already done      : {summary.skipped}")
+    print(f"Succeeded         : {summary.succeeded}")
+    print(f"Failed            : {summary.failed}")
+    if user_map is not None:
+        print(f"Profiles upserted : {summary.profiles_upserted}")
+        print(f"Unknown emails    : {summary.unmatched}")
+    print(f"Elapsed           : {summary.seconds:.1f}s")
+    print(f"Throughput        : {summary.files_per_second:.1f} files/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
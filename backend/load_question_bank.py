@@ -0,0 +1,40 @@
+"""
+Import interview questions into the question_bank table.
+Run with:
+    venv\Scripts\python.exe load_question_bank.py                  # the built-in QUESTION_BANK
+    venv\Scripts\python.exe load_question_bank.py --file bank.jsonl
+
+A --file is JSON Lines, one pair per line:
+    {"skill": "Python", "difficulty": "senior", "main": "...", "follow_up": "..."}
+difficulty is junior | mid | senior (default mid). Pairs already present
+(same skill, difficulty and main question) are skipped, so re-running is safe.
+"""
+import argparse
+import json
+
+from app.main import create_app
+from app.services import question_bank_service
+
+
+def _read_jsonl(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import interview questions into the question bank")
+    parser.add_argument("--file", help="JSONL file of question pairs (default: the built-in QUESTION_BANK)")
+    parser.add_argument("--source", default=None, help="label stored with the imported rows")
+    args = parser.parse_args()
+
+    pairs = _read_jsonl(args.file) if args.file else question_bank_service.seed_pairs()
+    source = args.source or (args.file and "import") or "seed"
+
+    app = create_app()
+    with app.app_context():
+        imported, skipped = question_bank_service.import_pairs(pairs, source=source)
+    print(f"Imported {imported} question pairs ({skipped} already present).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+Worker process that keeps the pre-generated question pools filled
+(services/question_pool_service.py). Run one alongside the web server:
+    venv\Scripts\python.exe question_pool_worker.py [--seed] [--once]
+
+--seed  first creates the pools of every ROLE_PRIORITIES role
+--once  fills every pool it can, then exits instead of polling
+"""
+import sys
+
+from app.main import create_app
+from app.services import question_pool_service
+
+app = create_app()
+
+if __name__ == "__main__":
+    with app.app_context():
+        if "--seed" in sys.argv:
+            print(f"Created {question_pool_service.seed_pools()} pools")
+        question_pool_service.run_builder(once="--once" in sys.argv)
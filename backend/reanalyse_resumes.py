@@ -0,0 +1,35 @@
+"""
+Re-analyse stored resumes after a parser or taxonomy change, without the PDFs.
+Run with:
+    venv\Scripts\python.exe reanalyse_resumes.py [--workers 4] [--batch-size 200]
+
+Every user's latest upload is kept in parsed_resumes with the analysis
+version it was made with (see services/parsed_resume_service.py). This
+re-runs the analysis stages over the stored text of each record older than
+the current version, in a process pool, and updates the records and the
+profiles built from them. Safe to re-run or to run while the API is up;
+only stale records are touched.
+"""
+import argparse
+
+from app.main import create_app
+from app.services import parsed_resume_service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-analyse stale stored resumes")
+    parser.add_argument("--workers", type=int, default=None, help="pool size (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        summary = parsed_resume_service.reanalyse_stale(args.workers, max(1, args.batch_size))
+    print(
+        f"Re-analysed {summary.reanalysed}/{summary.stale} records ({summary.failed} failed), "
+        f"updated {summary.profiles_updated} profiles in {summary.seconds:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
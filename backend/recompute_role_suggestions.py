@@ -0,0 +1,30 @@
+"""
+Recompute the stored role suggestions of every user profile in batches.
+Run with:
+    venv\Scripts\python.exe recompute_role_suggestions.py [--batch-size 1000]
+
+Run after changing ROLE_KEYWORDS; until then GET /roles/suggest scores
+profiles with stale suggestions on the fly.
+"""
+import argparse
+import time
+
+from app.main import create_app
+from app.services import user_profile_service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute role suggestions for all profiles")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        start = time.perf_counter()
+        updated = user_profile_service.recompute_role_suggestions(max(1, args.batch_size))
+        elapsed = time.perf_counter() - start
+    print(f"Recomputed suggestions for {updated} profiles in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
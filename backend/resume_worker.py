@@ -0,0 +1,13 @@
+"""
+Worker process for asynchronous resume uploads (POST /resume/upload?async=true).
+Run one or more alongside the web server:
+    venv\Scripts\python.exe resume_worker.py
+"""
+from app.main import create_app
+from app.services import resume_job_service
+
+app = create_app()
+
+if __name__ == "__main__":
+    with app.app_context():
+        resume_job_service.run_worker()